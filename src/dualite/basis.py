@@ -0,0 +1,76 @@
+from typing import Final
+
+import numpy as np
+
+from solution import Solution
+
+
+BASIC: Final[int] = 0
+AT_LOWER: Final[int] = 1
+AT_UPPER: Final[int] = 2
+
+
+class Basis:
+    """
+    Base exportable d'un programme linéaire sous forme standard [A | I].
+
+    Args:
+        basic: Indice de la colonne de base de chaque ligne (m).
+        status: Statut de chaque colonne (n+m) : BASIC, AT_LOWER ou AT_UPPER (hors base à sa borne supérieure).
+    """
+    basic: np.ndarray
+    status: np.ndarray
+
+    def __init__(self, basic, status) -> None:
+        self.basic = np.asarray(basic, dtype=np.int32)
+        self.status = np.asarray(status, dtype=np.int8)
+
+        if np.count_nonzero(self.status == BASIC) != len(self.basic) or np.any(self.status[self.basic] != BASIC):
+            raise ValueError("Les statuts ne correspondent pas aux colonnes de base")
+
+    @classmethod
+    def from_header(cls, basic, columns_count: int, at_upper=()) -> 'Basis':
+        """
+        Construit une base à partir de l'en-tête de base d'un moteur.
+
+        Args:
+            basic: Indice de la colonne de base de chaque ligne.
+            columns_count: Nombre total de colonnes (variables et écarts).
+            at_upper: Colonnes hors base à leur borne supérieure.
+        """
+        status = np.full(columns_count, AT_LOWER, dtype=np.int8)
+        status[np.asarray(at_upper, dtype=np.intp)] = AT_UPPER
+        status[np.asarray(basic)] = BASIC
+        return cls(basic, status)
+
+    @classmethod
+    def from_solution(cls, solution: Solution) -> 'Basis':
+        if solution.basis is None or solution.x is None:
+            raise ValueError("La solution ne contient pas de base")
+        at_upper = () if solution.at_upper is None else solution.at_upper
+        return cls.from_header(solution.basis, len(solution.x) + len(solution.basis), at_upper)
+
+    def add_rows(self, count: int) -> 'Basis':
+        """
+        Étend la base après l'ajout de contraintes (coupes) : les nouvelles variables d'écart sont en base.
+
+        Les colonnes d'écart étant placées après les variables de décision, les indices existants
+        ne changent pas.
+
+        Args:
+            count: Nombre de contraintes ajoutées en fin de matrice.
+
+        Returns:
+            Basis: Base du problème étendu, duale réalisable si la base d'origine était optimale.
+        """
+        columns_count = len(self.status)
+        basic = np.concatenate((self.basic, np.arange(columns_count, columns_count + count)))
+        status = np.concatenate((self.status, np.full(count, BASIC, dtype=np.int8)))
+        return Basis(basic, status)
+
+    def __len__(self) -> int:
+        return len(self.basic)
+
+    def __repr__(self) -> str:
+        return f"Basis(basic={self.basic.tolist()})"
+
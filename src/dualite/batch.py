@@ -0,0 +1,154 @@
+from typing import Final
+
+import numpy as np
+from scipy import sparse
+
+from solution import OPTIMAL, UNBOUNDED, BatchSolution
+
+
+TOLERANCE: Final[float] = 1e-9
+REFACTORIZATION_FREQUENCY: Final[int] = 50
+
+
+def _stack(vector, batch_size: int, length: int) -> np.ndarray:
+    vector = np.asarray(vector, dtype=float)
+    if vector.ndim not in (1, 2) or vector.shape[-1] != length:
+        raise ValueError(f"Dimensions incompatibles : {vector.shape} pour des vecteurs de taille {length}")
+    # Un vecteur, ou un lot d'une seule instance, est commun à toutes les instances
+    return np.array(np.broadcast_to(vector, (batch_size, length)), dtype=float)
+
+
+def _columns(A, indices: np.ndarray) -> np.ndarray:
+    """Colonnes de [A | I] demandées, une ligne par instance (k x m)."""
+    constraints_count, variables_count = A.shape
+    columns = np.zeros((len(indices), constraints_count))
+
+    structural = indices < variables_count
+    if sparse.issparse(A):
+        columns[structural] = A[:, indices[structural]].T.toarray()
+    else:
+        columns[structural] = A[:, indices[structural]].T
+    slacks = np.flatnonzero(~structural)
+    columns[slacks, indices[slacks] - variables_count] = 1.0
+    return columns
+
+
+def solve_batch(A, b, c, refactorization_frequency: int = REFACTORIZATION_FREQUENCY) -> BatchSolution:
+    """
+    Résout un lot de programmes linéaires max c x, A x <= b, x >= 0 partageant la même matrice A.
+
+    Toutes les instances avancent ensemble : chaque itération est une suite d'opérations
+    vectorisées le long de l'axe du lot. Seule l'inverse de la base (k x m x m) est propre
+    à chaque instance ; la matrice A est partagée et n'est jamais recopiée.
+
+    Args:
+        A: Matrice des contraintes commune (m x n, dense ou creuse).
+        b: Second membre, vecteur (m) commun ou lot (k x m ou 1 x m), positif ou nul.
+        c: Objectif, vecteur (n) commun ou lot (k x n ou 1 x n).
+        refactorization_frequency: Nombre de pivots entre deux réinversions des bases.
+
+    Returns:
+        BatchSolution: Solutions, valeurs objectif, statuts et pivots de chaque instance.
+    """
+    if not sparse.issparse(A):
+        A = np.asarray(A, dtype=float)
+    constraints_count, variables_count = A.shape
+
+    b, c = np.asarray(b, dtype=float), np.asarray(c, dtype=float)
+    sizes = {vector.shape[0] for vector in (b, c) if vector.ndim == 2} - {1}
+    if len(sizes) > 1:
+        raise ValueError(f"Tailles de lot incompatibles : b {b.shape}, c {c.shape}")
+    batch_size = max(sizes, default=1)
+    B = _stack(b, batch_size, constraints_count)
+    C = _stack(c, batch_size, variables_count)
+    if np.any(B < 0):
+        raise ValueError("La résolution par lot nécessite une base initiale réalisable (b >= 0)")
+
+    # Toutes les instances partent de la base des variables d'écart : B^-1 = I
+    costs = np.hstack((C, np.zeros((batch_size, constraints_count))))
+    basis = np.tile(np.arange(variables_count, variables_count + constraints_count), (batch_size, 1))
+    inverse = np.tile(np.eye(constraints_count), (batch_size, 1, 1))
+    x_basis = B.copy()
+
+    status = np.full(batch_size, OPTIMAL, dtype=object)
+    iterations = np.zeros(batch_size, dtype=np.intp)
+    active = np.ones(batch_size, dtype=bool)
+    since_refactorization = 0
+
+    while active.any():
+        idx = np.flatnonzero(active)
+
+        # Pricing : y = c_B B^-1 puis coûts réduits de toutes les colonnes
+        y = np.einsum('km,kmj->kj', np.take_along_axis(costs[idx], basis[idx], axis=1), inverse[idx])
+        reduced = costs[idx] - np.hstack((np.asarray((A.T @ y.T).T), y))
+        np.put_along_axis(reduced, basis[idx], 0.0, axis=1)
+        entering = np.argmax(reduced, axis=1)
+        improving = reduced[np.arange(len(idx)), entering] > TOLERANCE
+
+        active[idx[~improving]] = False
+        idx, entering = idx[improving], entering[improving]
+        if len(idx) == 0:
+            break
+
+        # Test du ratio vectorisé sur les directions d = B^-1 a_q
+        direction = np.einsum('kij,kj->ki', inverse[idx], _columns(A, entering))
+        positive = direction > TOLERANCE
+        ratios = np.full(direction.shape, np.inf)
+        np.divide(x_basis[idx], direction, out=ratios, where=positive)
+
+        bounded = positive.any(axis=1)
+        status[idx[~bounded]] = UNBOUNDED
+        active[idx[~bounded]] = False
+        idx, entering, direction, ratios = idx[bounded], entering[bounded], direction[bounded], ratios[bounded]
+        if len(idx) == 0:
+            break
+        leaving = np.argmin(ratios, axis=1)
+        rows = np.arange(len(idx))
+
+        # Pivot de toutes les instances restantes par mises à jour de rang 1 empilées
+        pivot_values = direction[rows, leaving]
+        step = x_basis[idx, leaving] / pivot_values
+        x_basis[idx] -= step[:, None] * direction
+        x_basis[idx, leaving] = step
+
+        pivot_rows = inverse[idx, leaving, :] / pivot_values[:, None]
+        inverse[idx] -= direction[:, :, None] * pivot_rows[:, None, :]
+        inverse[idx, leaving, :] = pivot_rows
+
+        basis[idx, leaving] = entering
+        iterations[idx] += 1
+        since_refactorization += 1
+
+        if since_refactorization >= refactorization_frequency:
+            matrices = _columns(A, basis.ravel()).reshape(batch_size, constraints_count, constraints_count)
+            inverse = np.linalg.inv(matrices.transpose(0, 2, 1))
+            x_basis = np.einsum('kij,kj->ki', inverse, B)
+            since_refactorization = 0
+
+    x = np.zeros((batch_size, variables_count))
+    structural = basis < variables_count
+    instances, positions = np.nonzero(structural)
+    x[instances, basis[instances, positions]] = x_basis[instances, positions]
+    z = np.einsum('kn,kn->k', C, x)
+
+    unbounded = status != OPTIMAL
+    x[unbounded] = np.nan
+    z[unbounded] = np.nan
+    return BatchSolution(status, x, z, iterations)
+
+
+if __name__ == '__main__':
+    # Exemple d'utilisation : trois scénarios de second membre et deux courbes de prix
+    A = [[1, 1], [2, 1]]
+    b = [[4, 6], [5, 6], [4, 10]]
+    c = [3, 2]
+
+    solutions = solve_batch(A, b, c)
+
+    print("Solutions optimales :\n", solutions.x)
+    print("Valeurs optimales de la fonction objectif :", solutions.z)
+
+    solutions = solve_batch(A, [4, 6], [[3, 2], [1, 4]])
+
+    print("Solutions optimales :\n", solutions.x)
+    print("Valeurs optimales de la fonction objectif :", solutions.z)
@@ -0,0 +1,319 @@
+import argparse
+import functools
+import importlib.util
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Final, Optional
+
+import numpy as np
+from scipy import sparse
+
+from instrumentation import TimingProfile
+from simplexe_primal import SOLVERS, get_shape, simplexe_primal
+from solution import INFEASIBLE, OPTIMAL, UNBOUNDED
+
+
+BENCHMARK_SEED: Final[int] = 0
+BENCHMARK_REPEAT: Final[int] = 3
+REGRESSION_THRESHOLD: Final[float] = 1.2
+# Moteurs dont le compteur d'itérations n'est pas un nombre de pivots (méthode de points intérieurs)
+ITERATIVE_ENGINES: Final[frozenset[str]] = frozenset({"interior"})
+
+# Script du simplexe en deux phases, dans le répertoire parent (nom non importable directement)
+TWO_PHASE_PATH: Final[str] = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                          "two-phase-simplex.py")
+
+
+def dense_problem(rng: np.random.Generator, constraints_count: int = 60, variables_count: int = 120) -> tuple:
+    """Matrice dense à coefficients positifs : problème borné, réalisable à l'origine."""
+    A = rng.uniform(0, 1, (constraints_count, variables_count))
+    return A, rng.uniform(1, 10, constraints_count), rng.uniform(0, 1, variables_count)
+
+
+def sparse_problem(rng: np.random.Generator, constraints_count: int = 150, variables_count: int = 300,
+                   density: float = 0.03) -> tuple:
+    """
+    Matrice creuse (CSR) à coefficients positifs ; chaque colonne reçoit un coefficient dans une
+    ligne tirée au hasard, ce qui borne le problème sans ligne dense qui le rendrait trivial.
+    """
+    A = sparse.random(constraints_count, variables_count, density=density, format="coo", random_state=rng)
+    rows = np.concatenate((A.row, rng.integers(0, constraints_count, variables_count)))
+    columns = np.concatenate((A.col, np.arange(variables_count)))
+    data = np.concatenate((A.data, rng.uniform(0.5, 1, variables_count)))
+    A = sparse.csr_matrix((data, (rows, columns)), shape=(constraints_count, variables_count))
+    return A, rng.uniform(1, 10, constraints_count), rng.uniform(0, 1, variables_count)
+
+
+def degenerate_problem(rng: np.random.Generator, constraints_count: int = 40, variables_count: int = 60) -> tuple:
+    """Seconds membres majoritairement nuls : nombreux pivots dégénérés."""
+    A = rng.integers(-3, 5, (constraints_count, variables_count)).astype(float)
+    b = np.where(rng.random(constraints_count) < 0.8, 0.0, 5.0)
+    A[-1], b[-1] = 1.0, 10.0
+    return A, b, rng.integers(-2, 4, variables_count).astype(float)
+
+
+def transportation_problem(rng: np.random.Generator, sources: int = 10, destinations: int = 12) -> tuple:
+    """
+    Transport à profit maximal : x_ij expédié de la source i vers la destination j,
+    offres sum_j x_ij <= s_i et demandes sum_i x_ij <= d_j.
+    """
+    supplies_rows = np.kron(np.eye(sources), np.ones(destinations))
+    demands_rows = np.kron(np.ones(sources), np.eye(destinations))
+    A = np.vstack([supplies_rows, demands_rows])
+    b = np.concatenate([rng.integers(10, 50, sources), rng.integers(5, 40, destinations)]).astype(float)
+    return A, b, rng.integers(1, 20, sources * destinations).astype(float)
+
+
+def wide_problem(rng: np.random.Generator, constraints_count: int = 20, variables_count: int = 400) -> tuple:
+    """Beaucoup plus de variables que de contraintes (n >> m)."""
+    return dense_problem(rng, constraints_count, variables_count)
+
+
+GENERATORS: Final[dict[str, Callable[..., tuple]]] = {
+    "dense": dense_problem,
+    "sparse": sparse_problem,
+    "degenerate": degenerate_problem,
+    "transportation": transportation_problem,
+    "wide": wide_problem,
+}
+
+
+def generate(family: str, seed: int = BENCHMARK_SEED) -> tuple:
+    """
+    Construit l'instance d'une famille : la même graine donne toujours le même problème.
+
+    Args:
+        family: Nom de la famille (voir GENERATORS).
+        seed: Graine du générateur.
+
+    Returns:
+        tuple: (A, b, c) du problème max c x, A x <= b, x >= 0.
+    """
+    if family not in GENERATORS:
+        raise ValueError(f"Famille d'instances inconnue : {family}")
+    return GENERATORS[family](np.random.default_rng(seed))
+
+
+def _dense_lists(A) -> list:
+    return (A.toarray() if sparse.issparse(A) else np.asarray(A)).tolist()
+
+
+@functools.cache
+def _load_two_phase():
+    # Le script importe ses voisins du répertoire parent
+    directory = os.path.dirname(TWO_PHASE_PATH)
+    if directory not in sys.path:
+        sys.path.append(directory)
+    specification = importlib.util.spec_from_file_location("two_phase_simplex", TWO_PHASE_PATH)
+    module = importlib.util.module_from_spec(specification)
+    specification.loader.exec_module(module)
+    return module
+
+
+def _run_primal(backend: str) -> Callable[..., tuple]:
+    def run(A, b, c) -> tuple:
+        if backend == "list":
+            A, b, c = _dense_lists(A), list(b), list(c)
+        # Les pivots sont comptés par l'observateur : simplexe_primal ne retourne que (x, z, tableau)
+        profile = TimingProfile()
+        result = simplexe_primal(A, b, c, backend=backend, observer=profile)
+        if result is None:
+            return UNBOUNDED, None, profile.iterations
+        return OPTIMAL, float(result[1]), profile.iterations
+    return run
+
+
+def _run_two_phase(A, b, c) -> tuple:
+    module = _load_two_phase()
+    constraints_count, variables_count = get_shape(A)
+    nonbasic_vars = [f"x{j + 1}" for j in range(variables_count)]
+    basic_vars = [f"s{i + 1}" for i in range(constraints_count)]
+
+    # Le script minimise : max c x devient min -c x
+    values, final_dict, report = module.two_phase_simplex([-value for value in c], [], _dense_lists(A), list(b),
+                                                          basic_vars, nonbasic_vars)
+    pivots = sum(phase["pivots"] for phase in report.values())
+    if values is None:
+        return (INFEASIBLE if "phase 2" not in report else UNBOUNDED), None, pivots
+    return OPTIMAL, float(np.dot(c, [values[var] for var in nonbasic_vars])), pivots
+
+
+def _run_solver(name: str) -> Callable[..., tuple]:
+    def run(A, b, c) -> tuple:
+        solution = SOLVERS[name](A, b, c)
+        return solution.status, solution.z, solution.iterations
+    return run
+
+
+ENGINES: Final[dict[str, Callable[..., tuple]]] = {
+    "simplexe_primal": _run_primal("list"),
+    "simplexe_primal_numpy": _run_primal("numpy"),
+    "two_phase": _run_two_phase,
+    **{name: _run_solver(name) for name in SOLVERS},
+}
+
+
+def measure(engine: str, A, b, c, repeat: int = BENCHMARK_REPEAT) -> dict:
+    """
+    Mesure un moteur sur une instance : meilleur temps sur repeat exécutions, puis une
+    exécution supplémentaire sous tracemalloc pour le pic mémoire (qui fausserait les temps).
+
+    Args:
+        engine: Nom du moteur (voir ENGINES).
+        A: Matrice des contraintes.
+        b: Second membre des contraintes.
+        c: Coefficients de la fonction objectif à maximiser.
+        repeat: Nombre d'exécutions chronométrées.
+
+    Returns:
+        dict: status, z, pivots, time, pivots_per_second,
+              peak_memory (octets), ou error si le moteur a levé une exception. Pour les moteurs
+              de ITERATIVE_ENGINES, pivots et pivots_per_second sont None et le compteur est
+              enregistré sous iterations.
+    """
+    run = ENGINES[engine]
+    try:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            status, z, pivots = run(A, b, c)
+            timings.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        try:
+            run(A, b, c)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    except (ValueError, np.linalg.LinAlgError) as error:
+        return {"status": "error", "error": str(error)}
+
+    elapsed = min(timings)
+    record = {"status": status, "z": z}
+    if engine in ITERATIVE_ENGINES:
+        record["iterations"], pivots = pivots, None
+    record.update({
+        "pivots": pivots,
+        "time": elapsed,
+        "pivots_per_second": pivots / elapsed if pivots is not None and elapsed > 0 else None,
+        "peak_memory": peak,
+    })
+    return record
+
+
+def run_benchmark(families=tuple(GENERATORS), engines=tuple(ENGINES), seed: int = BENCHMARK_SEED,
+                  repeat: int = BENCHMARK_REPEAT, output: Optional[str] = None) -> dict:
+    """
+    Exécute chaque moteur sur chaque famille d'instances et enregistre les mesures.
+
+    Args:
+        families: Familles d'instances (voir GENERATORS).
+        engines: Moteurs à mesurer (voir ENGINES).
+        seed: Graine des générateurs.
+        repeat: Nombre d'exécutions chronométrées par mesure.
+        output: Fichier JSON où écrire les résultats, optionnel.
+
+    Returns:
+        dict: Environnement d'exécution et une entrée par couple (famille, moteur).
+    """
+    for engine in engines:
+        if engine not in ENGINES:
+            raise ValueError(f"Moteur inconnu : {engine}")
+
+    results = {
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "seed": seed,
+            "repeat": repeat,
+        },
+        "records": [],
+    }
+    for family in families:
+        A, b, c = generate(family, seed)
+        shape = get_shape(A)
+        for engine in engines:
+            record = {"family": family, "engine": engine, "shape": list(shape)}
+            record.update(measure(engine, A, b, c, repeat))
+            results["records"].append(record)
+
+    if output is not None:
+        with open(output, "w") as file:
+            json.dump(results, file, indent=2)
+    return results
+
+
+def compare_results(baseline: dict, current: dict, threshold: float = REGRESSION_THRESHOLD) -> list[str]:
+    """
+    Compare deux campagnes de mesures et signale les régressions.
+
+    Une régression est un temps multiplié par plus de threshold, un nombre de pivots (ou
+    d'itérations, voir ITERATIVE_ENGINES) en hausse, un statut différent ou un optimum différent.
+
+    Args:
+        baseline: Résultats de référence (voir run_benchmark).
+        current: Résultats à comparer.
+        threshold: Rapport de temps toléré.
+
+    Returns:
+        list[str]: Description de chaque régression.
+    """
+    reference = {(record["family"], record["engine"]): record for record in baseline["records"]}
+    regressions = []
+    for record in current["records"]:
+        key = (record["family"], record["engine"])
+        if key not in reference:
+            continue
+        previous = reference[key]
+        label = f"{key[0]} / {key[1]}"
+
+        if record["status"] != previous["status"]:
+            regressions.append(f"{label} : statut {previous['status']} -> {record['status']}")
+            continue
+        if record["status"] == "error":
+            continue
+        if record["z"] is not None and previous["z"] is not None and not np.isclose(record["z"], previous["z"]):
+            regressions.append(f"{label} : optimum {previous['z']} -> {record['z']}")
+        for counter in ("pivots", "iterations"):
+            if record.get(counter) is not None and previous.get(counter) is not None \
+                    and record[counter] > previous[counter]:
+                regressions.append(f"{label} : {counter} {previous[counter]} -> {record[counter]}")
+        if record["time"] > threshold * previous["time"]:
+            regressions.append(f"{label} : temps {previous['time']:.4f} s -> {record['time']:.4f} s")
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Banc d'essai des moteurs du simplexe")
+    parser.add_argument("--families", nargs="+", default=list(GENERATORS), choices=list(GENERATORS))
+    parser.add_argument("--engines", nargs="+", default=list(ENGINES), choices=list(ENGINES))
+    parser.add_argument("--seed", type=int, default=BENCHMARK_SEED)
+    parser.add_argument("--repeat", type=int, default=BENCHMARK_REPEAT)
+    parser.add_argument("--output", default="benchmark.json", help="fichier JSON des résultats")
+    parser.add_argument("--baseline", help="résultats d'une version précédente à comparer")
+    arguments = parser.parse_args()
+
+    results = run_benchmark(arguments.families, arguments.engines, arguments.seed, arguments.repeat, arguments.output)
+
+    for record in results["records"]:
+        if record["status"] == "error":
+            print(f"{record['family']:>14} {record['engine']:>22} : erreur ({record['error']})")
+            continue
+        if record.get("iterations") is not None:
+            count = f"{record['iterations']:>5} itérations"
+        else:
+            count = f"{'-' if record['pivots'] is None else record['pivots']!s:>5} pivots"
+        print(f"{record['family']:>14} {record['engine']:>22} : {record['status']:>10}, {count}, "
+              f"{record['time'] * 1e3:9.2f} ms, {record['peak_memory'] / 1024:9.1f} Kio")
+
+    if arguments.baseline is not None:
+        with open(arguments.baseline) as file:
+            regressions = compare_results(json.load(file), results)
+        print(f"\n{len(regressions)} régression(s)")
+        for regression in regressions:
+            print(f"  {regression}")
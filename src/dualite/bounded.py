@@ -0,0 +1,239 @@
+import time
+from typing import Final, Optional
+
+import numpy as np
+from scipy import sparse
+
+from basis import AT_UPPER, Basis
+from instrumentation import IterationEvent, SolveObserver, make_observer
+from perturbation import DegeneracyMonitor
+from ratio_test import PIVOT_TOLERANCE, PRIMAL_TOLERANCE, bounded_ratio_test
+from solution import OPTIMAL, UNBOUNDED, Solution
+from tableau import create_initial_tableau, create_tableau_from_basis, pivot
+
+
+TOLERANCE: Final[float] = 1e-9
+
+
+def normalize_bounds(variables_count: int, lower=None, upper=None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vérifie les bornes des variables et complète les valeurs par défaut (0 et +inf).
+
+    Args:
+        variables_count: Nombre de variables de décision.
+        lower: Bornes inférieures (finies), ou None.
+        upper: Bornes supérieures (np.inf si aucune), ou None.
+
+    Returns:
+        tuple: (lower, upper) sous forme de tableaux numpy.
+    """
+    lower = np.zeros(variables_count) if lower is None else np.asarray(lower, dtype=float)
+    upper = np.full(variables_count, np.inf) if upper is None else np.asarray(upper, dtype=float)
+    if lower.shape != (variables_count,) or upper.shape != (variables_count,):
+        raise ValueError("Les bornes doivent avoir une valeur par variable")
+    if not np.all(np.isfinite(lower)):
+        raise ValueError("Les variables libres (borne inférieure infinie) ne sont pas supportées")
+    if np.any(upper < lower):
+        raise ValueError("Une borne supérieure est inférieure à la borne inférieure correspondante")
+    return lower, upper
+
+
+class BoundedSimplex:
+    """
+    Simplexe primal à variables bornées sur le tableau numpy : max c x, A x <= b, l <= x <= u.
+
+    Les bornes ne deviennent pas des contraintes : le problème est translaté (x = l + x',
+    0 <= x' <= u - l) et une variable hors base est à sa borne inférieure ou supérieure. Le
+    tableau garde la taille (m+1) x (n+m+1) de celui de TableauSimplex ; les valeurs des
+    variables de base sont suivies à part, car elles dépendent des variables hors base
+    placées à leur borne supérieure.
+
+    Args:
+        A: Matrice des contraintes (m x n, dense ou creuse).
+        b: Second membre des contraintes (m).
+        c: Coefficients de la fonction objectif à maximiser (n).
+        lower: Bornes inférieures des variables.
+        upper: Bornes supérieures des variables.
+        basis: Base de départ optionnelle ; ignorée si elle n'est pas primale réalisable.
+    """
+    tableau: np.ndarray
+    basis: np.ndarray
+    at_upper: np.ndarray
+    values: np.ndarray
+    ranges: np.ndarray
+    variables_count: int
+    iterations: int
+    observer: Optional[SolveObserver]
+
+    def __init__(self, A, b, c, lower=None, upper=None, basis: Optional[Basis] = None) -> None:
+        self._c = np.asarray(c, dtype=float)
+        self.variables_count = len(self._c)
+        self._lower, upper = normalize_bounds(self.variables_count, lower, upper)
+        if not sparse.issparse(A):
+            A = np.asarray(A, dtype=float)
+
+        b = np.asarray(b, dtype=float) - A @ self._lower
+        constraints_count = len(b)
+        # Écart entre les bornes de chaque colonne ; les variables d'écart ne sont pas bornées
+        self.ranges = np.concatenate((upper - self._lower, np.full(constraints_count, np.inf)))
+        self.iterations = 0
+        self.observer = None
+
+        if basis is not None:
+            self.tableau = create_tableau_from_basis(A, b, self._c, basis)
+            self.basis = basis.basic.astype(np.intp)
+            self.at_upper = basis.status == AT_UPPER
+            self._compute_values()
+            if self.is_primal_feasible():
+                return
+
+        if np.any(b < -TOLERANCE):
+            raise ValueError("Le simplexe à variables bornées nécessite une base initiale réalisable (b - A l >= 0)")
+        self.tableau = create_initial_tableau(A, b, self._c)
+        self.basis = np.arange(self.variables_count, self.variables_count + constraints_count)
+        self.at_upper = np.zeros(self.variables_count + constraints_count, dtype=bool)
+        self._compute_values()
+
+    def _compute_values(self) -> None:
+        # x_B = B^-1 b' - B^-1 N_U (u - l)_U
+        at_upper = np.flatnonzero(self.at_upper)
+        self.values = self.tableau[:-1, -1] - self.tableau[:-1, at_upper] @ self.ranges[at_upper]
+
+    def is_primal_feasible(self) -> bool:
+        return bool(np.all(self.values >= -TOLERANCE) and np.all(self.values <= self.ranges[self.basis] + TOLERANCE))
+
+    def get_pivot_column(self, bland: bool = False) -> Optional[int]:
+        """
+        Choisit la variable entrante : coût réduit favorable à la borne inférieure (à augmenter)
+        ou à la borne supérieure (à diminuer). Règle de Dantzig, ou plus petit indice si bland.
+        """
+        objective_row = self.tableau[-1, :-1]
+        scores = np.where(self.at_upper, objective_row, -objective_row)
+        scores[self.ranges <= TOLERANCE] = 0.0  # Variables fixées
+        candidates = np.flatnonzero(scores > TOLERANCE)
+        if candidates.size == 0:
+            return None
+        if bland:
+            return int(candidates[0])
+        return int(candidates[np.argmax(scores[candidates])])
+
+    def objective(self) -> float:
+        return self.solution()[1]
+
+    def _notify(self, entering: int, leaving: int, started: float, priced: float, tested: float) -> None:
+        updated = time.perf_counter()
+        self.observer.iteration(IterationEvent("primal", self.iterations, entering, leaving, self.objective(), 0.0,
+                                               priced - started, tested - priced, updated - tested))
+
+    def solve(self) -> bool:
+        """
+        Itère jusqu'à l'optimalité.
+
+        Chaque itération est soit un pivot, soit un changement de borne de la variable entrante
+        (compté dans iterations, sans modifier le tableau). Après une suite de pas nuls, les
+        variables entrante et sortante sont choisies par la règle de Bland pour éviter les cycles.
+
+        Returns:
+            bool: False si le problème est non borné, True sinon.
+        """
+        monitor = DegeneracyMonitor()
+        bland = False
+        observer = self.observer
+
+        while True:
+            if observer is not None:
+                started = time.perf_counter()
+            colonne_pivot = self.get_pivot_column(bland)
+            if colonne_pivot is None:
+                return True
+
+            if observer is not None:
+                priced = time.perf_counter()
+            # La variable entrante diminue depuis sa borne supérieure, ou augmente depuis sa borne inférieure
+            direction = -1.0 if self.at_upper[colonne_pivot] else 1.0
+            column = direction * self.tableau[:-1, colonne_pivot]
+            ligne_pivot, step, to_upper = bounded_ratio_test(column, self.values, self.ranges[self.basis],
+                                                             self.ranges[colonne_pivot], PRIMAL_TOLERANCE, PIVOT_TOLERANCE,
+                                                             self.basis if bland else None)
+            if np.isinf(step):
+                return False
+
+            if observer is not None:
+                tested = time.perf_counter()
+            bland = bland or monitor.record(step <= PRIMAL_TOLERANCE)
+            self.values -= step * column
+            self.iterations += 1
+
+            if ligne_pivot is None:
+                # Changement de borne : la base ne change pas
+                self.at_upper[colonne_pivot] = not self.at_upper[colonne_pivot]
+                leaving = colonne_pivot
+            else:
+                leaving = int(self.basis[ligne_pivot])
+                self.at_upper[leaving] = to_upper
+                self.values[ligne_pivot] = step if direction > 0 else self.ranges[colonne_pivot] - step
+                pivot(self.tableau, ligne_pivot, colonne_pivot)
+                self.basis[ligne_pivot] = colonne_pivot
+                self.at_upper[colonne_pivot] = False
+
+            if observer is not None:
+                self._notify(colonne_pivot, leaving, started, priced, tested)
+
+    def solution(self) -> tuple[np.ndarray, float]:
+        shifted = np.where(self.at_upper, self.ranges, 0.0)
+        shifted[self.basis] = self.values
+        x = self._lower + shifted[:self.variables_count]
+        return x, float(self._c @ x)
+
+    def duals(self) -> np.ndarray:
+        # Coûts réduits des variables d'écart : y = c_B B^-1, indépendants des variables à leur borne supérieure
+        return self.tableau[-1, self.variables_count:-1].copy()
+
+
+def solve_bounded(A, b, c,
+                  lower=None,
+                  upper=None,
+                  basis: Optional[Basis] = None,
+                  observer=None) -> Solution:
+    start = time.perf_counter()
+    observer = make_observer(observer)
+    if observer is not None:
+        observer.start("bounded", (len(b), len(c)))
+
+    engine = BoundedSimplex(A, b, c, lower, upper, basis)
+    engine.observer = observer
+
+    if not engine.solve():
+        solution = Solution(UNBOUNDED, iterations=engine.iterations, basis=engine.basis,
+                            elapsed=time.perf_counter() - start)
+    else:
+        x, z = engine.solution()
+        solution = Solution(OPTIMAL, x, z, engine.iterations, engine.basis, time.perf_counter() - start,
+                            engine.duals(), np.flatnonzero(engine.at_upper))
+
+    if observer is not None:
+        observer.finish(solution.status, solution.iterations)
+    return solution
+
+
+if __name__ == '__main__':
+    # Problème à variables bornées : les bornes en lignes doublent presque la taille du tableau
+    from tableau import solve_tableau
+
+    rng = np.random.default_rng(0)
+    A = rng.uniform(0, 1, (60, 200))
+    b = rng.uniform(5, 20, 60)
+    c = rng.uniform(0, 1, 200)
+    upper = rng.uniform(0.5, 2, 200)
+
+    solution = solve_bounded(A, b, c, upper=upper)
+    rows = solve_tableau(np.vstack((A, np.eye(200))), np.concatenate((b, upper)), c)
+
+    print(f"Bornes natives : z = {solution.z:.6f}, {solution.iterations} itérations, "
+          f"{solution.elapsed * 1e3:.1f} ms, tableau {A.shape[0] + 1} x {A.shape[0] + A.shape[1] + 1}")
+    print(f"Bornes en lignes : z = {rows.z:.6f}, {rows.iterations} pivots, "
+          f"{rows.elapsed * 1e3:.1f} ms, tableau {A.shape[0] + 201} x {A.shape[0] + 2 * A.shape[1] + 1}")
+
+    # Redémarrage à chaud : les variables à leur borne supérieure sont conservées dans la base
+    restarted = solve_bounded(A, b, c, upper=upper, basis=Basis.from_solution(solution))
+    print(f"Redémarrage : {restarted.iterations} itération(s), {len(solution.at_upper)} variable(s) à leur borne supérieure")
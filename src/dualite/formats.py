@@ -0,0 +1,482 @@
+import mmap
+import re
+from array import array
+from typing import Final, Iterator, Optional
+
+import numpy as np
+from scipy import sparse
+
+from simplexe_primal import LinearProgram
+
+
+OBJECTIVE_NAME: Final[str] = "obj"
+LP_TERMS_PER_LINE: Final[int] = 8
+
+# Champs du format MPS fixe (colonnes 2-3, 5-12, 15-22, 25-36, 40-47, 50-61)
+_FIXED_FIELDS: Final[tuple[slice, ...]] = (slice(1, 3), slice(4, 12), slice(14, 22), slice(24, 36), slice(39, 47), slice(49, 61))
+
+_LP_TOKEN = re.compile(r"(<=|>=|=<|=>|<|>|=)|([-+])|((?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)|([^\s:+\-*/<>=^\[\]]+):?")
+_LP_SECTIONS: Final[dict[str, str]] = {
+    "maximize": "maximize", "maximum": "maximize", "max": "maximize",
+    "minimize": "minimize", "minimum": "minimize", "min": "minimize",
+    "subject to": "constraints", "such that": "constraints", "st": "constraints", "s.t.": "constraints",
+    "bounds": "bounds", "bound": "bounds",
+    "general": "integers", "generals": "integers", "gen": "integers", "integer": "integers", "integers": "integers",
+    "binary": "binaries", "binaries": "binaries", "bin": "binaries",
+    "end": "end",
+}
+_LP_SENSE = re.compile(r"(<=|>=|=<|=>|<|>|=)")
+_LP_SENSES: Final[dict[str, str]] = {"<=": "L", "=<": "L", "<": "L", ">=": "G", "=>": "G", ">": "G", "=": "E"}
+
+
+def _lines(path: str) -> Iterator[str]:
+    # Le fichier est projeté en mémoire : seules les lignes en cours de lecture sont décodées
+    with open(path, "rb") as file:
+        try:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return  # Fichier vide
+        with mapping:
+            for line in iter(mapping.readline, b""):
+                yield line.decode("ascii", errors="replace").rstrip("\r\n")
+
+
+class _ModelBuilder:
+    """
+    Accumule un modèle général (lignes L, G, E, intervalles, bornes) dans des tableaux compacts,
+    puis le ramène à la forme max c x, A x <= b, l <= x <= u de LinearProgram.
+    """
+
+    def __init__(self) -> None:
+        self.rows: dict[str, int] = {}
+        self.senses: list[str] = []
+        self.columns: dict[str, int] = {}
+        self.objective_name: Optional[str] = None
+        self.free_rows: set[str] = set()
+        self.maximize = False
+        self.row_index = array("q")
+        self.column_index = array("q")
+        self.values = array("d")
+        self.objective_columns = array("q")
+        self.objective_values = array("d")
+        self.rhs: dict[int, float] = {}
+        self.ranges: dict[int, float] = {}
+        self.lower: dict[int, float] = {}
+        self.upper: dict[int, float] = {}
+
+    def add_row(self, name: str, sense: str) -> None:
+        if sense == "N":
+            if self.objective_name is None:
+                self.objective_name = name
+            else:
+                self.free_rows.add(name)
+            return
+        if sense not in ("L", "G", "E"):
+            raise ValueError(f"Type de ligne inconnu : {sense}")
+        self.rows[name] = len(self.senses)
+        self.senses.append(sense)
+
+    def column(self, name: str) -> int:
+        return self.columns.setdefault(name, len(self.columns))
+
+    def add_entry(self, row: str, column: int, value: float) -> None:
+        if row == self.objective_name:
+            self.objective_columns.append(column)
+            self.objective_values.append(value)
+        elif row in self.rows:
+            self.row_index.append(self.rows[row])
+            self.column_index.append(column)
+            self.values.append(value)
+        elif row not in self.free_rows:
+            raise ValueError(f"Ligne inconnue : {row}")
+
+    def set_rhs(self, row: str, value: float) -> None:
+        # Le second membre de l'objectif (constante) n'est pas représenté par LinearProgram
+        if row in self.rows:
+            self.rhs[self.rows[row]] = value
+
+    def set_range(self, row: str, value: float) -> None:
+        if row in self.rows:
+            self.ranges[self.rows[row]] = value
+
+    def set_bound(self, kind: str, column: str, value: float = 0.0) -> None:
+        j = self.column(column)
+        if kind == "UP":
+            self.upper[j] = value
+        elif kind == "LO":
+            self.lower[j] = value
+        elif kind == "FX":
+            self.lower[j] = self.upper[j] = value
+        elif kind == "BV":
+            self.lower[j], self.upper[j] = 0.0, 1.0
+        elif kind in ("FR", "MI"):
+            self.lower[j] = -np.inf
+        elif kind != "PL":
+            raise ValueError(f"Type de borne inconnu : {kind}")
+
+    def to_linear_program(self) -> LinearProgram:
+        rows_count, columns_count = len(self.senses), len(self.columns)
+        A = sparse.csr_matrix((np.frombuffer(self.values),
+                               (np.frombuffer(self.row_index, dtype=np.int64), np.frombuffer(self.column_index, dtype=np.int64))),
+                              shape=(rows_count, columns_count))
+        A.sum_duplicates()
+
+        c = np.zeros(columns_count)
+        np.add.at(c, np.frombuffer(self.objective_columns, dtype=np.int64), np.frombuffer(self.objective_values))
+        if not self.maximize:
+            c = -c
+
+        b = np.zeros(rows_count)
+        b[list(self.rhs)] = list(self.rhs.values())
+        ranges = np.full(rows_count, np.nan)
+        ranges[list(self.ranges)] = list(self.ranges.values())
+        senses = np.array(self.senses, dtype="U1")
+        ranged = ~np.isnan(ranges)
+
+        # Chaque ligne donne une borne supérieure (A_i x <= u_i) et/ou inférieure (-A_i x <= -l_i)
+        upper_rhs = np.where(senses == "G", b + np.abs(ranges), b)
+        lower_rhs = np.where(senses == "L", b - np.abs(ranges), b)
+        negative_range = (senses == "E") & ranged & (ranges < 0)
+        upper_rhs[(senses == "E") & ranged & ~negative_range] += ranges[(senses == "E") & ranged & ~negative_range]
+        lower_rhs[negative_range] += ranges[negative_range]
+        has_upper = (senses == "L") | (senses == "E") | ((senses == "G") & ranged)
+        has_lower = (senses == "G") | (senses == "E") | ((senses == "L") & ranged)
+
+        A = sparse.vstack([A[has_upper], -A[has_lower]], format="csr")
+        b = np.concatenate([upper_rhs[has_upper], -lower_rhs[has_lower]])
+        if not self.lower and not self.upper:
+            return LinearProgram(A, b, c)
+
+        # Bornes des variables : conservées comme bornes natives, sans ajouter de contraintes
+        lower = np.zeros(columns_count)
+        upper = np.full(columns_count, np.inf)
+        lower[list(self.lower)] = list(self.lower.values())
+        upper[list(self.upper)] = list(self.upper.values())
+        return LinearProgram(A, b, c, lower, upper)
+
+
+def read_mps(path: str, fixed: bool = False) -> LinearProgram:
+    """
+    Lit un fichier MPS (libre ou fixe) en un seul passage.
+
+    Les sections ROWS, COLUMNS, RHS, RANGES, BOUNDS et OBJSENSE sont reconnues ; les marqueurs
+    d'intégrité sont ignorés. Le modèle est ramené à la forme max c x, A x <= b, l <= x <= u : les
+    lignes G sont changées de signe, les lignes E et les intervalles donnent deux lignes et les
+    bornes des variables restent des bornes natives (les variables libres ne sont pas supportées).
+
+    Args:
+        path: Chemin du fichier.
+        fixed: Format fixe (champs repérés par leur colonne, noms pouvant contenir des espaces).
+
+    Returns:
+        LinearProgram: Programme linéaire à matrice creuse (CSR).
+    """
+    builder = _ModelBuilder()
+    section = None
+
+    for line in _lines(path):
+        if not line or line[0] == "*":
+            continue
+
+        if not line[0].isspace():
+            fields = line.split()
+            section = fields[0].upper()
+            if section == "OBJSENSE" and len(fields) > 1:
+                builder.maximize = fields[1].upper() in ("MAX", "MAXIMIZE")
+            elif section not in ("NAME", "OBJSENSE", "ROWS", "COLUMNS", "RHS", "RANGES", "BOUNDS", "ENDATA"):
+                raise ValueError(f"Section MPS inconnue : {section}")
+            if section == "ENDATA":
+                break
+            continue
+
+        if fixed:
+            fields = [line[field].strip() for field in _FIXED_FIELDS]
+            while fields and not fields[-1]:
+                fields.pop()
+            if fields and not fields[0] and section != "BOUNDS":
+                fields = fields[1:]
+        else:
+            fields = line.split()
+
+        if section == "COLUMNS":
+            if "'MARKER'" in fields:
+                continue
+            column = builder.column(fields[0])
+            for k in range(1, len(fields) - 1, 2):
+                builder.add_entry(fields[k], column, float(fields[k + 1]))
+        elif section == "ROWS":
+            builder.add_row(fields[1], fields[0].upper())
+        elif section in ("RHS", "RANGES"):
+            # Le nom du jeu de données est facultatif en format libre
+            setter = builder.set_rhs if section == "RHS" else builder.set_range
+            for k in range(len(fields) % 2, len(fields) - 1, 2):
+                setter(fields[k], float(fields[k + 1]))
+        elif section == "BOUNDS":
+            kind = fields[0].upper()
+            if fixed:
+                column, value = fields[2], fields[3] if len(fields) > 3 else None
+            elif kind in ("FR", "MI", "PL", "BV"):
+                column, value = fields[-1] if len(fields) <= 3 else fields[2], None
+            else:
+                column, value = fields[-2], fields[-1]
+            builder.set_bound(kind, column, 0.0 if value is None else float(value))
+        elif section == "OBJSENSE":
+            builder.maximize = fields[0].upper() in ("MAX", "MAXIMIZE")
+
+    return builder.to_linear_program()
+
+
+def write_mps(lp: LinearProgram, path: str, name: str = "LP") -> None:
+    """
+    Écrit un programme linéaire au format MPS libre, colonne par colonne, sans construire le texte en mémoire.
+
+    Les contraintes sont nommées c1, c2, ... et les variables x1, x2, ... ; une variable sans
+    coefficient reçoit une entrée nulle dans l'objectif pour être conservée à la relecture.
+    Les bornes natives sont écrites dans la section BOUNDS.
+
+    Args:
+        lp: Programme linéaire max c x, A x <= b, l <= x <= u.
+        path: Chemin du fichier.
+        name: Nom du modèle.
+    """
+    A, b, c = lp.to_arrays()
+    A = sparse.csc_matrix(A)
+    rows_count, columns_count = A.shape
+    c = c.tolist()
+
+    with open(path, "w") as file:
+        file.write(f"NAME {name}\nOBJSENSE\n    MAX\nROWS\n N  {OBJECTIVE_NAME}\n")
+        file.writelines(f" L  c{i + 1}\n" for i in range(rows_count))
+
+        file.write("COLUMNS\n")
+        for j in range(columns_count):
+            start, end = A.indptr[j], A.indptr[j + 1]
+            if c[j] != 0 or start == end:
+                file.write(f"    x{j + 1} {OBJECTIVE_NAME} {c[j]!r}\n")
+            file.writelines(f"    x{j + 1} c{i + 1} {value!r}\n"
+                            for i, value in zip(A.indices[start:end].tolist(), A.data[start:end].tolist()))
+
+        file.write("RHS\n")
+        file.writelines(f"    RHS c{i + 1} {value!r}\n" for i, value in zip(np.flatnonzero(b).tolist(), b[b != 0].tolist()))
+
+        if lp.has_bounds():
+            lower, upper = (bound.tolist() for bound in lp.bounds())
+            file.write("BOUNDS\n")
+            for j in range(columns_count):
+                if lower[j] == upper[j]:
+                    file.write(f" FX BND x{j + 1} {lower[j]!r}\n")
+                    continue
+                if lower[j] != 0:
+                    file.write(f" LO BND x{j + 1} {lower[j]!r}\n")
+                if upper[j] != np.inf:
+                    file.write(f" UP BND x{j + 1} {upper[j]!r}\n")
+        file.write("ENDATA\n")
+
+
+def _lp_terms(tokens: list[tuple[str, str, str, str]], builder: _ModelBuilder) -> tuple[list[tuple[int, float]], Optional[str], float]:
+    # Expression linéaire, éventuellement suivie d'un sens et d'un second membre. Un nombre qui
+    # n'est pas suivi d'une variable est une constante du membre de gauche, reportée au second membre
+    terms, sense, rhs, constant = [], None, 0.0, 0.0
+    sign, coefficient = 1.0, None
+    for operator, term_sign, number, name in tokens:
+        if coefficient is not None and not name:
+            if number:
+                raise ValueError(f"Deux nombres consécutifs dans l'expression : {coefficient!r} {number}")
+            constant += sign * coefficient
+            sign, coefficient = 1.0, None
+        if operator:
+            sense = _LP_SENSES[operator]
+            sign, coefficient = 1.0, None
+        elif term_sign:
+            sign = -1.0 if term_sign == "-" else 1.0
+        elif number:
+            if sense is not None:
+                rhs = sign * float(number)
+            else:
+                coefficient = float(number)
+        elif name:
+            terms.append((builder.column(name), sign * (1.0 if coefficient is None else coefficient)))
+            sign, coefficient = 1.0, None
+    if coefficient is not None:
+        constant += sign * coefficient
+    return terms, sense, rhs - constant
+
+
+def read_lp(path: str) -> LinearProgram:
+    """
+    Lit un fichier au format CPLEX-LP en un seul passage.
+
+    Les sections Maximize/Minimize, Subject To, Bounds, General/Binary et End sont reconnues ;
+    une instruction peut s'étendre sur plusieurs lignes. Le modèle est ramené à la forme de
+    LinearProgram comme pour read_mps.
+
+    Args:
+        path: Chemin du fichier.
+
+    Returns:
+        LinearProgram: Programme linéaire à matrice creuse (CSR).
+    """
+    builder = _ModelBuilder()
+    builder.add_row(OBJECTIVE_NAME, "N")
+    section = None
+    statement: list[tuple[str, str, str, str]] = []
+    label: Optional[str] = None
+    has_sense = False
+
+    def flush() -> None:
+        nonlocal label, has_sense
+        if not statement:
+            return
+        terms, sense, rhs = _lp_terms(statement, builder)
+        if section in ("maximize", "minimize"):
+            if rhs != 0.0:
+                raise ValueError("Les constantes de la fonction objectif ne sont pas supportées")
+            for column, value in terms:
+                builder.add_entry(OBJECTIVE_NAME, column, value)
+        elif section == "constraints":
+            if sense is None:
+                raise ValueError(f"Contrainte sans sens : {label}")
+            row = label if label is not None else f"R{len(builder.senses) + 1}"
+            builder.add_row(row, sense)
+            for column, value in terms:
+                builder.add_entry(row, column, value)
+            builder.set_rhs(row, rhs)
+        statement.clear()
+        label, has_sense = None, False
+
+    for line in _lines(path):
+        line = line.split("\\", 1)[0].strip()
+        if not line:
+            continue
+
+        keyword = " ".join(line.lower().split())
+        if keyword in _LP_SECTIONS:
+            flush()
+            section = _LP_SECTIONS[keyword]
+            builder.maximize |= section == "maximize"
+            if section == "end":
+                break
+            continue
+
+        if section == "bounds":
+            _lp_bound(line, builder)
+        elif section == "binaries":
+            for name in line.split():
+                builder.set_bound("BV", name)
+        elif section in ("maximize", "minimize", "constraints"):
+            for match in _LP_TOKEN.finditer(line):
+                token = match.groups()
+                if token[3] and match.group().endswith(":"):
+                    flush()
+                    label = token[3]
+                    continue
+                # Une contrainte est complète dès que son second membre est lu
+                statement.append(token)
+                has_sense |= bool(token[0])
+                if token[2] and has_sense and section == "constraints":
+                    flush()
+    flush()
+
+    return builder.to_linear_program()
+
+
+def _lp_bound(line: str, builder: _ModelBuilder) -> None:
+    fields = _LP_SENSE.sub(r" \1 ", line).split()
+    if len(fields) == 2 and fields[1].lower() == "free":
+        builder.set_bound("FR", fields[0])
+        return
+
+    def value(text: str) -> Optional[float]:
+        try:
+            return float(text.lower().replace("infinity", "inf"))
+        except ValueError:
+            return None
+
+    senses = [_LP_SENSES.get(field) for field in fields[1::2]]
+    if len(fields) == 5 and senses[0] == senses[1] and senses[0] in ("L", "G"):
+        # l <= x <= u, ou u >= x >= l
+        lower, upper = (fields[0], fields[4]) if senses[0] == "L" else (fields[4], fields[0])
+        if value(lower) is None or value(upper) is None:
+            raise ValueError(f"Borne invalide : {line}")
+        builder.set_bound("LO", fields[2], value(lower))
+        builder.set_bound("UP", fields[2], value(upper))
+    elif len(fields) == 3 and senses[0] is not None:
+        name, kind, bound = fields[0], {"L": "UP", "G": "LO", "E": "FX"}[senses[0]], fields[2]
+        if value(name) is not None and value(bound) is None:
+            # Valeur en premier : "-1 <= x1" équivaut à "x1 >= -1"
+            name, bound = bound, name
+            kind = {"UP": "LO", "LO": "UP"}.get(kind, kind)
+        if value(bound) is None:
+            raise ValueError(f"Borne invalide : {line}")
+        if np.isinf(value(bound)) and kind == "UP":
+            return
+        builder.set_bound(kind, name, value(bound))
+    else:
+        raise ValueError(f"Borne invalide : {line}")
+
+
+def write_lp(lp: LinearProgram, path: str) -> None:
+    """
+    Écrit un programme linéaire au format CPLEX-LP, ligne par ligne.
+
+    Args:
+        lp: Programme linéaire max c x, A x <= b, l <= x <= u ; les bornes natives sont écrites dans la section Bounds.
+        path: Chemin du fichier.
+    """
+    A, b, c = lp.to_arrays()
+    A = sparse.csr_matrix(A)
+
+    def expression(indices: np.ndarray, values: np.ndarray) -> Iterator[str]:
+        # Les lignes longues sont coupées : le format limite la longueur des lignes
+        for k, (j, value) in enumerate(zip(indices.tolist(), values.tolist())):
+            if k and k % LP_TERMS_PER_LINE == 0:
+                yield "\n   "
+            yield f" {'-' if value < 0 else '+'} {abs(value)!r} x{j + 1}"
+
+    with open(path, "w") as file:
+        # Toutes les variables figurent dans l'objectif pour conserver leur ordre à la relecture
+        file.write(f"Maximize\n {OBJECTIVE_NAME}:")
+        file.writelines(expression(np.arange(len(c)), c))
+
+        file.write("\nSubject To\n")
+        for i in range(A.shape[0]):
+            start, end = A.indptr[i], A.indptr[i + 1]
+            file.write(f" c{i + 1}:")
+            file.writelines(expression(A.indices[start:end], A.data[start:end]))
+            file.write(f" <= {float(b[i])!r}\n")
+
+        if lp.has_bounds():
+            lower, upper = (bound.tolist() for bound in lp.bounds())
+            file.write("Bounds\n")
+            for j in range(len(c)):
+                if upper[j] != np.inf:
+                    file.write(f" {lower[j]!r} <= x{j + 1} <= {upper[j]!r}\n")
+                elif lower[j] != 0:
+                    file.write(f" x{j + 1} >= {lower[j]!r}\n")
+        file.write("End\n")
+
+
+if __name__ == '__main__':
+    # Aller-retour MPS et LP d'un modèle creux aléatoire
+    import os
+    import tempfile
+    import time
+
+    rng = np.random.default_rng(0)
+    A = sparse.random(20000, 10000, density=1e-3, random_state=0, format="csr") * 10
+    lp = LinearProgram(A, rng.uniform(1, 10, 20000), rng.uniform(0, 1, 10000))
+
+    with tempfile.TemporaryDirectory() as directory:
+        for extension, write, read in (("mps", write_mps, read_mps), ("lp", write_lp, read_lp)):
+            path = os.path.join(directory, f"model.{extension}")
+
+            start = time.perf_counter()
+            write(lp, path)
+            written = time.perf_counter() - start
+
+            start = time.perf_counter()
+            loaded = read(path)
+            elapsed = time.perf_counter() - start
+
+            print(f"{extension.upper()} : {A.nnz} éléments non nuls, écriture {written:.2f} s, lecture {elapsed:.2f} s, "
+                  f"identique : {abs(loaded.to_arrays()[0] - A).max() == 0}")
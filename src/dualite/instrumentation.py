@@ -0,0 +1,195 @@
+import time
+from typing import Callable, Final, Optional
+
+
+PHASES: Final[tuple[str, ...]] = ("pricing", "ratio_test", "update")
+
+
+class IterationEvent:
+    """
+    Description d'un pivot, transmise aux observateurs de la résolution.
+
+    Args:
+        phase: "primal" ou "dual".
+        iteration: Numéro du pivot (à partir de 1).
+        entering: Indice de la colonne entrante.
+        leaving: Indice de la variable sortante (ou None si le moteur ne suit pas la base).
+        objective: Valeur de l'objectif après le pivot.
+        primal_infeasibility: Somme des valeurs négatives des variables de base après le pivot.
+        pricing_time: Durée du choix de la variable entrante (simplexe primal) ou sortante (dual).
+        ratio_test_time: Durée du test du ratio (avec le calcul de la colonne entrante pour le simplexe révisé).
+        update_time: Durée de la mise à jour du tableau ou de la factorisation.
+    """
+    phase: str
+    iteration: int
+    entering: int
+    leaving: Optional[int]
+    objective: float
+    primal_infeasibility: float
+    pricing_time: float
+    ratio_test_time: float
+    update_time: float
+
+    def __init__(self,
+                 phase: str,
+                 iteration: int,
+                 entering: int,
+                 leaving: Optional[int],
+                 objective: float,
+                 primal_infeasibility: float,
+                 pricing_time: float,
+                 ratio_test_time: float,
+                 update_time: float) -> None:
+        self.phase = phase
+        self.iteration = iteration
+        self.entering = entering
+        self.leaving = leaving
+        self.objective = objective
+        self.primal_infeasibility = primal_infeasibility
+        self.pricing_time = pricing_time
+        self.ratio_test_time = ratio_test_time
+        self.update_time = update_time
+
+    def __repr__(self) -> str:
+        return (f"IterationEvent(phase={self.phase!r}, iteration={self.iteration}, entering={self.entering}, "
+                f"leaving={self.leaving}, objective={self.objective})")
+
+
+class SolveObserver:
+    """
+    Observateur d'une résolution : les moteurs appellent start, iteration à chaque pivot, puis finish.
+
+    Sans observateur, les moteurs ne mesurent aucune durée et ne construisent aucun événement.
+    """
+
+    def start(self, engine: str, shape: tuple[int, int]) -> None:
+        """Appelée au début de la résolution, avec le nom du moteur et la taille (m, n) du problème."""
+
+    def iteration(self, event: IterationEvent) -> None:
+        """Appelée après chaque pivot."""
+
+    def finish(self, status: str, iterations: int) -> None:
+        """Appelée à la fin de la résolution, avec son statut et le nombre total de pivots."""
+
+
+class CallbackObserver(SolveObserver):
+    """Transmet chaque événement à une fonction."""
+
+    def __init__(self, callback: Callable[[IterationEvent], None]) -> None:
+        self.callback = callback
+
+    def iteration(self, event: IterationEvent) -> None:
+        self.callback(event)
+
+
+class ProgressPrinter(SolveObserver):
+    """
+    Affiche la progression de la résolution.
+
+    Args:
+        frequency: Un pivot sur frequency est affiché.
+    """
+
+    def __init__(self, frequency: int = 1) -> None:
+        self.frequency = frequency
+
+    def start(self, engine: str, shape: tuple[int, int]) -> None:
+        print(f"{engine} : {shape[0]} contraintes, {shape[1]} variables")
+
+    def iteration(self, event: IterationEvent) -> None:
+        if event.iteration % self.frequency == 0:
+            print(f"{event.phase:>6} {event.iteration:>6} : entrante {event.entering}, sortante {event.leaving}, "
+                  f"z = {event.objective:.6g}, infaisabilité = {event.primal_infeasibility:.3g}")
+
+    def finish(self, status: str, iterations: int) -> None:
+        print(f"{status} après {iterations} pivot(s)")
+
+
+class TimingProfile(SolveObserver):
+    """
+    Agrège la durée de chaque étape du pivot (voir PHASES) sur une résolution.
+
+    Le profil est remis à zéro par start : un même objet peut servir pour plusieurs résolutions successives.
+    """
+    engine: Optional[str]
+    iterations: int
+    elapsed: float
+    status: Optional[str]
+    totals: dict[str, float]
+
+    def __init__(self) -> None:
+        self._reset(None)
+
+    def _reset(self, engine: Optional[str]) -> None:
+        self.engine = engine
+        self.status = None
+        self.iterations = 0
+        self.elapsed = 0.0
+        self.totals = dict.fromkeys(PHASES, 0.0)
+        self._start = time.perf_counter()
+
+    def start(self, engine: str, shape: tuple[int, int]) -> None:
+        self._reset(engine)
+
+    def iteration(self, event: IterationEvent) -> None:
+        self.iterations += 1
+        self.totals["pricing"] += event.pricing_time
+        self.totals["ratio_test"] += event.ratio_test_time
+        self.totals["update"] += event.update_time
+
+    def finish(self, status: str, iterations: int) -> None:
+        self.status = status
+        self.elapsed = time.perf_counter() - self._start
+
+    def profile(self) -> dict[str, float]:
+        """
+        Returns:
+            dict: Durée totale de chaque étape, plus "other" (temps de résolution hors pivots) et "total".
+        """
+        profile = dict(self.totals)
+        profile["other"] = max(self.elapsed - sum(self.totals.values()), 0.0)
+        profile["total"] = self.elapsed
+        return profile
+
+    def __str__(self) -> str:
+        profile = self.profile()
+        lines = [f"{self.engine} : {self.status}, {self.iterations} pivot(s) en {self.elapsed * 1e3:.3f} ms"]
+        for phase, duration in profile.items():
+            if phase != "total":
+                share = duration / self.elapsed if self.elapsed > 0 else 0.0
+                lines.append(f"  {phase:>10} : {duration * 1e3:9.3f} ms ({share:6.1%})")
+        return "\n".join(lines)
+
+
+def make_observer(observer) -> Optional[SolveObserver]:
+    """
+    Construit un observateur à partir d'une fonction, ou retourne l'objet fourni.
+
+    Args:
+        observer: Instance de SolveObserver, fonction appelée avec chaque IterationEvent, ou None.
+    """
+    if observer is None or isinstance(observer, SolveObserver):
+        return observer
+    if callable(observer):
+        return CallbackObserver(observer)
+    raise ValueError(f"Observateur invalide : {observer!r}")
+
+
+if __name__ == '__main__':
+    # Profil des étapes du pivot pour les deux moteurs
+    import numpy as np
+
+    # Les moteurs importent le module sous son nom : ses classes diffèrent de celles de __main__
+    from instrumentation import TimingProfile
+    from revised import solve_revised
+    from tableau import solve_tableau
+
+    rng = np.random.default_rng(0)
+    A = rng.uniform(0, 1, (100, 300))
+    b = rng.uniform(1, 10, 100)
+    c = rng.uniform(0, 1, 300)
+
+    for solver in (solve_tableau, solve_revised):
+        profile = TimingProfile()
+        solver(A, b, c, observer=profile)
+        print(profile)
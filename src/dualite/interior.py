@@ -0,0 +1,216 @@
+import time
+from typing import Final
+
+import numpy as np
+from scipy import sparse
+from scipy.linalg import LinAlgError, cho_factor, cho_solve, qr
+
+from basis import Basis
+from instrumentation import make_observer
+from solution import INFEASIBLE, ITERATION_LIMIT, OPTIMAL, UNBOUNDED, Solution
+from tableau import solve_tableau
+
+
+INTERIOR_TOLERANCE: Final[float] = 1e-8
+MAX_ITERATIONS: Final[int] = 100
+STEP_FACTOR: Final[float] = 0.99
+DIVERGENCE: Final[float] = 1e8
+REGULARIZATION: Final[float] = 1e-12
+
+
+def _normal_solver(A_bar, d: np.ndarray):
+    # A D A^T est formée en dense (m x m) ; une régularisation minime rattrape les pivots nuls
+    if sparse.issparse(A_bar):
+        normal = (A_bar @ sparse.diags(d) @ A_bar.T).toarray()
+    else:
+        normal = (A_bar * d) @ A_bar.T
+    try:
+        factor = cho_factor(normal)
+    except LinAlgError:
+        normal[np.diag_indices_from(normal)] += REGULARIZATION * max(np.trace(normal), 1.0)
+        factor = cho_factor(normal)
+    return lambda rhs: cho_solve(factor, rhs)
+
+
+def _step_length(values: np.ndarray, direction: np.ndarray) -> float:
+    # Plus grand pas dans [0, 1] qui garde values + pas * direction >= 0
+    decreasing = direction < 0
+    if not decreasing.any():
+        return 1.0
+    return float(min(1.0, np.min(-values[decreasing] / direction[decreasing])))
+
+
+def _starting_point(A_bar, b: np.ndarray, costs: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Point de départ de Mehrotra : solutions de moindres carrés, décalées dans l'orthant positif
+    solve = _normal_solver(A_bar, np.ones(A_bar.shape[1]))
+    x = A_bar.T @ solve(b)
+    y = solve(A_bar @ costs)
+    z = costs - A_bar.T @ y
+
+    x += max(-1.5 * x.min(), 0.0)
+    z += max(-1.5 * z.min(), 0.0)
+    if x @ z <= 0.0:
+        # b = 0 ou c = 0 : x ou z peut être nul, et le décalage suivant diviserait par zéro
+        x += 1.0
+        z += 1.0
+    product = x @ z
+    x += 0.5 * product / z.sum()
+    z += 0.5 * product / x.sum()
+    return x, y, z
+
+
+def crossover_basis(A_bar, x: np.ndarray, z: np.ndarray) -> np.ndarray:
+    """
+    Choisit une base à partir d'une solution intérieure presque optimale.
+
+    Les colonnes sont pondérées par x_j / (x_j + z_j), proche de 1 pour les variables de base
+    de l'optimum ; une factorisation QR à pivotage de colonnes retient les m colonnes
+    linéairement indépendantes de plus grand poids.
+
+    Args:
+        A_bar: Matrice [A | I] (m x (n+m)).
+        x: Valeurs primales de toutes les colonnes.
+        z: Coûts réduits de toutes les colonnes.
+
+    Returns:
+        np.ndarray: Indice de la colonne de base de chaque ligne.
+    """
+    weights = x / (x + z)
+    dense = A_bar.toarray() if sparse.issparse(A_bar) else A_bar
+    _, _, permutation = qr(dense * weights, mode="economic", pivoting=True)
+    return np.sort(permutation[:A_bar.shape[0]])
+
+
+def solve_interior(A, b, c,
+                   tolerance: float = INTERIOR_TOLERANCE,
+                   max_iterations: int = MAX_ITERATIONS,
+                   crossover: bool = False,
+                   observer=None) -> Solution:
+    """
+    Résout max c x, A x <= b, x >= 0 par la méthode de points intérieurs prédicteur-correcteur de Mehrotra.
+
+    Le problème est traité sous la forme min -c x, [A | I] (x, s) = b, (x, s) >= 0. Chaque
+    itération factorise une fois par Cholesky les équations normales A D A^T (D = X Z^-1) et
+    résout deux systèmes : la direction affine (prédicteur), puis la direction centrée et
+    corrigée (correcteur) avec sigma = (mu_aff / mu)^3. b peut être de signe quelconque.
+
+    Sans crossover, la solution est intérieure (pas de base, x à tolerance près de l'optimum).
+    Avec crossover, une base est extraite de la solution (voir crossover_basis) et le simplexe
+    sur tableau termine la résolution depuis cette base : la solution est alors un sommet,
+    avec sa base et ses prix duaux exacts.
+
+    Args:
+        A: Matrice des contraintes (m x n, dense ou creuse).
+        b: Second membre des contraintes (m).
+        c: Coefficients de la fonction objectif à maximiser (n).
+        tolerance: Résidus relatifs primal, dual et saut de dualité visés.
+        max_iterations: Nombre maximal d'itérations de points intérieurs.
+        crossover: Termine par un passage au sommet.
+        observer: Observateur (voir instrumentation) ; seuls les pivots du crossover sont rapportés.
+
+    Returns:
+        Solution: iterations compte les itérations de points intérieurs et les pivots du crossover ;
+        statut ITERATION_LIMIT si les résidus n'ont pas convergé en max_iterations itérations.
+    """
+    start = time.perf_counter()
+    observer = make_observer(observer)
+    constraints_count, variables_count = len(b), len(c)
+    if observer is not None:
+        observer.start("interior", (constraints_count, variables_count))
+
+    if sparse.issparse(A):
+        A_bar = sparse.hstack((A, sparse.identity(constraints_count)), format="csr")
+    else:
+        A_bar = np.hstack((np.asarray(A, dtype=float), np.eye(constraints_count)))
+    b = np.asarray(b, dtype=float)
+    costs = np.concatenate((-np.asarray(c, dtype=float), np.zeros(constraints_count)))
+    b_norm, costs_norm = 1.0 + np.linalg.norm(b), 1.0 + np.linalg.norm(costs)
+
+    x, y, z = _starting_point(A_bar, b, costs)
+    # Seuil de divergence relatif à l'échelle du point de départ
+    divergence = DIVERGENCE * max(1.0, np.abs(x).max(), np.abs(z).max())
+    status = ITERATION_LIMIT
+    iterations = 0
+    while iterations < max_iterations:
+        primal_residual = b - A_bar @ x
+        dual_residual = costs - A_bar.T @ y - z
+        primal_objective, dual_objective = costs @ x, b @ y
+        if (np.linalg.norm(primal_residual) / b_norm <= tolerance
+                and np.linalg.norm(dual_residual) / costs_norm <= tolerance
+                and abs(primal_objective - dual_objective) / (1.0 + abs(primal_objective)) <= tolerance):
+            status = OPTIMAL
+            break
+        # Divergence : x non borné (primal non borné) ou y non borné (primal irréalisable)
+        if np.abs(x).max() > divergence:
+            status = UNBOUNDED
+            break
+        if np.abs(y).max() > divergence:
+            status = INFEASIBLE
+            break
+
+        mu = x @ z / len(x)
+        solve = _normal_solver(A_bar, x / z)
+
+        def direction(complementarity: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+            # Z dx + X dz = complementarity, A dx = rp, A^T dy + dz = rd
+            dy = solve(primal_residual + A_bar @ ((x * dual_residual - complementarity) / z))
+            dz = dual_residual - A_bar.T @ dy
+            dx = (complementarity - x * dz) / z
+            return dx, dy, dz
+
+        # Prédicteur : direction affine
+        dx, dy, dz = direction(-x * z)
+        primal_step, dual_step = _step_length(x, dx), _step_length(z, dz)
+        affine_mu = (x + primal_step * dx) @ (z + dual_step * dz) / len(x)
+        sigma = (affine_mu / mu) ** 3
+
+        # Correcteur : centrage et terme du second ordre
+        dx, dy, dz = direction(sigma * mu - x * z - dx * dz)
+        primal_step = STEP_FACTOR * _step_length(x, dx)
+        dual_step = STEP_FACTOR * _step_length(z, dz)
+        x += primal_step * dx
+        y += dual_step * dy
+        z += dual_step * dz
+        iterations += 1
+
+    if status != OPTIMAL:
+        solution = Solution(status, iterations=iterations, elapsed=time.perf_counter() - start)
+    elif crossover:
+        basic = crossover_basis(A_bar, x, z)
+        solution = solve_tableau(A, b, c, basis=Basis.from_header(basic, variables_count + constraints_count),
+                                 observer=observer)
+        solution.iterations += iterations
+        solution.elapsed = time.perf_counter() - start
+        return solution
+    else:
+        # Les prix duaux du problème max sont l'opposé de ceux de la forme min
+        solution = Solution(OPTIMAL, x[:variables_count], float(np.asarray(c, dtype=float) @ x[:variables_count]),
+                            iterations, elapsed=time.perf_counter() - start, duals=-y)
+
+    if observer is not None:
+        observer.finish(solution.status, solution.iterations)
+    return solution
+
+
+if __name__ == '__main__':
+    # Grand problème dense : itérations de points intérieurs contre pivots du simplexe
+    rng = np.random.default_rng(0)
+    A = rng.uniform(0, 1, (300, 900))
+    b = rng.uniform(1, 10, 300)
+    c = rng.uniform(0, 1, 900)
+
+    simplex = solve_tableau(A, b, c)
+    interior = solve_interior(A, b, c)
+    vertex = solve_interior(A, b, c, crossover=True)
+
+    print(f"Simplexe : z = {simplex.z:.8f}, {simplex.iterations} pivots, {simplex.elapsed:.3f} s")
+    print(f"Points intérieurs : z = {interior.z:.8f}, {interior.iterations} itérations, {interior.elapsed:.3f} s")
+    print(f"Avec crossover : z = {vertex.z:.8f}, {vertex.iterations} itérations et pivots, {vertex.elapsed:.3f} s")
+
+    # Limite d'itérations : le statut le signale, sans exception
+    print("max_iterations = 3 :", solve_interior(A, b, c, max_iterations=3))
+
+    # Second membre nul et objectif nul : le point de départ reste strictement intérieur
+    for A, b, c in (([[1, 1], [1, -1]], [0, 0], [1, 0]), ([[1, 2]], [4], [0, 0]), ([[1, 2]], [0], [0, 0])):
+        solution = solve_interior(A, b, c)
+        print(f"b = {b}, c = {c} : {solution.status}, z = {solution.z}, simplexe : z = {solve_tableau(A, b, c).z}")
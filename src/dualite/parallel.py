@@ -0,0 +1,107 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+
+from simplexe_primal import LinearProgram
+from solution import Solution
+
+
+def _solve_chunk(chunk: list[tuple[int, tuple]], method: Optional[str], options: dict) -> list[tuple[int, Solution]]:
+    """Résout un paquet de programmes dans un processus de travail."""
+    results = []
+    for index, (A, b, c, lower, upper) in chunk:
+        results.append((index, LinearProgram(A, b, c, lower, upper).solve(method, **options)))
+    return results
+
+
+class ParallelSolver:
+    """
+    Répartit des programmes linéaires indépendants sur un pool de processus.
+
+    Les processus restent vivants d'un appel à solve() à l'autre. Les programmes sont envoyés
+    sous forme de tableaux numpy (matrice dense ou CSR, b, c, bornes éventuelles) et regroupés par paquets de
+    chunksize pour amortir le coût de communication sur les petits problèmes.
+
+    Args:
+        max_workers: Nombre de processus (par défaut, le nombre de cœurs).
+        chunksize: Nombre de programmes envoyés ensemble à un processus.
+        method: Moteur de résolution (voir SOLVERS), choisi automatiquement si None.
+        options: Options transmises au moteur.
+    """
+    chunksize: int
+
+    def __init__(self, max_workers: Optional[int] = None, chunksize: int = 1, method: Optional[str] = None, **options) -> None:
+        if chunksize < 1:
+            raise ValueError("chunksize doit être strictement positif")
+
+        self.chunksize = chunksize
+        self._method = method
+        self._options = options
+        max_workers = max_workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(max_workers=max_workers)
+        self._max_pending = 2 * max_workers
+
+    def __enter__(self) -> 'ParallelSolver':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown()
+
+    def solve(self, programs: Iterable[LinearProgram]) -> Iterator[tuple[int, Solution]]:
+        """
+        Résout un flux de programmes et produit les résultats dans l'ordre où ils se terminent.
+
+        Le flux est consommé au fur et à mesure : seuls quelques paquets sont en attente à la fois.
+
+        Args:
+            programs: Itérable de LinearProgram, éventuellement infini.
+
+        Yields:
+            tuple: (indice du programme dans le flux, Solution).
+        """
+        payloads = ((index, (*program.to_arrays(), *(program.bounds() if program.has_bounds() else (None, None))))
+                    for index, program in enumerate(programs))
+        pending: set[Future] = set()
+
+        while True:
+            while len(pending) < self._max_pending:
+                chunk = list(islice(payloads, self.chunksize))
+                if not chunk:
+                    break
+                pending.add(self._executor.submit(_solve_chunk, chunk, self._method, self._options))
+
+            if not pending:
+                return
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+
+
+def solve_parallel(programs: Iterable[LinearProgram],
+                   max_workers: Optional[int] = None,
+                   chunksize: int = 1,
+                   method: Optional[str] = None,
+                   **options) -> Iterator[tuple[int, Solution]]:
+    """
+    Résout des programmes linéaires indépendants en parallèle avec un pool éphémère.
+
+    Returns:
+        Iterator: Couples (indice, Solution) dans l'ordre de terminaison.
+    """
+    with ParallelSolver(max_workers, chunksize, method, **options) as solver:
+        yield from solver.solve(programs)
+
+
+if __name__ == '__main__':
+    # Exemple d'utilisation : 100 variantes du même problème, par paquets de 10
+    programs = (LinearProgram([[1, 1], [2, 1]], [4 + k, 6], [3, 2]) for k in range(100))
+
+    with ParallelSolver(chunksize=10) as solver:
+        for index, solution in solver.solve(programs):
+            if index % 25 == 0:
+                print(f"Programme {index} : x = {solution.x}, z = {solution.z}")
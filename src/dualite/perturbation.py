@@ -0,0 +1,63 @@
+from typing import Final
+
+import numpy as np
+
+
+PERTURBATION_SCALE: Final[float] = 1e-6
+PERTURBATION_SEED: Final[int] = 0
+STALL_THRESHOLD: Final[int] = 20
+
+
+def make_perturbation(values: np.ndarray, scale: float = PERTURBATION_SCALE, seed: int = PERTURBATION_SEED) -> np.ndarray:
+    """
+    Perturbation déterministe des variables de base : eps_i = scale * (1 + |v_i|) * (1 + u_i).
+
+    Les u_i sont tirés dans [0, 1) par un générateur initialisé avec seed : deux résolutions
+    du même problème suivent exactement les mêmes pivots, et les valeurs perturbées sont
+    toutes distinctes, ce qui lève la dégénérescence.
+
+    Args:
+        values: Valeurs courantes des variables de base.
+        scale: Amplitude relative de la perturbation.
+        seed: Graine du générateur.
+
+    Returns:
+        np.ndarray: Perturbation strictement positive, à ajouter aux variables de base.
+    """
+    rng = np.random.default_rng(seed)
+    return scale * (1.0 + np.abs(values)) * (1.0 + rng.random(len(values)))
+
+
+class DegeneracyMonitor:
+    """
+    Détecte une stagnation : threshold pivots dégénérés (pas nul) consécutifs.
+
+    Args:
+        threshold: Nombre de pivots dégénérés consécutifs tolérés.
+    """
+    threshold: int
+    degenerate_pivots: int
+
+    def __init__(self, threshold: int = STALL_THRESHOLD) -> None:
+        self.threshold = threshold
+        self.degenerate_pivots = 0
+
+    def record(self, degenerate: bool) -> bool:
+        """Enregistre un pivot ; retourne True lorsque la stagnation est détectée."""
+        self.degenerate_pivots = self.degenerate_pivots + 1 if degenerate else 0
+        return self.degenerate_pivots >= self.threshold
+
+
+if __name__ == '__main__':
+    # Problème fortement dégénéré : la plupart des seconds membres sont nuls
+    from tableau import solve_tableau
+
+    rng = np.random.default_rng(5)
+    A = rng.integers(-3, 5, (40, 60)).astype(float)
+    b = np.where(rng.random(40) < 0.8, 0.0, 5.0)
+    A[-1], b[-1] = 1.0, 10.0
+    c = rng.integers(-2, 4, 60).astype(float)
+
+    for label, options in (("perturbation", {}), ("lexicographique", {"lexicographic": True})):
+        solution = solve_tableau(A, b, c, **options)
+        print(f"{label:>15} : z = {solution.z:.6f}, {solution.iterations} pivots, {solution.elapsed * 1e3:.1f} ms")
@@ -0,0 +1,231 @@
+import logging
+import time
+from typing import Optional
+
+import numpy as np
+from scipy import sparse
+
+from simplexe_primal import LinearProgram
+from solution import INFEASIBLE, UNBOUNDED
+
+
+logger = logging.getLogger(__name__)
+
+
+class PostsolveStack:
+    """
+    Informations nécessaires pour ramener une solution du problème réduit au problème d'origine.
+
+    Args:
+        A: Matrice des contraintes d'origine (CSC).
+        c: Objectif d'origine.
+    """
+    kept_rows: np.ndarray
+    kept_columns: np.ndarray
+    objective_offset: float
+    statistics: list[tuple[str, int, int]]
+    elapsed: float
+    status: Optional[str]
+
+    def __init__(self, A: sparse.csc_matrix, c: np.ndarray) -> None:
+        self._A = A
+        self._c = c
+        self._fixed: dict[int, float] = {}
+        self._forcing_rows: list[tuple[int, int, float]] = []
+        self.kept_rows = np.arange(A.shape[0])
+        self.kept_columns = np.arange(A.shape[1])
+        self.objective_offset = 0.0
+        self.statistics = []
+        self.elapsed = 0.0
+        self.status = None
+
+    def fix_column(self, column: int, value: float) -> None:
+        self._fixed[column] = value
+        self.objective_offset += self._c[column] * value
+
+    def add_forcing_row(self, row: int, column: int, coefficient: float) -> None:
+        self._forcing_rows.append((row, column, coefficient))
+
+    def objective(self, z: float) -> float:
+        """Valeur de l'objectif d'origine à partir de celle du problème réduit."""
+        return z + self.objective_offset
+
+    def postsolve(self, x, y=None) -> tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Ramène les solutions primale et duale du problème réduit aux variables d'origine.
+
+        Args:
+            x: Solution primale du problème réduit.
+            y: Solution duale (prix des contraintes) du problème réduit, optionnelle.
+
+        Returns:
+            tuple: (x, y) pour le problème d'origine ; y vaut None si aucune solution duale n'est fournie.
+        """
+        rows_count, columns_count = self._A.shape
+
+        full_x = np.zeros(columns_count)
+        full_x[self.kept_columns] = x
+        for column, value in self._fixed.items():
+            full_x[column] = value
+
+        if y is None:
+            return full_x, None
+
+        # Les contraintes supprimées sont inactives ou redondantes : prix nul,
+        # sauf les lignes singletons qui fixaient une variable à zéro
+        full_y = np.zeros(rows_count)
+        full_y[self.kept_rows] = y
+        for row, column, coefficient in reversed(self._forcing_rows):
+            start, end = self._A.indptr[column], self._A.indptr[column + 1]
+            reduced_cost = self._c[column] - self._A.data[start:end] @ full_y[self._A.indices[start:end]]
+            full_y[row] = max(0.0, reduced_cost / coefficient)
+        return full_x, full_y
+
+
+def presolve(lp: LinearProgram) -> tuple[LinearProgram, PostsolveStack]:
+    """
+    Réduit un programme linéaire max c x, A x <= b, x >= 0 avant sa résolution.
+
+    Les réductions sont répétées jusqu'à stabilité : lignes vides, lignes singletons,
+    colonnes vides, colonnes fixées, lignes dupliquées et colonnes dominées.
+
+    Args:
+        lp: Programme linéaire d'origine.
+
+    Returns:
+        tuple: Programme réduit et pile de postsolve. Si l'irréalisabilité ou le caractère non
+               borné est détecté, stack.status vaut INFEASIBLE ou UNBOUNDED.
+    """
+    if lp.has_bounds():
+        raise ValueError("Le présolve ne gère que les variables x >= 0, sans bornes natives")
+
+    presolve_start = time.perf_counter()
+    A, b, c = lp.to_arrays()
+    A_csr = sparse.csr_matrix(A)
+    A_csc = sparse.csc_matrix(A)
+    b = b.copy()
+
+    stack = PostsolveStack(A_csc, c)
+    active_rows = np.ones(A_csr.shape[0], dtype=bool)
+    active_columns = np.ones(A_csr.shape[1], dtype=bool)
+
+    def remove(reduction: str, rows: np.ndarray, columns: np.ndarray) -> bool:
+        active_rows[rows] = False
+        active_columns[columns] = False
+        if len(rows) or len(columns):
+            stack.statistics.append((reduction, len(rows), len(columns)))
+            logger.info("%s : %d ligne(s), %d colonne(s) supprimée(s)", reduction, len(rows), len(columns))
+            return True
+        return False
+
+    def fix(columns: np.ndarray, value: float = 0.0) -> None:
+        for column in columns:
+            stack.fix_column(int(column), value)
+            if value != 0.0:
+                start, end = A_csc.indptr[column], A_csc.indptr[column + 1]
+                b[A_csc.indices[start:end]] -= value * A_csc.data[start:end]
+
+    changed = True
+    while changed and stack.status is None:
+        pattern = sparse.csr_matrix((A_csr != 0).astype(np.int64))
+        row_counts = pattern @ active_columns.astype(np.int64)
+        column_counts = pattern.T @ active_rows.astype(np.int64)
+
+        # Lignes vides : 0 <= b_i
+        empty_rows = np.flatnonzero(active_rows & (row_counts == 0))
+        if np.any(b[empty_rows] < 0):
+            stack.status = INFEASIBLE
+            break
+        changed = remove("Lignes vides", empty_rows, np.array([], dtype=np.intp))
+
+        # Colonnes vides : fixées à zéro, ou problème non borné si c_j > 0
+        empty_columns = np.flatnonzero(active_columns & (column_counts == 0))
+        if np.any(c[empty_columns] > 0):
+            stack.status = UNBOUNDED
+            break
+        fix(empty_columns)
+        changed |= remove("Colonnes vides", np.array([], dtype=np.intp), empty_columns)
+
+        # Lignes singletons : borne sur une seule variable
+        redundant_rows, forcing_rows, fixed_columns = [], [], []
+        for row in np.flatnonzero(active_rows & (row_counts == 1)):
+            start, end = A_csr.indptr[row], A_csr.indptr[row + 1]
+            entries = [(j, a) for j, a in zip(A_csr.indices[start:end], A_csr.data[start:end]) if active_columns[j] and a != 0]
+            column, coefficient = entries[0]
+            bound = b[row] / coefficient
+            if coefficient < 0 and bound <= 0:
+                redundant_rows.append(row)
+            elif coefficient > 0 and bound < 0:
+                stack.status = INFEASIBLE
+                break
+            elif coefficient > 0 and bound == 0 and column not in fixed_columns:
+                forcing_rows.append(row)
+                fixed_columns.append(column)
+                stack.add_forcing_row(int(row), int(column), float(coefficient))
+        if stack.status is not None:
+            break
+        changed |= remove("Lignes singletons redondantes", np.array(redundant_rows, dtype=np.intp), np.array([], dtype=np.intp))
+        fix(np.array(fixed_columns, dtype=np.intp))
+        changed |= remove("Colonnes fixées", np.array(forcing_rows, dtype=np.intp), np.array(fixed_columns, dtype=np.intp))
+
+        # Lignes dupliquées : lignes proportionnelles (facteur positif), seule la plus serrée est gardée
+        tightest: dict[tuple, int] = {}
+        duplicate_rows = []
+        for row in np.flatnonzero(active_rows):
+            start, end = A_csr.indptr[row], A_csr.indptr[row + 1]
+            keep = active_columns[A_csr.indices[start:end]] & (A_csr.data[start:end] != 0)
+            indices, values = A_csr.indices[start:end][keep], A_csr.data[start:end][keep]
+            if len(values) == 0:
+                continue
+            scale = np.abs(values).max()
+            key = (tuple(indices.tolist()), tuple(np.round(values / scale, 12).tolist()))
+            if key in tightest:
+                other = tightest[key]
+                other_scale = np.abs(A_csr[other, indices].toarray()).max()
+                if b[row] / scale < b[other] / other_scale:
+                    tightest[key], row = row, other
+                duplicate_rows.append(row)
+            else:
+                tightest[key] = row
+        changed |= remove("Lignes dupliquées", np.array(duplicate_rows, dtype=np.intp), np.array([], dtype=np.intp))
+
+        # Colonnes dominées : c_j <= 0 et colonne positive ou nulle, x_j = 0 est optimal
+        negative_entries = sparse.csc_matrix((A_csc < 0).astype(np.int64)).T @ active_rows.astype(np.int64)
+        dominated = np.flatnonzero(active_columns & (c <= 0) & (negative_entries == 0))
+        fix(dominated)
+        changed |= remove("Colonnes dominées", np.array([], dtype=np.intp), dominated)
+
+    stack.kept_rows = np.flatnonzero(active_rows)
+    stack.kept_columns = np.flatnonzero(active_columns)
+
+    reduced_A = A_csr[stack.kept_rows][:, stack.kept_columns]
+    if not lp.is_sparse():
+        reduced_A = reduced_A.toarray()
+    reduced = LinearProgram(reduced_A, b[stack.kept_rows], c[stack.kept_columns])
+
+    stack.elapsed = time.perf_counter() - presolve_start
+    logger.info("Presolve : %d x %d -> %d x %d en %.3f s",
+                A_csr.shape[0], A_csr.shape[1], len(stack.kept_rows), len(stack.kept_columns), stack.elapsed)
+    return reduced, stack
+
+
+if __name__ == '__main__':
+    # Exemple d'utilisation
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    A = [[1, 1, 0, 1],
+         [2, 1, 0, 0],
+         [2, 2, 0, 2],
+         [0, 0, 0, 0],
+         [0, 0, 1, 0]]
+    b = [4, 6, 9, 1, 0]
+    c = [3, 2, 5, -1]
+
+    reduced, stack = presolve(LinearProgram(A, b, c))
+    print(reduced)
+
+    solution = reduced.solve()
+    x, _ = stack.postsolve(solution.x)
+
+    print("Solution optimale :", x)
+    print("Valeur optimale de la fonction objectif :", stack.objective(solution.z))
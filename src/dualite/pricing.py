@@ -0,0 +1,179 @@
+from typing import Final, Optional
+
+import numpy as np
+
+
+TOLERANCE: Final[float] = 1e-9
+
+
+class PricingStrategy:
+    """
+    Règle de choix de la variable entrante du simplexe primal sur le tableau.
+
+    La ligne objectif du tableau contient les coûts réduits : une colonne est candidate
+    lorsque son coefficient est négatif.
+    """
+    name: str = "dantzig"
+
+    def reset(self, tableau: np.ndarray, basis: np.ndarray) -> None:
+        """Initialise l'état de la règle pour un nouveau tableau."""
+
+    def select(self, tableau: np.ndarray) -> Optional[int]:
+        """Retourne la colonne entrante, ou None si le tableau est optimal."""
+        objective_row = tableau[-1, :-1]
+        if objective_row.size == 0:
+            return None
+        colonne_pivot = int(np.argmin(objective_row))
+        if objective_row[colonne_pivot] >= -TOLERANCE:
+            return None
+        return colonne_pivot
+
+    def update(self, tableau: np.ndarray, ligne_pivot: int, colonne_pivot: int, leaving: int) -> None:
+        """Met à jour l'état de la règle ; appelée avant que le pivot ne modifie le tableau."""
+
+
+class DantzigPricing(PricingStrategy):
+    """Règle de Dantzig : coût réduit le plus négatif sur toute la ligne objectif."""
+    name = "dantzig"
+
+
+class PartialPricing(PricingStrategy):
+    """
+    Pricing partiel : seul un segment de colonnes est examiné à chaque itération.
+
+    Le segment suivant n'est parcouru que si le segment courant ne contient aucun candidat,
+    en reprenant là où l'itération précédente s'était arrêtée.
+
+    Args:
+        segment_size: Nombre de colonnes par segment (par défaut, un dixième des colonnes).
+    """
+    name = "partial"
+
+    def __init__(self, segment_size: Optional[int] = None) -> None:
+        self.segment_size = segment_size
+        self._segment_size = segment_size
+        self._start = 0
+
+    def reset(self, tableau: np.ndarray, basis: np.ndarray) -> None:
+        self._start = 0
+        # La taille par défaut dépend du tableau : recalculée à chaque résolution, sans modifier segment_size
+        self._segment_size = self.segment_size
+        if self._segment_size is None:
+            self._segment_size = max(1, (tableau.shape[1] - 1) // 10)
+
+    def select(self, tableau: np.ndarray) -> Optional[int]:
+        objective_row = tableau[-1, :-1]
+        columns_count = len(objective_row)
+
+        for start in range(self._start, self._start + columns_count, self._segment_size):
+            columns = np.arange(start, min(start + self._segment_size, self._start + columns_count)) % columns_count
+            segment = objective_row[columns]
+            best = int(np.argmin(segment))
+            if segment[best] < -TOLERANCE:
+                self._start = int(columns[0])
+                return int(columns[best])
+        return None
+
+
+class DevexPricing(PricingStrategy):
+    """
+    Règle Devex : approximation des normes de steepest edge par des poids de référence.
+
+    Le choix maximise d_j^2 / w_j ; les poids sont mis à jour à partir de la seule ligne pivot.
+    """
+    name = "devex"
+
+    def reset(self, tableau: np.ndarray, basis: np.ndarray) -> None:
+        self._weights = np.ones(tableau.shape[1] - 1)
+
+    def select(self, tableau: np.ndarray) -> Optional[int]:
+        objective_row = tableau[-1, :-1]
+        candidates = objective_row < -TOLERANCE
+        if not candidates.any():
+            return None
+        scores = np.where(candidates, objective_row * objective_row / self._weights, -np.inf)
+        return int(np.argmax(scores))
+
+    def update(self, tableau: np.ndarray, ligne_pivot: int, colonne_pivot: int, leaving: int) -> None:
+        pivot_row = tableau[ligne_pivot, :-1]
+        pivot_value = pivot_row[colonne_pivot]
+        weight = self._weights[colonne_pivot]
+
+        np.maximum(self._weights, (pivot_row / pivot_value) ** 2 * weight, out=self._weights)
+        self._weights[leaving] = max(weight / pivot_value ** 2, 1.0)
+        self._weights[colonne_pivot] = 1.0
+
+
+class SteepestEdgePricing(PricingStrategy):
+    """
+    Steepest edge : maximise d_j^2 / gamma_j avec gamma_j = 1 + ||B^-1 a_j||^2.
+
+    Les normes sont calculées une fois puis mises à jour à chaque pivot par les
+    formules de Goldfarb et Reid.
+    """
+    name = "steepest_edge"
+
+    def reset(self, tableau: np.ndarray, basis: np.ndarray) -> None:
+        body = tableau[:-1, :-1]
+        self._weights = 1.0 + np.einsum('ij,ij->j', body, body)
+        self._weights[basis] = 1.0
+
+    def select(self, tableau: np.ndarray) -> Optional[int]:
+        objective_row = tableau[-1, :-1]
+        candidates = objective_row < -TOLERANCE
+        if not candidates.any():
+            return None
+        scores = np.where(candidates, objective_row * objective_row / self._weights, -np.inf)
+        return int(np.argmax(scores))
+
+    def update(self, tableau: np.ndarray, ligne_pivot: int, colonne_pivot: int, leaving: int) -> None:
+        body = tableau[:-1, :-1]
+        pivot_column = body[:, colonne_pivot]
+        pivot_value = pivot_column[ligne_pivot]
+        weight = self._weights[colonne_pivot]
+
+        ratios = body[ligne_pivot] / pivot_value
+        products = pivot_column @ body
+        updated = self._weights - 2.0 * ratios * products + ratios * ratios * weight
+        np.maximum(updated, 1.0 + ratios * ratios, out=self._weights)
+
+        self._weights[leaving] = max(weight / pivot_value ** 2, 1.0)
+        self._weights[colonne_pivot] = 1.0
+
+
+PRICING_RULES: Final[dict[str, type[PricingStrategy]]] = {
+    "dantzig": DantzigPricing,
+    "partial": PartialPricing,
+    "devex": DevexPricing,
+    "steepest_edge": SteepestEdgePricing,
+}
+
+
+def make_pricing(pricing) -> PricingStrategy:
+    """
+    Construit une règle de pricing à partir de son nom, ou retourne l'objet fourni.
+
+    Args:
+        pricing: Nom de la règle (voir PRICING_RULES), instance de PricingStrategy ou None.
+    """
+    if pricing is None:
+        return DantzigPricing()
+    if isinstance(pricing, PricingStrategy):
+        return pricing
+    if pricing not in PRICING_RULES:
+        raise ValueError(f"Règle de pricing inconnue : {pricing}")
+    return PRICING_RULES[pricing]()
+
+
+if __name__ == '__main__':
+    # Comparaison des règles sur un problème aléatoire
+    from tableau import compare_pricing
+
+    rng = np.random.default_rng(0)
+    A = rng.uniform(0, 1, (60, 300))
+    b = rng.uniform(1, 10, 60)
+    c = rng.uniform(0, 1, 300)
+
+    for name, solution in compare_pricing(A, b, c).items():
+        print(f"{name:>14} : z = {solution.z:.6f}, {solution.iterations} pivots, "
+              f"{solution.time_per_iteration * 1e6:.1f} µs/pivot")
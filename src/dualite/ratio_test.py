@@ -0,0 +1,180 @@
+from typing import Callable, Final, Optional
+
+import numpy as np
+
+
+PRIMAL_TOLERANCE: Final[float] = 1e-9
+PIVOT_TOLERANCE: Final[float] = 1e-7
+
+
+def harris_ratio_test(column,
+                      rhs,
+                      primal_tolerance: float = PRIMAL_TOLERANCE,
+                      pivot_tolerance: float = PIVOT_TOLERANCE) -> Optional[int]:
+    """
+    Test du ratio de Harris en deux passes.
+
+    La première passe calcule le plus petit pas autorisé lorsque chaque variable de base peut
+    devenir négative d'au plus primal_tolerance. La seconde choisit, parmi les lignes dont le
+    ratio exact ne dépasse pas ce pas, celle dont le pivot est le plus grand en valeur absolue.
+    Les pivots inférieurs à pivot_tolerance ne sont jamais retenus.
+
+    Args:
+        column: Colonne entrante exprimée dans la base courante (liste ou tableau numpy).
+        rhs: Valeurs courantes des variables de base.
+        primal_tolerance: Violation tolérée des bornes des variables de base.
+        pivot_tolerance: Plus petit pivot accepté.
+
+    Returns:
+        int | None: Indice de la ligne pivot, None si aucune ligne ne borne le pas (problème non borné).
+    """
+    column = np.asarray(column, dtype=float)
+    rhs = np.asarray(rhs, dtype=float)
+
+    eligible = column > pivot_tolerance
+    if not eligible.any():
+        return None
+
+    # Passe 1 : pas maximal avec bornes relâchées
+    relaxed = np.full(column.shape, np.inf)
+    np.divide(rhs + primal_tolerance, column, out=relaxed, where=eligible)
+    max_step = relaxed.min()
+
+    # Passe 2 : plus grand pivot parmi les ratios exacts sous ce pas
+    ratios = np.full(column.shape, np.inf)
+    np.divide(rhs, column, out=ratios, where=eligible)
+    candidates = eligible & (ratios <= max_step)
+    return int(np.argmax(np.where(candidates, column, -np.inf)))
+
+
+def lexicographic_ratio_test(column,
+                             rhs,
+                             inverse_row: Callable[[int], np.ndarray],
+                             primal_tolerance: float = PRIMAL_TOLERANCE,
+                             pivot_tolerance: float = PIVOT_TOLERANCE) -> Optional[int]:
+    """
+    Test du ratio lexicographique : règle anti-cyclage à terminaison garantie.
+
+    Les égalités au ratio minimal sont départagées par le plus petit vecteur, au sens
+    lexicographique, (B^-1)_i / a_i. Les lignes de B^-1 sont calculées à la demande par
+    inverse_row, uniquement pour les lignes ex æquo, et deux seulement sont gardées en
+    mémoire. La terminaison est garantie en partant de la base des variables d'écart.
+
+    Args:
+        column: Colonne entrante exprimée dans la base courante.
+        rhs: Valeurs courantes des variables de base.
+        inverse_row: Fonction retournant la ligne i de B^-1.
+        primal_tolerance: Écart toléré entre deux ratios ou deux coefficients considérés égaux.
+        pivot_tolerance: Plus petit pivot accepté.
+
+    Returns:
+        int | None: Indice de la ligne pivot, None si aucune ligne ne borne le pas (problème non borné).
+    """
+    column = np.asarray(column, dtype=float)
+    rhs = np.asarray(rhs, dtype=float)
+
+    eligible = column > pivot_tolerance
+    if not eligible.any():
+        return None
+
+    ratios = np.full(column.shape, np.inf)
+    np.divide(rhs, column, out=ratios, where=eligible)
+    ties = np.flatnonzero(ratios <= ratios.min() + primal_tolerance)
+
+    ligne_pivot = int(ties[0])
+    if len(ties) == 1:
+        return ligne_pivot
+
+    best = inverse_row(ligne_pivot) / column[ligne_pivot]
+    for i in ties[1:]:
+        candidate = inverse_row(int(i)) / column[i]
+        difference = candidate - best
+        significant = np.flatnonzero(np.abs(difference) > primal_tolerance)
+        if significant.size and difference[significant[0]] < 0:
+            ligne_pivot, best = int(i), candidate
+    return ligne_pivot
+
+
+def bounded_ratio_test(column,
+                       values,
+                       upper,
+                       entering_range: float = np.inf,
+                       primal_tolerance: float = PRIMAL_TOLERANCE,
+                       pivot_tolerance: float = PIVOT_TOLERANCE,
+                       order: Optional[np.ndarray] = None) -> tuple[Optional[int], float, bool]:
+    """
+    Test du ratio de Harris pour des variables bornées 0 <= x_B <= upper.
+
+    Les variables de base suivent x_B - t * column lorsque la variable entrante avance de t :
+    une ligne borne le pas lorsque sa variable descend vers 0 (coefficient positif) ou monte
+    vers sa borne supérieure (coefficient négatif). La variable entrante elle-même ne peut
+    avancer que de entering_range : si ce pas est le plus petit, elle change simplement de
+    borne, sans pivot.
+
+    Si order est fourni, le test est strict : parmi les lignes au ratio minimal, celle de plus
+    petit rang est choisie (règle de Bland, qui garantit la terminaison).
+
+    Args:
+        column: Direction de déplacement des variables de base.
+        values: Valeurs courantes des variables de base.
+        upper: Bornes supérieures des variables de base (np.inf si aucune).
+        entering_range: Écart entre les bornes de la variable entrante.
+        primal_tolerance: Violation tolérée des bornes des variables de base.
+        pivot_tolerance: Plus petit pivot accepté.
+        order: Rang de la variable de base de chaque ligne, optionnel.
+
+    Returns:
+        tuple: (ligne pivot, pas, True si la variable sortante quitte la base à sa borne supérieure).
+               La ligne vaut None pour un changement de borne, ou si le pas est infini (problème non borné).
+    """
+    column = np.asarray(column, dtype=float)
+    values = np.asarray(values, dtype=float)
+    upper = np.asarray(upper, dtype=float)
+
+    decreasing = column > pivot_tolerance
+    increasing = (column < -pivot_tolerance) & np.isfinite(upper)
+
+    if order is not None:
+        ratios = np.full(column.shape, np.inf)
+        np.divide(np.maximum(values, 0.0), column, out=ratios, where=decreasing)
+        np.divide(np.maximum(upper - values, 0.0), -column, out=ratios, where=increasing)
+        step = ratios.min(initial=np.inf)
+        if entering_range <= step:
+            return None, float(entering_range), False
+        ties = np.flatnonzero(ratios <= step + primal_tolerance)
+        ligne_pivot = int(ties[np.argmin(np.asarray(order)[ties])])
+        return ligne_pivot, float(ratios[ligne_pivot]), bool(increasing[ligne_pivot])
+
+    # Passe 1 : pas maximal avec bornes relâchées
+    relaxed = np.full(column.shape, np.inf)
+    np.divide(values + primal_tolerance, column, out=relaxed, where=decreasing)
+    np.divide(upper - values + primal_tolerance, -column, out=relaxed, where=increasing)
+    max_step = relaxed.min(initial=np.inf)
+
+    if entering_range <= max_step:
+        return None, float(entering_range), False
+
+    # Passe 2 : plus grand pivot parmi les ratios exacts sous ce pas
+    ratios = np.full(column.shape, np.inf)
+    np.divide(values, column, out=ratios, where=decreasing)
+    np.divide(upper - values, -column, out=ratios, where=increasing)
+    candidates = (decreasing | increasing) & (ratios <= max_step)
+    ligne_pivot = int(np.argmax(np.where(candidates, np.abs(column), -np.inf)))
+    return ligne_pivot, max(float(ratios[ligne_pivot]), 0.0), bool(increasing[ligne_pivot])
+
+
+if __name__ == '__main__':
+    # Exemple d'utilisation : deux lignes presque à égalité, la seconde a un pivot bien plus grand
+    column = [1e-6, 2.0, -1.0]
+    rhs = [0.0, 1e-12, 3.0]
+
+    print("Ligne pivot (Harris) :", harris_ratio_test(column, rhs))
+    print("Ligne pivot (ratio minimal strict) :", int(np.argmin([r / a if a > 0 else np.inf for r, a in zip(rhs, column)])))
+
+    # Deux lignes dégénérées ex æquo : départage par les lignes de B^-1 = I
+    column = [1.0, 2.0, 1.0]
+    rhs = [0.0, 0.0, 5.0]
+    print("Ligne pivot (lexicographique) :", lexicographic_ratio_test(column, rhs, lambda i: np.eye(3)[i]))
+
+    # Variable entrante bornée à 1 : elle change de borne avant que la première ligne ne s'annule
+    print("Test borné :", bounded_ratio_test([1.0, -1.0], [2.0, 0.5], [np.inf, 1.0], entering_range=0.4))
@@ -0,0 +1,379 @@
+import time
+from typing import Final, Optional
+
+import numpy as np
+from scipy import sparse
+from scipy.linalg import lu_factor, lu_solve
+from scipy.sparse.linalg import splu
+
+from basis import Basis
+from instrumentation import IterationEvent, SolveObserver, make_observer
+from perturbation import DegeneracyMonitor, make_perturbation
+from ratio_test import PRIMAL_TOLERANCE, harris_ratio_test, lexicographic_ratio_test
+from solution import INFEASIBLE, OPTIMAL, UNBOUNDED, Solution
+
+
+TOLERANCE: Final[float] = 1e-9
+REFACTORIZATION_FREQUENCY: Final[int] = 50
+
+
+class BasisFactorization:
+    """
+    Factorisation LU de la matrice de base, mise à jour sous forme produit (fichier eta).
+
+    Une base creuse est factorisée par SuperLU, une base dense par LAPACK.
+
+    Args:
+        refactorization_frequency: Nombre de mises à jour eta avant refactorisation complète.
+    """
+    refactorization_frequency: int
+
+    def __init__(self, refactorization_frequency: int = REFACTORIZATION_FREQUENCY) -> None:
+        self.refactorization_frequency = refactorization_frequency
+        self._lu = None
+        self._etas: list[tuple[int, np.ndarray]] = []
+
+    def factorize(self, basis_matrix) -> None:
+        if sparse.issparse(basis_matrix):
+            self._lu = splu(sparse.csc_matrix(basis_matrix))
+        else:
+            self._lu = lu_factor(basis_matrix)
+        self._etas.clear()
+
+    def _solve(self, a: np.ndarray, transposed: bool = False) -> np.ndarray:
+        if isinstance(self._lu, tuple):
+            return lu_solve(self._lu, a, trans=1 if transposed else 0)
+        return self._lu.solve(a, trans='T' if transposed else 'N')
+
+    def needs_refactorization(self) -> bool:
+        return len(self._etas) >= self.refactorization_frequency
+
+    def ftran(self, a: np.ndarray) -> np.ndarray:
+        """Résout B x = a."""
+        x = self._solve(np.asarray(a, dtype=float))
+        for ligne, eta in self._etas:
+            pivot_value = x[ligne]
+            if pivot_value != 0.0:
+                x += pivot_value * eta
+                x[ligne] = pivot_value * eta[ligne]
+        return x
+
+    def btran(self, c: np.ndarray) -> np.ndarray:
+        """Résout y B = c."""
+        y = np.array(c, dtype=float)
+        for ligne, eta in reversed(self._etas):
+            y[ligne] = y @ eta
+        return self._solve(y, transposed=True)
+
+    def update(self, ligne_pivot: int, direction: np.ndarray) -> None:
+        """
+        Enregistre le changement de base sous forme d'une matrice eta.
+
+        Args:
+            ligne_pivot: Ligne de la variable sortante.
+            direction: Colonne entrante exprimée dans la base courante (B^-1 a_q).
+        """
+        pivot_value = direction[ligne_pivot]
+        eta = -direction / pivot_value
+        eta[ligne_pivot] = 1.0 / pivot_value
+        self._etas.append((ligne_pivot, eta))
+
+
+class RevisedSimplex:
+    """
+    Simplexe révisé : seule une factorisation de la base est conservée, jamais le tableau complet.
+
+    Une matrice creuse est conservée au format CSC et n'est jamais densifiée : le pricing,
+    l'extraction des colonnes et la factorisation de la base ne manipulent que ses éléments non nuls.
+
+    Args:
+        A: Matrice des contraintes (m x n, dense ou creuse), contraintes A x <= b.
+        b: Second membre (positif ou nul).
+        c: Coefficients de la fonction objectif à maximiser.
+        refactorization_frequency: Nombre de pivots entre deux refactorisations.
+        basis: Base de départ optionnelle (redémarrage à chaud) ; seule sa factorisation est recalculée.
+        lexicographic: Utilise le test du ratio lexicographique (lignes de B^-1 obtenues par btran).
+        perturbation: Perturbe le second membre lorsque la résolution stagne sur un sommet dégénéré.
+    """
+    basis: np.ndarray
+    iterations: int
+    lexicographic: bool
+    perturbation: bool
+    observer: Optional[SolveObserver]
+
+    def __init__(self, A, b, c,
+                 refactorization_frequency: int = REFACTORIZATION_FREQUENCY,
+                 basis: Optional[Basis] = None,
+                 lexicographic: bool = False,
+                 perturbation: bool = True) -> None:
+        self._A = sparse.csc_matrix(A, dtype=float) if sparse.issparse(A) else np.asarray(A, dtype=float)
+        self._b = np.asarray(b, dtype=float)
+        self._c = np.asarray(c, dtype=float)
+        self._constraints_count, self._variables_count = self._A.shape
+
+        if basis is not None:
+            self.basis = basis.basic.astype(np.intp)
+        elif np.any(self._b < 0):
+            raise ValueError("Le simplexe révisé nécessite une base initiale réalisable (b >= 0)")
+        else:
+            self.basis = np.arange(self._variables_count, self._variables_count + self._constraints_count)
+        self.iterations = 0
+        self.lexicographic = lexicographic
+        self.perturbation = perturbation
+        self.observer = None
+        self._factorization = BasisFactorization(refactorization_frequency)
+        self._refactorize()
+
+    def _column(self, j: int) -> np.ndarray:
+        if j < self._variables_count and not sparse.issparse(self._A):
+            return self._A[:, j]
+
+        column = np.zeros(self._constraints_count)
+        if j < self._variables_count:
+            start, end = self._A.indptr[j], self._A.indptr[j + 1]
+            column[self._A.indices[start:end]] = self._A.data[start:end]
+        else:
+            column[j - self._variables_count] = 1.0
+        return column
+
+    def _costs(self, indices: np.ndarray) -> np.ndarray:
+        costs = np.zeros(len(indices))
+        structural = indices < self._variables_count
+        costs[structural] = self._c[indices[structural]]
+        return costs
+
+    def _basis_matrix(self):
+        structural = self.basis < self._variables_count
+        slack_rows = self.basis[~structural] - self._variables_count
+        slack_positions = np.flatnonzero(~structural)
+
+        if sparse.issparse(self._A):
+            # Les colonnes d'écart sont ajoutées comme triplets, sans passer par une matrice dense
+            structural_part = self._A[:, self.basis[structural]].tocoo()
+            positions = np.flatnonzero(structural)
+            rows = np.concatenate((structural_part.row, slack_rows))
+            columns = np.concatenate((positions[structural_part.col], slack_positions))
+            data = np.concatenate((structural_part.data, np.ones(len(slack_rows))))
+            return sparse.csc_matrix((data, (rows, columns)),
+                                     shape=(self._constraints_count, self._constraints_count))
+
+        basis_matrix = np.zeros((self._constraints_count, self._constraints_count))
+        basis_matrix[:, structural] = self._A[:, self.basis[structural]]
+        basis_matrix[slack_rows, slack_positions] = 1.0
+        return basis_matrix
+
+    def _refactorize(self) -> None:
+        self._factorization.factorize(self._basis_matrix())
+        self._x_basis = self._factorization.ftran(self._b)
+
+    def _reduced_costs(self, y: np.ndarray) -> np.ndarray:
+        # Coûts réduits des colonnes structurelles puis des variables d'écart
+        reduced = np.concatenate((self._c - self._A.T @ y, -y))
+        reduced[self.basis] = 0.0
+        return reduced
+
+    def is_primal_feasible(self) -> bool:
+        return bool(np.all(self._x_basis >= -TOLERANCE))
+
+    def is_dual_feasible(self) -> bool:
+        return bool(np.all(self._reduced_costs(self._factorization.btran(self._costs(self.basis))) <= TOLERANCE))
+
+    def get_pivot_column(self) -> Optional[int]:
+        y = self._factorization.btran(self._costs(self.basis))
+        reduced = self._reduced_costs(y)
+        colonne_pivot = int(np.argmax(reduced))
+        if reduced[colonne_pivot] <= TOLERANCE:
+            return None
+        return colonne_pivot
+
+    def get_pivot_line(self, direction: np.ndarray) -> Optional[int]:
+        if self.lexicographic:
+            return lexicographic_ratio_test(direction, self._x_basis, self._inverse_row)
+        return harris_ratio_test(direction, self._x_basis)
+
+    def _inverse_row(self, i: int) -> np.ndarray:
+        unit = np.zeros(self._constraints_count)
+        unit[i] = 1.0
+        return self._factorization.btran(unit)
+
+    def get_dual_pivot_line(self) -> Optional[int]:
+        ligne_pivot = int(np.argmin(self._x_basis))
+        if self._x_basis[ligne_pivot] >= -TOLERANCE:
+            return None
+        return ligne_pivot
+
+    def get_dual_pivot_column(self, ligne_pivot: int) -> Optional[int]:
+        # Ligne pivot du tableau implicite : e_r B^-1 [A | I]
+        rho = self._inverse_row(ligne_pivot)
+        row = np.concatenate((self._A.T @ rho, rho))
+        row[self.basis] = 0.0
+
+        negative = row < -TOLERANCE
+        if not negative.any():
+            return None
+
+        reduced = self._reduced_costs(self._factorization.btran(self._costs(self.basis)))
+        ratios = np.full(row.shape, np.inf)
+        np.divide(reduced, row, out=ratios, where=negative)
+        return int(np.argmin(ratios))
+
+    def _pivot(self, ligne_pivot: int, colonne_pivot: int, direction: np.ndarray) -> None:
+        step = self._x_basis[ligne_pivot] / direction[ligne_pivot]
+        self._x_basis -= step * direction
+        self._x_basis[ligne_pivot] = step
+
+        self.basis[ligne_pivot] = colonne_pivot
+        self._factorization.update(ligne_pivot, direction)
+        self.iterations += 1
+
+        if self._factorization.needs_refactorization():
+            self._refactorize()
+
+    def _notify(self, phase: str, entering: int, leaving: int, started: float, priced: float, tested: float) -> None:
+        updated = time.perf_counter()
+        x_basis = self._x_basis
+        self.observer.iteration(IterationEvent(phase, self.iterations, entering, leaving,
+                                               float(self._costs(self.basis) @ x_basis),
+                                               float(-x_basis[x_basis < 0].sum()),
+                                               priced - started, tested - priced, updated - tested))
+
+    def solve_dual(self) -> bool:
+        """
+        Itère le simplexe dual depuis une base duale réalisable jusqu'à la réalisabilité primale.
+
+        Returns:
+            bool: False si le problème est irréalisable, True sinon.
+        """
+        observer = self.observer
+        while True:
+            if observer is not None:
+                started = time.perf_counter()
+            ligne_pivot = self.get_dual_pivot_line()
+            if ligne_pivot is None:
+                return True
+
+            if observer is not None:
+                priced = time.perf_counter()
+            colonne_pivot = self.get_dual_pivot_column(ligne_pivot)
+            if colonne_pivot is None:
+                return False
+
+            if observer is not None:
+                tested = time.perf_counter()
+            leaving = int(self.basis[ligne_pivot])
+            self._pivot(ligne_pivot, colonne_pivot, self._factorization.ftran(self._column(colonne_pivot)))
+            if observer is not None:
+                self._notify("dual", colonne_pivot, leaving, started, priced, tested)
+
+    def solve(self) -> bool:
+        """
+        Itère jusqu'à l'optimalité.
+
+        Lorsque la résolution stagne sur un sommet dégénéré, b est remplacé par b + B delta
+        (delta donné par make_perturbation), ce qui survit aux refactorisations. Le b exact est
+        rétabli à l'optimum, suivi d'une phase de nettoyage par le simplexe dual.
+
+        Returns:
+            bool: False si le problème est non borné, True sinon.
+        """
+        monitor = DegeneracyMonitor()
+        exact_b = None
+        observer = self.observer
+
+        while True:
+            if observer is not None:
+                started = time.perf_counter()
+            colonne_pivot = self.get_pivot_column()
+            if colonne_pivot is None:
+                break
+
+            if observer is not None:
+                priced = time.perf_counter()
+            direction = self._factorization.ftran(self._column(colonne_pivot))
+            ligne_pivot = self.get_pivot_line(direction)
+            if ligne_pivot is None:
+                if exact_b is not None:
+                    self._b = exact_b
+                    self._refactorize()
+                return False
+
+            if exact_b is None and self.perturbation and not self.lexicographic \
+                    and monitor.record(self._x_basis[ligne_pivot] <= PRIMAL_TOLERANCE):
+                delta = make_perturbation(self._x_basis)
+                exact_b = self._b
+                self._b = self._b + self._basis_matrix() @ delta
+                self._x_basis = self._x_basis + delta
+                continue
+
+            if observer is not None:
+                tested = time.perf_counter()
+            leaving = int(self.basis[ligne_pivot])
+            self._pivot(ligne_pivot, colonne_pivot, direction)
+            if observer is not None:
+                self._notify("primal", colonne_pivot, leaving, started, priced, tested)
+
+        if exact_b is None:
+            return True
+
+        self._b = exact_b
+        self._refactorize()
+        return self.solve_dual() and self.solve()
+
+    def solution(self) -> tuple[np.ndarray, float]:
+        x = np.zeros(self._variables_count)
+        structural = self.basis < self._variables_count
+        x[self.basis[structural]] = self._x_basis[structural]
+        return x, float(self._c @ x)
+
+    def duals(self) -> np.ndarray:
+        return self._factorization.btran(self._costs(self.basis))
+
+
+def solve_revised(A, b, c,
+                  refactorization_frequency: int = REFACTORIZATION_FREQUENCY,
+                  basis: Optional[Basis] = None,
+                  lexicographic: bool = False,
+                  perturbation: bool = True,
+                  observer=None) -> Solution:
+    start = time.perf_counter()
+    observer = make_observer(observer)
+    engine = RevisedSimplex(A, b, c, refactorization_frequency, basis, lexicographic, perturbation)
+    if observer is not None:
+        observer.start("revised", (len(b), len(c)))
+    engine.observer = observer
+
+    if not engine.is_primal_feasible():
+        if not engine.is_dual_feasible():
+            engine = RevisedSimplex(A, b, c, refactorization_frequency,
+                                    lexicographic=lexicographic, perturbation=perturbation)
+            engine.observer = observer
+        elif not engine.solve_dual():
+            solution = Solution(INFEASIBLE, iterations=engine.iterations, basis=engine.basis,
+                                elapsed=time.perf_counter() - start)
+            if observer is not None:
+                observer.finish(solution.status, solution.iterations)
+            return solution
+
+    if not engine.solve():
+        solution = Solution(UNBOUNDED, iterations=engine.iterations, basis=engine.basis,
+                            elapsed=time.perf_counter() - start)
+    else:
+        x, z = engine.solution()
+        solution = Solution(OPTIMAL, x, z, engine.iterations, engine.basis, time.perf_counter() - start, engine.duals())
+
+    if observer is not None:
+        observer.finish(solution.status, solution.iterations)
+    return solution
+
+
+if __name__ == '__main__':
+    # Exemple d'utilisation
+    A = [[1, 1], [2, 1]]
+    b = [4, 6]
+    c = [3, 2]
+
+    solution = solve_revised(A, b, c)
+
+    print("Solution optimale :", solution.x)
+    print("Valeur optimale de la fonction objectif :", solution.z)
+    print("Nombre de pivots :", solution.iterations)
@@ -0,0 +1,152 @@
+from typing import Final, Optional
+
+import numpy as np
+from scipy import sparse
+
+
+GEOMETRIC_PASSES: Final[int] = 4
+
+
+def _power_of_two(factors: np.ndarray) -> np.ndarray:
+    # Des facteurs puissances de 2 ne provoquent aucune erreur d'arrondi
+    return np.exp2(np.round(np.log2(factors)))
+
+
+class Scaling:
+    """
+    Facteurs d'échelle des lignes (R) et des colonnes (S) : le problème résolu est
+    max (S c) x', (R A S) x' <= R b, avec x = S x' et y = R y'.
+
+    Args:
+        row_scale: Facteurs des lignes (m).
+        column_scale: Facteurs des colonnes (n).
+    """
+    row_scale: np.ndarray
+    column_scale: np.ndarray
+
+    def __init__(self, row_scale: np.ndarray, column_scale: np.ndarray) -> None:
+        self.row_scale = row_scale
+        self.column_scale = column_scale
+
+    def scale(self, A, b, c) -> tuple:
+        """
+        Applique les facteurs d'échelle au problème.
+
+        Returns:
+            tuple: (A, b, c) mis à l'échelle ; A reste creuse si elle l'était.
+        """
+        if sparse.issparse(A):
+            scaled = sparse.diags(self.row_scale) @ A @ sparse.diags(self.column_scale)
+        else:
+            scaled = self.row_scale[:, None] * np.asarray(A, dtype=float) * self.column_scale[None, :]
+        return (scaled,
+                self.row_scale * np.asarray(b, dtype=float),
+                self.column_scale * np.asarray(c, dtype=float))
+
+    def unscale_primal(self, x) -> np.ndarray:
+        return self.column_scale * np.asarray(x, dtype=float)
+
+    def unscale_dual(self, y) -> np.ndarray:
+        return self.row_scale * np.asarray(y, dtype=float)
+
+
+def compute_scaling(A, passes: int = GEOMETRIC_PASSES, equilibrate: bool = True) -> Scaling:
+    """
+    Calcule des facteurs d'échelle par moyennes géométriques puis équilibrage.
+
+    Chaque passe géométrique divise les lignes puis les colonnes par sqrt(min |a| * max |a|)
+    sur leurs éléments non nuls ; l'équilibrage ramène ensuite le plus grand élément de
+    chaque ligne puis de chaque colonne à 1. Seuls les éléments non nuls sont parcourus.
+
+    Args:
+        A: Matrice des contraintes (m x n, dense ou creuse).
+        passes: Nombre de passes géométriques.
+        equilibrate: Applique l'équilibrage après les passes géométriques.
+
+    Returns:
+        Scaling: Facteurs d'échelle, arrondis à des puissances de 2.
+    """
+    matrix = sparse.coo_matrix(A)
+    rows, columns = matrix.row, matrix.col
+    magnitudes = np.abs(matrix.data.astype(float))
+    nonzero = magnitudes > 0
+    rows, columns, magnitudes = rows[nonzero], columns[nonzero], magnitudes[nonzero]
+
+    constraints_count, variables_count = matrix.shape
+    row_scale = np.ones(constraints_count)
+    column_scale = np.ones(variables_count)
+
+    def extremes(index: np.ndarray, values: np.ndarray, size: int) -> tuple[np.ndarray, np.ndarray]:
+        smallest = np.full(size, np.inf)
+        largest = np.zeros(size)
+        np.minimum.at(smallest, index, values)
+        np.maximum.at(largest, index, values)
+        empty = largest == 0
+        smallest[empty], largest[empty] = 1.0, 1.0
+        return smallest, largest
+
+    def current() -> np.ndarray:
+        return magnitudes * row_scale[rows] * column_scale[columns]
+
+    for _ in range(passes):
+        smallest, largest = extremes(rows, current(), constraints_count)
+        row_scale /= np.sqrt(smallest * largest)
+        smallest, largest = extremes(columns, current(), variables_count)
+        column_scale /= np.sqrt(smallest * largest)
+
+    if equilibrate:
+        _, largest = extremes(rows, current(), constraints_count)
+        row_scale /= largest
+        _, largest = extremes(columns, current(), variables_count)
+        column_scale /= largest
+
+    return Scaling(_power_of_two(row_scale), _power_of_two(column_scale))
+
+
+def scaled_solve(solver, A, b, c, scaling: Optional[Scaling] = None, **options):
+    """
+    Résout le problème mis à l'échelle puis remet x et les prix duaux dans les unités d'origine.
+
+    La valeur de l'objectif est invariante : (S c) x' = c x. Les bornes des variables
+    (options lower et upper) sont divisées par S.
+
+    Args:
+        solver: Moteur de résolution (voir SOLVERS).
+        A: Matrice des contraintes.
+        b: Second membre des contraintes.
+        c: Coefficients de la fonction objectif à maximiser.
+        scaling: Facteurs d'échelle ; calculés par compute_scaling si None.
+
+    Returns:
+        Solution: Solution exprimée dans les unités d'origine.
+    """
+    scaling = compute_scaling(A) if scaling is None else scaling
+    for bound in ("lower", "upper"):
+        if options.get(bound) is not None:
+            options[bound] = np.asarray(options[bound], dtype=float) / scaling.column_scale
+    solution = solver(*scaling.scale(A, b, c), **options)
+    if solution.x is not None:
+        solution.x = scaling.unscale_primal(solution.x)
+    if solution.duals is not None:
+        solution.duals = scaling.unscale_dual(solution.duals)
+    return solution
+
+
+if __name__ == '__main__':
+    # Effet de la mise à l'échelle sur le nombre de pivots d'un problème mal conditionné
+    from tableau import solve_tableau
+
+    rng = np.random.default_rng(0)
+    for size in (20, 40, 80):
+        A = rng.uniform(0.1, 1, (size, 2 * size))
+        row_factors = 10.0 ** rng.uniform(-4, 4, size)
+        column_factors = 10.0 ** rng.uniform(-4, 4, 2 * size)
+        A = row_factors[:, None] * A * column_factors[None, :]
+        b = row_factors * rng.uniform(1, 10, size)
+        c = rng.uniform(0.1, 1, 2 * size) * column_factors
+
+        plain = solve_tableau(A, b, c)
+        scaled = scaled_solve(solve_tableau, A, b, c)
+
+        print(f"{size} x {2 * size} : {plain.iterations} pivots sans mise à l'échelle (z = {plain.z:.6g}), "
+              f"{scaled.iterations} avec (z = {scaled.z:.6g})")
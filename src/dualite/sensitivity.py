@@ -0,0 +1,173 @@
+from typing import Final, Optional
+
+import numpy as np
+
+from basis import AT_UPPER, Basis
+from solution import Solution
+from tableau import create_tableau_from_basis, find_basis
+
+
+TOLERANCE: Final[float] = 1e-9
+
+
+def _ranges(values: np.ndarray, directions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # Pour chaque colonne k de directions : plus grand intervalle [lower_k, upper_k] de t
+    # tel que values + t * directions[:, k] >= 0 (test du ratio vectorisé sur toutes les colonnes)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratios = -values[:, None] / directions
+    upper = np.where(directions < -TOLERANCE, ratios, np.inf).min(axis=0)
+    lower = np.where(directions > TOLERANCE, ratios, -np.inf).max(axis=0)
+    # Une valeur déjà légèrement négative (bruit numérique) ne doit pas inverser l'intervalle
+    return np.minimum(lower, 0.0), np.maximum(upper, 0.0)
+
+
+class SensitivityReport:
+    """
+    Analyse post-optimale d'une base optimale de max c x, A x <= b, x >= 0.
+
+    Toutes les grandeurs sont lues sur le tableau final (lignes B^-1 [A | I | b], ligne
+    objectif c_B B^-1 [A | I] - [c | 0]) : aucune nouvelle résolution n'est nécessaire.
+    Les intervalles de stabilité sont donnés en variations admissibles [baisse, hausse] de
+    chaque coefficient pris isolément, pour lesquelles la base reste optimale.
+
+    Args:
+        tableau: Tableau final du simplexe (liste de listes ou tableau numpy).
+        variables_count: Nombre de variables de décision.
+        basis: Colonne de base de chaque ligne ; retrouvée sur le tableau si None.
+    """
+    basis: np.ndarray
+    x: np.ndarray
+    z: float
+    duals: np.ndarray
+    reduced_costs: np.ndarray
+    rhs_changes: np.ndarray
+    objective_changes: np.ndarray
+    variables_count: int
+
+    def __init__(self, tableau, variables_count: int, basis=None) -> None:
+        tableau = np.asarray(tableau, dtype=float)
+        self.variables_count = variables_count
+        self.basis = find_basis(tableau) if basis is None else np.asarray(basis, dtype=np.intp)
+        self._body = tableau[:-1, :-1]
+        self._values = tableau[:-1, -1]
+        self._objective_row = tableau[-1, :-1]
+        if np.any(self._values < -TOLERANCE) or np.any(self._objective_row < -TOLERANCE):
+            raise ValueError("L'analyse de sensibilité nécessite une base optimale")
+
+        self.x = np.zeros(variables_count)
+        structural = self.basis < variables_count
+        self.x[self.basis[structural]] = self._values[structural]
+        self.z = float(tableau[-1, -1])
+
+        # Prix duaux y = c_B B^-1 ; coûts réduits c_j - y A_j (négatifs ou nuls à l'optimum)
+        self.duals = self._objective_row[variables_count:].copy()
+        self.reduced_costs = 0.0 - self._objective_row[:variables_count]
+
+        # Second membre : x_B + t B^-1 e_i >= 0, les colonnes de B^-1 étant celles des écarts
+        lower, upper = _ranges(self._values, self._body[:, variables_count:])
+        self.rhs_changes = np.column_stack((lower, upper))
+
+        # Objectif, variable hors base : elle entre en base lorsque c_j dépasse c_j + d_j
+        self.objective_changes = np.column_stack((np.full(variables_count, -np.inf), self._objective_row[:variables_count]))
+        # Variable de base de la ligne r : d_k + t alpha_rk >= 0 pour toutes les colonnes hors base k
+        nonbasic = np.ones(len(self._objective_row), dtype=bool)
+        nonbasic[self.basis] = False
+        rows = np.flatnonzero(structural)
+        lower, upper = _ranges(self._objective_row[nonbasic], self._body[np.ix_(rows, nonbasic)].T)
+        self.objective_changes[self.basis[rows]] = np.column_stack((lower, upper))
+
+    @classmethod
+    def from_basis(cls, A, b, c, basis) -> 'SensitivityReport':
+        """
+        Analyse une base optimale, par exemple celle d'une Solution de l'un des moteurs.
+
+        Le tableau est reconstruit une seule fois depuis la base (voir create_tableau_from_basis).
+
+        Args:
+            A: Matrice des contraintes (m x n, dense ou creuse).
+            b: Second membre des contraintes (m).
+            c: Coefficients de la fonction objectif à maximiser (n).
+            basis: Basis, ou Solution optimale contenant sa base.
+        """
+        if isinstance(basis, Solution):
+            basis = Basis.from_solution(basis)
+        if np.any(basis.status == AT_UPPER):
+            raise ValueError("L'analyse de sensibilité ne gère pas les variables à leur borne supérieure")
+        return cls(create_tableau_from_basis(A, b, c, basis), len(c), basis.basic)
+
+    def rhs_ranges(self, b) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: Intervalle (m x 2) de chaque b_i sur lequel la base reste optimale.
+        """
+        return np.asarray(b, dtype=float)[:, None] + self.rhs_changes
+
+    def objective_ranges(self, c) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: Intervalle (n x 2) de chaque c_j sur lequel la base reste optimale.
+        """
+        return np.asarray(c, dtype=float)[:, None] + self.objective_changes
+
+    def rhs_change(self, delta) -> Optional[float]:
+        """
+        Valeur de l'objectif après la modification simultanée b + delta, sans nouvelle résolution.
+
+        Args:
+            delta: Variation de chaque b_i (m).
+
+        Returns:
+            float: z + y delta si la base reste réalisable, None sinon (une résolution est nécessaire).
+        """
+        delta = np.asarray(delta, dtype=float)
+        values = self._values + self._body[:, self.variables_count:] @ delta
+        if np.any(values < -TOLERANCE):
+            return None
+        return self.z + float(self.duals @ delta)
+
+    def objective_change(self, delta) -> Optional[float]:
+        """
+        Valeur de l'objectif après la modification simultanée c + delta, sans nouvelle résolution.
+
+        Args:
+            delta: Variation de chaque c_j (n).
+
+        Returns:
+            float: z + delta x si la base reste optimale, None sinon (une résolution est nécessaire).
+        """
+        delta = np.asarray(delta, dtype=float)
+        costs = np.zeros(len(self._objective_row))
+        costs[:self.variables_count] = delta
+        objective_row = self._objective_row + costs[self.basis] @ self._body - costs
+        if np.any(objective_row < -TOLERANCE):
+            return None
+        return self.z + float(delta @ self.x)
+
+    def __str__(self) -> str:
+        lines = ["Contraintes : prix dual, variation admissible de b",
+                 *(f"  {i + 1:>4} : {self.duals[i]:12.6g}  [{low:.6g}, {high:.6g}]"
+                   for i, (low, high) in enumerate(self.rhs_changes)),
+                 "Variables : valeur, coût réduit, variation admissible de c",
+                 *(f"  x{j + 1:<3} : {self.x[j]:12.6g} {self.reduced_costs[j]:12.6g}  [{low:.6g}, {high:.6g}]"
+                   for j, (low, high) in enumerate(self.objective_changes))]
+        return "\n".join(lines)
+
+
+if __name__ == '__main__':
+    # Questions « et si ? » sur un problème de production, sans nouvelle résolution
+    from tableau import solve_tableau
+
+    A = np.array([[1.0, 1.0, 1.0], [2.0, 1.0, 0.0], [0.0, 1.0, 3.0]])
+    b = np.array([10.0, 12.0, 15.0])
+    c = np.array([3.0, 2.0, 4.0])
+
+    solution = solve_tableau(A, b, c)
+    report = SensitivityReport.from_basis(A, b, c, solution)
+    print(report)
+    print("Intervalles de b :", report.rhs_ranges(b).tolist())
+    print("Intervalles de c :", report.objective_ranges(c).tolist())
+
+    delta = np.array([1.0, 0.0, 0.0])
+    print(f"b1 + 1 : z = {report.rhs_change(delta)} (nouvelle résolution : {solve_tableau(A, b + delta, c).z})")
+    delta = np.array([0.5, 0.0, 0.0])
+    print(f"c1 + 0.5 : z = {report.objective_change(delta)} (nouvelle résolution : {solve_tableau(A, b, c + delta).z})")
@@ -0,0 +1,91 @@
+import time
+from typing import Optional
+
+from basis import Basis
+from instrumentation import make_observer
+from solution import INFEASIBLE, OPTIMAL, UNBOUNDED, Solution
+from tableau import TableauSimplex
+
+
+def _dual_engine(A, b, c, tableau=None, basis: Optional[Basis] = None) -> TableauSimplex:
+    if tableau is not None:
+        engine = TableauSimplex(tableau, len(c))
+    elif basis is not None:
+        engine = TableauSimplex.from_basis(A, b, c, basis)
+    else:
+        engine = TableauSimplex.from_problem(A, b, c)
+
+    if not engine.is_dual_feasible() and not engine.is_primal_feasible():
+        raise ValueError("Le simplexe dual nécessite une base duale réalisable")
+    return engine
+
+
+def simplexe_dual(A, b, c, tableau=None, basis=None, pricing="dantzig"):
+    """
+    Résout max c x, A x <= b, x >= 0 par le simplexe dual sur le tableau numpy.
+
+    La base de départ (variables d'écart, tableau ou base sauvegardée) doit être duale
+    réalisable : c'est le cas d'une base optimale après ajout de coupes ou resserrement de b.
+
+    Args:
+        A: Matrice des contraintes (m x n).
+        b: Second membre des contraintes (m), éventuellement négatif.
+        c: Coefficients de la fonction objectif à maximiser (n).
+        tableau: Tableau de départ optionnel.
+        basis: Base de départ optionnelle.
+        pricing: Règle de choix de la ligne sortante ("dantzig" ou "steepest_edge").
+
+    Returns:
+        tuple: (x, z, tableau), ou None si le problème est irréalisable.
+    """
+    engine = _dual_engine(A, b, c, tableau, basis)
+
+    if not engine.solve_dual(pricing) or not engine.solve():
+        return None
+
+    x, z = engine.solution()
+    return x.tolist(), z, engine.tableau
+
+
+def solve_dual(A, b, c, basis: Optional[Basis] = None, pricing: str = "dantzig", observer=None) -> Solution:
+    start = time.perf_counter()
+    observer = make_observer(observer)
+    engine = _dual_engine(A, b, c, basis=basis)
+    if observer is not None:
+        observer.start("dual", (len(b), len(c)))
+    engine.observer = observer
+
+    if not engine.solve_dual(pricing):
+        solution = Solution(INFEASIBLE, iterations=engine.iterations, basis=engine.basis,
+                            elapsed=time.perf_counter() - start)
+    # Nettoyage primal : aucun pivot si la base est restée duale réalisable
+    elif not engine.solve():
+        solution = Solution(UNBOUNDED, iterations=engine.iterations, basis=engine.basis,
+                            elapsed=time.perf_counter() - start)
+    else:
+        x, z = engine.solution()
+        solution = Solution(OPTIMAL, x, z, engine.iterations, engine.basis, time.perf_counter() - start, engine.duals())
+
+    if observer is not None:
+        observer.finish(solution.status, solution.iterations)
+    return solution
+
+
+if __name__ == '__main__':
+    # Exemple d'utilisation : ajout d'une coupe x1 <= 1 après la résolution
+    A = [[1, 1], [2, 1]]
+    b = [4, 6]
+    c = [3, 2]
+
+    x, z, tableau = simplexe_dual(A, b, c, pricing="steepest_edge")
+
+    print("Solution optimale :", x)
+    print("Valeur optimale de la fonction objectif :", z)
+
+    solution = solve_dual(A, b, c)
+    basis = Basis.from_solution(solution).add_rows(1)
+    solution = solve_dual(A + [[1, 0]], b + [1], c, basis=basis)
+
+    print("Solution après ajout de la coupe :", solution.x)
+    print("Valeur optimale de la fonction objectif :", solution.z)
+    print("Nombre de pivots duaux :", solution.iterations)
@@ -1,4 +1,20 @@
-from typing import Final, NewType, Sequence, TypeAlias, TypeVar, MutableSequence
+import time
+from typing import Callable, Final, NewType, Optional, Sequence, TypeAlias, TypeVar, MutableSequence
+
+import numpy as np
+from scipy import sparse
+
+from bounded import normalize_bounds, solve_bounded
+from interior import solve_interior
+from instrumentation import IterationEvent, ProgressPrinter, SolveObserver, TimingProfile, make_observer
+from ratio_test import PIVOT_TOLERANCE, PRIMAL_TOLERANCE, harris_ratio_test
+from revised import solve_revised
+from scaling import compute_scaling, scaled_solve
+from sensitivity import SensitivityReport
+from simplexe_dual import solve_dual
+from solution import INFEASIBLE, OPTIMAL, UNBOUNDED, Solution
+from basis import Basis
+from tableau import TableauSimplex, export_basis, find_basis, solve_tableau, warm_start
 
 
 T = TypeVar('T')
@@ -8,19 +24,41 @@ ConstraintsMatrix = NewType('ConstraintsMatrix', Matrix[float])
 ConstantConstraintVector = NewType('ConstantConstraintVector', Sequence[float])
 ObjectiveFunctionVector = NewType('ObjectiveFunctionVector', Sequence[float])
 
+SOLVERS: Final[dict[str, Callable[..., Solution]]] = {
+    "tableau": solve_tableau,
+    "revised": solve_revised,
+    "dual": solve_dual,
+    "bounded": solve_bounded,
+    "interior": solve_interior,
+}
+
+def get_shape(A: ConstraintsMatrix) -> tuple[int, int]:
+    if sparse.issparse(A):
+        return A.shape
+    constraints_count = len(A)
+    return constraints_count, len(A[0]) if constraints_count > 0 else 0
+
+
 def create_empty_matrix(lines: int, columns: int) -> MutableMatrix[float]:
     return [[0.0] * columns for _ in range(lines)]
 
 
 def create_initial_matrix(A: ConstraintsMatrix, b: ConstantConstraintVector, c: ObjectiveFunctionVector) -> Matrix[float]:
-    constraints_count = len(A)
-    variables_count = len(A[0]) if constraints_count > 0 else 0
+    constraints_count, variables_count = get_shape(A)
 
     tableau = create_empty_matrix(constraints_count + 1, variables_count + constraints_count + 1)
+
+    if sparse.issparse(A):
+        # Seuls les éléments non nuls sont recopiés dans le tableau
+        A = sparse.coo_matrix(A)
+        A.sum_duplicates()
+        for i, j, value in zip(A.row.tolist(), A.col.tolist(), A.data.tolist()):
+            tableau[i][j] = value
     
     for i in range(constraints_count):
-         for j in range(variables_count):
-             tableau[i][j] = A[i][j]
+         if not sparse.issparse(A):
+             for j in range(variables_count):
+                 tableau[i][j] = A[i][j]
          tableau[i][variables_count+i] = 1.0
          tableau[i][-1] = b[i]
          
@@ -30,6 +68,15 @@ def create_initial_matrix(A: ConstraintsMatrix, b: ConstantConstraintVector, c:
     return tableau
 
 
+def get_solver(A, method: Optional[str] = None) -> Callable[..., Solution]:
+    # Une matrice creuse n'est jamais densifiée : seul le simplexe révisé la conserve telle quelle
+    if method is None:
+        method = "revised" if sparse.issparse(A) else "tableau"
+    if method not in SOLVERS:
+        raise ValueError(f"Méthode de résolution inconnue : {method}")
+    return SOLVERS[method]
+
+
 def is_optimal_solution_achieved(matrix: Matrix[float]) -> bool:
     LAST_ROW = matrix[-1]
 
@@ -44,38 +91,93 @@ def get_pivot_column(matrix: Matrix[float]) -> int:
     return min(range(len(matrix[0])), key=lambda j: matrix[-1][j])
 
 
-def get_pivot_line(matrix: Matrix[float], colonne_pivot: int) -> int:
-    ratios = []
-    for i in range(len(matrix)):
-        if matrix[i][colonne_pivot] > 0:
-            ratios.append(matrix[i][-1] / matrix[i][colonne_pivot])
-        else:
-            ratios.append(float('inf'))
-    return min(range(len(ratios)), key=lambda i: ratios[i])
+def get_pivot_line(matrix: Matrix[float], colonne_pivot: int,
+                   primal_tolerance: float = PRIMAL_TOLERANCE,
+                   pivot_tolerance: float = PIVOT_TOLERANCE) -> Optional[int]:
+    constraints = matrix[:-1]
+    return harris_ratio_test([row[colonne_pivot] for row in constraints],
+                             [row[-1] for row in constraints],
+                             primal_tolerance, pivot_tolerance)
 
 
-def simplexe_primal(A, b, c, tableau=None):
-    constraints_count = len(A)
-    variables_count = len(A[0]) if constraints_count > 0 else 0
+def _finish(observer: Optional[SolveObserver], status: str, iterations: int) -> None:
+    if observer is not None:
+        observer.finish(status, iterations)
+
+
+def simplexe_primal_numpy(A, b, c, tableau=None, basis=None, observer=None):
+    constraints_count, variables_count = get_shape(A)
+    observer = make_observer(observer)
+    if observer is not None:
+        observer.start("simplexe_primal_numpy", (constraints_count, variables_count))
 
+    feasible = True
+    if tableau is not None:
+        engine = TableauSimplex(tableau, variables_count)
+    elif basis is not None:
+        engine, feasible = warm_start(A, b, c, basis, observer=observer)
+    else:
+        engine = TableauSimplex.from_problem(A, b, c)
+    engine.observer = observer
 
+    if not feasible or not engine.solve():
+        _finish(observer, UNBOUNDED if feasible else INFEASIBLE, engine.iterations)
+        return None
+
+    _finish(observer, OPTIMAL, engine.iterations)
+    x, z = engine.solution()
+    return x.tolist(), z, engine.tableau
+
+
+def simplexe_primal(A, b, c, tableau=None, backend="list", basis=None, scaling=False, observer=None):
+    if scaling and tableau is None:
+        # Le tableau retourné reste celui du problème mis à l'échelle
+        factors = compute_scaling(A)
+        result = simplexe_primal(*factors.scale(A, b, c), backend=backend, basis=basis, observer=observer)
+        if result is None:
+            return None
+        x, z, tableau = result
+        return factors.unscale_primal(x).tolist(), z, tableau
+
+    if backend == "numpy" or basis is not None:
+        return simplexe_primal_numpy(A, b, c, tableau, basis, observer)
+    if backend != "list":
+        raise ValueError(f"Backend inconnu : {backend}")
+
+    constraints_count, variables_count = get_shape(A)
+    observer = make_observer(observer)
+    if observer is not None:
+        observer.start("simplexe_primal", (constraints_count, variables_count))
+
+    # En-tête de base : colonne de base de chaque ligne, tenu à jour à chaque pivot
     if tableau is None:
         tableau = create_initial_matrix(A, b, c)
-    
-
-    print(tableau)
+        basic_columns = list(range(variables_count, variables_count + constraints_count))
+    else:
+        basic_columns = find_basis(np.asarray(tableau, dtype=float)).tolist()
 
+    iterations = 0
     while True:
+        if observer is not None:
+            started = time.perf_counter()
         if is_optimal_solution_achieved(tableau):
             break
 
         colonne_pivot = get_pivot_column(tableau)
 
         if is_problem_unbounded(tableau, colonne_pivot):
+            _finish(observer, UNBOUNDED, iterations)
             return None
 
+        if observer is not None:
+            priced = time.perf_counter()
         ligne_pivot = get_pivot_line(tableau, colonne_pivot)
+        if ligne_pivot is None:
+            _finish(observer, UNBOUNDED, iterations)
+            return None
 
+        if observer is not None:
+            tested = time.perf_counter()
         pivot = tableau[ligne_pivot][colonne_pivot]
         for j in range(variables_count + constraints_count + 1):
             tableau[ligne_pivot][j] /= pivot
@@ -86,22 +188,25 @@ def simplexe_primal(A, b, c, tableau=None):
                 for j in range(variables_count + constraints_count + 1):
                     tableau[i][j] -= facteur * tableau[ligne_pivot][j]
 
+        leaving = basic_columns[ligne_pivot]
+        basic_columns[ligne_pivot] = colonne_pivot
+        iterations += 1
+
+        if observer is not None:
+            updated = time.perf_counter()
+            infeasibility = -sum(row[-1] for row in tableau[:-1] if row[-1] < 0)
+            observer.iteration(IterationEvent("primal", iterations, colonne_pivot, leaving, tableau[-1][-1],
+                                              infeasibility, priced - started, tested - priced, updated - tested))
+
+    _finish(observer, OPTIMAL, iterations)
+
+    # Lecture de x sur l'en-tête de base : O(m)
     x = [0.0] * variables_count
-    for i in range(variables_count):
-        colonne = -1
-        for k in range(constraints_count):
-            is_identity = True
-            for l in range(variables_count):
-                if abs(tableau[k][l] - (1.0 if l == i else 0.0)) > 1e-6:
-                    is_identity = False
-                    break
-            if is_identity:
-                colonne = k
-                break
-        if colonne != -1:
-            x[i] = tableau[colonne][-1]
-
-    z = -tableau[-1][-1]
+    for ligne, colonne in enumerate(basic_columns):
+        if colonne < variables_count:
+            x[colonne] = tableau[ligne][-1]
+
+    z = tableau[-1][-1]
 
     return x, z, tableau
 
@@ -110,40 +215,115 @@ class LinearProgram:
     _constraints_matrix: Final[Matrix[float]]
     _constant_constraint_vector: Final[Sequence[float]]
     _objective_function_vector: Final[Sequence[float]]
+    _lower: Final[Optional[np.ndarray]]
+    _upper: Final[Optional[np.ndarray]]
 
     def __init__(self, 
                  constraints_matrix: Matrix[float], 
                  constant_constraint_vector: Sequence[float], 
-                 objective_function_vector: Sequence[float]) -> None:
+                 objective_function_vector: Sequence[float],
+                 lower: Optional[Sequence[float]] = None,
+                 upper: Optional[Sequence[float]] = None) -> None:
         
+        if sparse.issparse(constraints_matrix):
+            constraints_matrix = sparse.csr_matrix(constraints_matrix)
+
         self._constraints_matrix = constraints_matrix
         self._constant_constraint_vector = constant_constraint_vector
         self._objective_function_vector = objective_function_vector
 
+        # Bornes natives des variables (par défaut 0 <= x) : elles n'ajoutent aucune contrainte
+        if lower is not None or upper is not None:
+            lower, upper = normalize_bounds(len(objective_function_vector), lower, upper)
+        self._lower = lower
+        self._upper = upper
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return get_shape(self._constraints_matrix)
+
+    def to_arrays(self) -> tuple:
+        """
+        Représentation compacte du programme : matrice float64 (dense ou CSR) et vecteurs numpy.
+        """
+        A = self._constraints_matrix if self.is_sparse() else np.asarray(self._constraints_matrix, dtype=float)
+        return (A,
+                np.asarray(self._constant_constraint_vector, dtype=float),
+                np.asarray(self._objective_function_vector, dtype=float))
+
+    def is_sparse(self) -> bool:
+        return sparse.issparse(self._constraints_matrix)
+
+    def has_bounds(self) -> bool:
+        return self._lower is not None
+
+    def bounds(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Bornes des variables : (lower, upper), 0 et +inf par défaut.
+        """
+        if self.has_bounds():
+            return self._lower, self._upper
+        return normalize_bounds(len(self._objective_function_vector))
+
+    def solve(self, method: Optional[str] = None, scaling: bool = False, **options) -> Solution:
+        if self.has_bounds():
+            # Seul le simplexe à variables bornées traite les bornes sans les transformer en contraintes
+            if method not in (None, "bounded"):
+                raise ValueError(f"La méthode {method} ne gère pas les bornes des variables : utiliser \"bounded\"")
+            method = "bounded"
+            options = {"lower": self._lower, "upper": self._upper, **options}
+
+        solver = get_solver(self._constraints_matrix, method)
+        if scaling:
+            return scaled_solve(solver, *self.to_arrays(), **options)
+        return solver(self._constraints_matrix,
+                      self._constant_constraint_vector,
+                      self._objective_function_vector,
+                      **options)
+
+    def sensitivity(self, solution: Optional[Solution] = None) -> SensitivityReport:
+        """
+        Analyse post-optimale : prix duaux, coûts réduits et intervalles de stabilité de b et c.
+
+        Args:
+            solution: Solution optimale contenant sa base ; le programme est résolu si None.
+
+        Returns:
+            SensitivityReport: Analyse de la base optimale, sans nouvelle résolution.
+        """
+        if self.has_bounds():
+            raise ValueError("L'analyse de sensibilité ne gère pas les bornes des variables")
+        if solution is None:
+            solution = self.solve()
+        if solution.status != OPTIMAL:
+            raise ValueError(f"L'analyse de sensibilité nécessite une solution optimale (statut : {solution.status})")
+        return SensitivityReport.from_basis(*self.to_arrays(), solution)
     
     def __str__(self) -> str:
-        result = ""
-
-        result += "Programme linéaire :\n"
-        result += "Maximiser z = "
-        for i in range(len(self._objective_function_vector)):
-            result += f"{self._objective_function_vector[i]} * x{i+1}"
-            if i < len(self._objective_function_vector) - 1:
-                result += " + "
-        result += "\n"
-
-        result += "Sous les contraintes :\n"
-        for i in range(len(self._constraints_matrix)):
-            for j in range(len(self._constraints_matrix[0])):
-                result += f"{self._constraints_matrix[i][j]} * x{j+1}"
-                if j < len(self._constraints_matrix[0]) - 1:
-                    result += " + "
-            result += f" <= {self._constant_constraint_vector[i]}\n"
-
-        result += "Avec :\n"
-        for i in range(len(self._objective_function_vector)):
-            result += f"x{i+1} >= 0\n"
-        return result
+        # Le texte est assemblé en une seule fois : les concaténations successives seraient quadratiques
+        variables_count = len(self._objective_function_vector)
+        lines = ["Programme linéaire :",
+                 "Maximiser z = " + " + ".join(f"{self._objective_function_vector[i]} * x{i+1}" for i in range(variables_count)),
+                 "Sous les contraintes :"]
+
+        if self.is_sparse():
+            matrix = self._constraints_matrix
+            for i in range(matrix.shape[0]):
+                start, end = matrix.indptr[i], matrix.indptr[i + 1]
+                terms = " + ".join(f"{value} * x{j+1}" for j, value in zip(matrix.indices[start:end], matrix.data[start:end]))
+                lines.append(f"{terms} <= {self._constant_constraint_vector[i]}")
+        else:
+            for i, row in enumerate(self._constraints_matrix):
+                terms = " + ".join(f"{value} * x{j+1}" for j, value in enumerate(row))
+                lines.append(f"{terms} <= {self._constant_constraint_vector[i]}")
+
+        lines.append("Avec :")
+        if self.has_bounds():
+            lines.extend(f"x{i+1} >= {self._lower[i]}" if np.isinf(self._upper[i]) else f"{self._lower[i]} <= x{i+1} <= {self._upper[i]}"
+                         for i in range(variables_count))
+        else:
+            lines.extend(f"x{i+1} >= 0" for i in range(variables_count))
+        return "\n".join(lines) + "\n"
     
 
 
@@ -170,3 +350,67 @@ if __name__ == '__main__':
     print("Tableau final du simplexe :")
     for row in tableau:
         print(row)
+
+    x, z, tableau = simplexe_primal(A, b, c, backend="numpy")
+
+    print("Solution optimale (numpy) :", x)
+    print("Valeur optimale de la fonction objectif (numpy) :", z)
+
+    solution = lp.solve(method="revised")
+
+    print("Solution optimale (simplexe révisé) :", solution.x)
+    print("Valeur optimale de la fonction objectif (simplexe révisé) :", solution.z)
+
+    # Redémarrage à chaud après une modification du second membre
+    basis = export_basis(tableau)
+    x, z, tableau = simplexe_primal(A, b, c, basis=basis)
+
+    print("Base sauvegardée :", basis)
+    print("Solution optimale (redémarrage à chaud) :", x)
+
+    solution = LinearProgram(A, ConstantConstraintVector([4, 5]), c).solve(basis=Basis.from_solution(solution))
+
+    print("Solution optimale après modification de b :", solution.x, "en", solution.iterations, "pivot(s)")
+
+    # Réoptimisation par le simplexe dual après l'ajout d'une coupe x1 <= 1
+    cut_lp = LinearProgram(ConstraintsMatrix(A + [[1, 0]]), ConstantConstraintVector(b + [1]), c)
+    solution = cut_lp.solve(method="dual", basis=Basis.from_solution(lp.solve()).add_rows(1))
+
+    print("Solution optimale après ajout de la coupe :", solution.x, "en", solution.iterations, "pivot(s)")
+
+    sparse_lp = LinearProgram(sparse.csr_matrix(A), b, c)
+    solution = sparse_lp.solve()
+
+    print("Solution optimale (matrice creuse) :", solution.x)
+    print("Valeur optimale de la fonction objectif (matrice creuse) :", solution.z)
+
+    solution = lp.solve(scaling=True)
+
+    print("Solution optimale (mise à l'échelle) :", solution.x)
+    print("Prix duaux (mise à l'échelle) :", solution.duals)
+
+    # Suivi des pivots et profil des étapes
+    x, z, tableau = simplexe_primal(A, b, c, observer=ProgressPrinter())
+    profile = TimingProfile()
+    lp.solve(observer=profile)
+
+    print(profile)
+
+    # Bornes natives : x1 <= 1 ne devient pas une contrainte supplémentaire
+    bounded_lp = LinearProgram(A, b, c, upper=[1, np.inf])
+    solution = bounded_lp.solve()
+
+    print(bounded_lp)
+    print("Solution optimale (variables bornées) :", solution.x, "z =", solution.z)
+
+    # Points intérieurs, puis crossover vers un sommet optimal
+    solution = lp.solve(method="interior", crossover=True)
+
+    print("Solution optimale (points intérieurs) :", solution.x, "z =", solution.z)
+
+    # Analyse de sensibilité : prix duaux, coûts réduits et intervalles, sans nouvelle résolution
+    report = lp.sensitivity()
+
+    print(report)
+    print("Intervalles de b :", report.rhs_ranges(b).tolist())
+    print("z si b1 augmente de 1 :", report.rhs_change([1, 0]))
@@ -0,0 +1,164 @@
+import json
+import struct
+from typing import Final, Optional
+
+import numpy as np
+from scipy import sparse
+
+from basis import Basis
+from simplexe_primal import LinearProgram
+from solution import Solution
+
+
+MAGIC: Final[bytes] = b"DUALSNAP"
+VERSION: Final[int] = 1
+ALIGNMENT: Final[int] = 64
+
+# Magique, version et longueur de l'en-tête JSON
+_PREAMBLE: Final[struct.Struct] = struct.Struct("<8sII")
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+class Snapshot:
+    """
+    Instantané chargé d'un modèle : les tableaux pointent directement dans le fichier projeté en mémoire.
+
+    Args:
+        lp: Programme linéaire.
+        basis: Base sauvegardée, optionnelle.
+        tableau: Tableau du simplexe sauvegardé, optionnel (voir simplexe_primal(tableau=...)).
+    """
+    lp: LinearProgram
+    basis: Optional[Basis]
+    tableau: Optional[np.ndarray]
+
+    def __init__(self, lp: LinearProgram, basis: Optional[Basis] = None, tableau: Optional[np.ndarray] = None) -> None:
+        self.lp = lp
+        self.basis = basis
+        self.tableau = tableau
+
+    def solve(self, method: Optional[str] = None, **options) -> Solution:
+        """Résout le modèle en repartant de la base sauvegardée : aucun pivot si elle est encore optimale."""
+        if self.basis is not None:
+            options.setdefault("basis", self.basis)
+        return self.lp.solve(method, **options)
+
+
+def save_snapshot(path: str, lp: LinearProgram, basis: Optional[Basis] = None, tableau=None) -> None:
+    """
+    Écrit un instantané binaire : en-tête JSON décrivant chaque tableau, puis les données brutes alignées.
+
+    Format : MAGIC (8 octets), version et longueur de l'en-tête (uint32 petit-boutiste), en-tête JSON,
+    puis les tableaux en petit-boutiste, chacun aligné sur ALIGNMENT octets. Les positions de
+    l'en-tête sont relatives au début de la zone de données.
+
+    Args:
+        path: Chemin du fichier.
+        lp: Programme linéaire (matrice dense ou creuse, conservée telle quelle, et bornes éventuelles).
+        basis: Base finale à sauvegarder pour le redémarrage à chaud.
+        tableau: Tableau du simplexe à sauvegarder.
+    """
+    A, b, c = lp.to_arrays()
+    arrays = {"b": b, "c": c}
+    if sparse.issparse(A):
+        arrays.update({"A.data": A.data, "A.indices": A.indices, "A.indptr": A.indptr})
+    else:
+        arrays["A"] = A
+    if lp.has_bounds():
+        arrays["lower"], arrays["upper"] = lp.bounds()
+    if basis is not None:
+        arrays.update({"basis.basic": basis.basic, "basis.status": basis.status})
+    if tableau is not None:
+        arrays["tableau"] = np.asarray(tableau, dtype=float)
+
+    specifications, offset = {}, 0
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<"))
+        arrays[name] = array
+        specifications[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        offset = _align(offset + array.nbytes)
+
+    header = json.dumps({"shape": list(lp.shape), "sparse": lp.is_sparse(), "arrays": specifications}).encode()
+    data_start = _align(_PREAMBLE.size + len(header))
+
+    with open(path, "wb") as file:
+        file.write(_PREAMBLE.pack(MAGIC, VERSION, len(header)))
+        file.write(header)
+        for name, array in arrays.items():
+            file.seek(data_start + specifications[name]["offset"])
+            array.tofile(file)
+        file.truncate(data_start + offset)
+
+
+def load_snapshot(path: str) -> Snapshot:
+    """
+    Charge un instantané sans copie : le fichier est projeté par np.memmap et chaque tableau en est une vue.
+
+    Les tableaux sont en lecture seule ; les moteurs de résolution ne les modifient pas.
+
+    Args:
+        path: Chemin du fichier écrit par save_snapshot.
+
+    Returns:
+        Snapshot: Modèle, base et tableau sauvegardés.
+    """
+    mapping = np.memmap(path, dtype=np.uint8, mode="r")
+    magic, version, header_length = _PREAMBLE.unpack(mapping[:_PREAMBLE.size].tobytes())
+    if magic != MAGIC:
+        raise ValueError(f"{path} n'est pas un instantané")
+    if version != VERSION:
+        raise ValueError(f"Version d'instantané non supportée : {version}")
+
+    header = json.loads(mapping[_PREAMBLE.size:_PREAMBLE.size + header_length].tobytes())
+    data_start = _align(_PREAMBLE.size + header_length)
+
+    def view(name: str) -> np.ndarray:
+        specification = header["arrays"][name]
+        dtype = np.dtype(specification["dtype"])
+        shape = tuple(specification["shape"])
+        count = int(np.prod(shape))
+        return np.frombuffer(mapping, dtype=dtype, count=count, offset=data_start + specification["offset"]).reshape(shape)
+
+    if header["sparse"]:
+        A = sparse.csr_matrix((view("A.data"), view("A.indices"), view("A.indptr")), shape=tuple(header["shape"]))
+    else:
+        A = view("A")
+    arrays = header["arrays"]
+    if "lower" in arrays:
+        lp = LinearProgram(A, view("b"), view("c"), view("lower"), view("upper"))
+    else:
+        lp = LinearProgram(A, view("b"), view("c"))
+
+    basis = Basis(view("basis.basic"), view("basis.status")) if "basis.basic" in arrays else None
+    tableau = view("tableau") if "tableau" in arrays else None
+    return Snapshot(lp, basis, tableau)
+
+
+if __name__ == '__main__':
+    # Sauvegarde après résolution, puis redémarrage depuis l'instantané
+    import os
+    import tempfile
+    import time
+
+    rng = np.random.default_rng(0)
+    lp = LinearProgram(rng.uniform(0, 1, (200, 600)), rng.uniform(1, 10, 200), rng.uniform(0, 1, 600))
+
+    solution = lp.solve()
+    print(f"Résolution initiale : {solution.iterations} pivots en {solution.elapsed:.3f} s")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "model.snap")
+        save_snapshot(path, lp, Basis.from_solution(solution))
+
+        start = time.perf_counter()
+        snapshot = load_snapshot(path)
+        loaded = time.perf_counter() - start
+        restarted = snapshot.solve()
+
+        print(f"Chargement : {loaded * 1e3:.2f} ms ({os.path.getsize(path)} octets)")
+        print(f"Redémarrage : {restarted.iterations} pivot(s) en {restarted.elapsed:.3f} s, "
+              f"même optimum : {np.isclose(restarted.z, solution.z)}")
+        del snapshot
@@ -0,0 +1,88 @@
+from typing import Final, Optional
+
+import numpy as np
+
+
+OPTIMAL: Final[str] = "optimal"
+UNBOUNDED: Final[str] = "unbounded"
+INFEASIBLE: Final[str] = "infeasible"
+ITERATION_LIMIT: Final[str] = "iteration_limit"
+
+
+class Solution:
+    """
+    Résultat d'une résolution par l'un des moteurs du simplexe.
+
+    Args:
+        status: OPTIMAL, UNBOUNDED, INFEASIBLE ou ITERATION_LIMIT (limite d'itérations atteinte).
+        x: Valeurs des variables de décision (None si non optimal).
+        z: Valeur de la fonction objectif (None si non optimal).
+        iterations: Nombre de pivots effectués.
+        basis: Indices des colonnes de base à la fin de la résolution.
+        elapsed: Durée de la résolution en secondes.
+        duals: Prix duaux des contraintes (None si non optimal).
+        at_upper: Colonnes hors base à leur borne supérieure (simplexe à variables bornées).
+    """
+    status: str
+    x: Optional[np.ndarray]
+    z: Optional[float]
+    iterations: int
+    basis: Optional[np.ndarray]
+    elapsed: float
+    duals: Optional[np.ndarray]
+    at_upper: Optional[np.ndarray]
+
+    def __init__(self,
+                 status: str,
+                 x: Optional[np.ndarray] = None,
+                 z: Optional[float] = None,
+                 iterations: int = 0,
+                 basis: Optional[np.ndarray] = None,
+                 elapsed: float = 0.0,
+                 duals: Optional[np.ndarray] = None,
+                 at_upper: Optional[np.ndarray] = None) -> None:
+        self.status = status
+        self.x = x
+        self.z = z
+        self.iterations = iterations
+        self.basis = basis
+        self.elapsed = elapsed
+        self.duals = duals
+        self.at_upper = at_upper
+
+    @property
+    def time_per_iteration(self) -> float:
+        return self.elapsed / self.iterations if self.iterations else 0.0
+
+    def __repr__(self) -> str:
+        return f"Solution(status={self.status!r}, z={self.z}, iterations={self.iterations})"
+
+
+class BatchSolution:
+    """
+    Résultats empilés d'une résolution par lot (une ligne par instance).
+
+    Args:
+        status: Statut de chaque instance (OPTIMAL ou UNBOUNDED).
+        x: Solutions empilées (k x n), NaN pour les instances non optimales.
+        z: Valeurs de la fonction objectif (k), NaN pour les instances non optimales.
+        iterations: Nombre de pivots de chaque instance.
+    """
+    status: np.ndarray
+    x: np.ndarray
+    z: np.ndarray
+    iterations: np.ndarray
+
+    def __init__(self, status: np.ndarray, x: np.ndarray, z: np.ndarray, iterations: np.ndarray) -> None:
+        self.status = status
+        self.x = x
+        self.z = z
+        self.iterations = iterations
+
+    def __len__(self) -> int:
+        return len(self.status)
+
+    def __getitem__(self, index: int) -> Solution:
+        if self.status[index] != OPTIMAL:
+            return Solution(str(self.status[index]), iterations=int(self.iterations[index]))
+        return Solution(OPTIMAL, self.x[index], float(self.z[index]), int(self.iterations[index]))
@@ -0,0 +1,444 @@
+import time
+from typing import Final, Optional
+
+import numpy as np
+from scipy import sparse
+
+from basis import Basis
+from instrumentation import IterationEvent, SolveObserver, make_observer
+from perturbation import DegeneracyMonitor, make_perturbation
+from pricing import PricingStrategy, PRICING_RULES, make_pricing
+from ratio_test import PIVOT_TOLERANCE, PRIMAL_TOLERANCE, harris_ratio_test, lexicographic_ratio_test
+from solution import INFEASIBLE, OPTIMAL, UNBOUNDED, Solution
+
+
+TOLERANCE: Final[float] = 1e-9
+
+
+def create_initial_tableau(A, b, c) -> np.ndarray:
+    """
+    Construit le tableau initial du simplexe sous forme de tableau numpy.
+
+    Args:
+        A: Matrice des contraintes (m x n, dense ou creuse).
+        b: Second membre des contraintes (m).
+        c: Coefficients de la fonction objectif à maximiser (n).
+
+    Returns:
+        np.ndarray: Tableau (m+1) x (n+m+1), la dernière ligne étant la ligne objectif.
+    """
+    constraints_count, variables_count = len(b), len(c)
+
+    tableau = np.zeros((constraints_count + 1, variables_count + constraints_count + 1))
+    if sparse.issparse(A):
+        # Le tableau est dense par nature, mais A n'est pas densifiée au préalable
+        A = sparse.coo_matrix(A)
+        A.sum_duplicates()
+        tableau[A.row, A.col] = A.data
+    else:
+        tableau[:constraints_count, :variables_count] = A
+    tableau[:constraints_count, variables_count:-1] = np.eye(constraints_count)
+    tableau[:constraints_count, -1] = b
+    tableau[-1, :variables_count] = -np.asarray(c, dtype=float)
+
+    return tableau
+
+
+def find_basis(tableau: np.ndarray) -> np.ndarray:
+    """
+    Retrouve les colonnes de base (colonnes identité) d'un tableau existant.
+
+    Args:
+        tableau: Tableau du simplexe.
+
+    Returns:
+        np.ndarray: Indice de la colonne de base associée à chaque ligne de contrainte.
+    """
+    body = tableau[:-1, :-1]
+    constraints_count = body.shape[0]
+
+    nonzero = np.abs(body) > TOLERANCE
+    candidates = np.flatnonzero((nonzero.sum(axis=0) == 1) & (np.abs(tableau[-1, :-1]) <= TOLERANCE))
+    rows = np.argmax(nonzero[:, candidates], axis=0)
+    unit = np.abs(body[rows, candidates] - 1.0) <= TOLERANCE
+
+    basis = np.full(constraints_count, -1, dtype=np.intp)
+    basis[rows[unit]] = candidates[unit]
+    if np.any(basis < 0):
+        raise ValueError("Le tableau ne contient pas de base identité complète")
+    return basis
+
+
+def export_basis(tableau) -> Basis:
+    """
+    Exporte la base d'un tableau final du simplexe (liste de listes ou tableau numpy).
+
+    Args:
+        tableau: Tableau du simplexe.
+
+    Returns:
+        Basis: Colonnes de base et statuts des colonnes hors base.
+    """
+    tableau = np.asarray(tableau, dtype=float)
+    return Basis.from_header(find_basis(tableau), tableau.shape[1] - 1)
+
+
+def create_tableau_from_basis(A, b, c, basis: Basis) -> np.ndarray:
+    """
+    Reconstruit le tableau du simplexe exprimé dans une base donnée : B^-1 [A | I | b].
+
+    Args:
+        A: Matrice des contraintes (m x n, dense ou creuse).
+        b: Second membre des contraintes (m).
+        c: Coefficients de la fonction objectif à maximiser (n).
+        basis: Base de départ.
+
+    Returns:
+        np.ndarray: Tableau (m+1) x (n+m+1) dont les colonnes de base forment l'identité.
+    """
+    tableau = create_initial_tableau(A, b, c)
+    constraints_count = tableau.shape[0] - 1
+
+    basis_matrix = tableau[:constraints_count, basis.basic]
+    tableau[:constraints_count] = np.linalg.solve(basis_matrix, tableau[:constraints_count])
+
+    # Ligne objectif : coûts réduits par rapport à la nouvelle base
+    costs = -tableau[-1, basis.basic]
+    tableau[-1] += costs @ tableau[:constraints_count]
+    return tableau
+
+
+def get_pivot_column(tableau: np.ndarray) -> Optional[int]:
+    objective_row = tableau[-1, :-1]
+    colonne_pivot = int(np.argmin(objective_row))
+    if objective_row[colonne_pivot] >= -TOLERANCE:
+        return None
+    return colonne_pivot
+
+
+def get_pivot_line(tableau: np.ndarray,
+                   colonne_pivot: int,
+                   primal_tolerance: float = PRIMAL_TOLERANCE,
+                   pivot_tolerance: float = PIVOT_TOLERANCE,
+                   variables_count: Optional[int] = None) -> Optional[int]:
+    """
+    Choisit la ligne sortante du simplexe primal.
+
+    Le test de Harris est utilisé par défaut ; si variables_count est fourni, le test
+    lexicographique lit les lignes de B^-1 dans les colonnes des variables d'écart.
+    """
+    if variables_count is None:
+        return harris_ratio_test(tableau[:-1, colonne_pivot], tableau[:-1, -1], primal_tolerance, pivot_tolerance)
+    return lexicographic_ratio_test(tableau[:-1, colonne_pivot], tableau[:-1, -1],
+                                    lambda i: tableau[i, variables_count:-1],
+                                    primal_tolerance, pivot_tolerance)
+
+
+def get_dual_pivot_line(tableau: np.ndarray, variables_count: int = 0, pricing: str = "dantzig") -> Optional[int]:
+    """
+    Choisit la ligne sortante du simplexe dual.
+
+    Args:
+        tableau: Tableau du simplexe.
+        variables_count: Nombre de variables de décision (les colonnes suivantes contiennent B^-1).
+        pricing: "dantzig" (variable de base la plus négative) ou "steepest_edge"
+                 (infaisabilité rapportée à la norme de la ligne de B^-1).
+
+    Returns:
+        int | None: Indice de la ligne sortante, None si la base est primale réalisable.
+    """
+    rhs = tableau[:-1, -1]
+    infeasible = rhs < -TOLERANCE
+    if not infeasible.any():
+        return None
+
+    if pricing == "dantzig":
+        return int(np.argmin(rhs))
+    if pricing == "steepest_edge":
+        weights = np.einsum('ij,ij->i', tableau[:-1, variables_count:-1], tableau[:-1, variables_count:-1])
+        scores = np.where(infeasible, rhs * rhs / weights, -np.inf)
+        return int(np.argmax(scores))
+    raise ValueError(f"Règle de pricing dual inconnue : {pricing}")
+
+
+def get_dual_pivot_column(tableau: np.ndarray, ligne_pivot: int) -> Optional[int]:
+    """
+    Test du ratio dual : garde la réalisabilité duale de la ligne objectif.
+
+    Parmi les ratios minimaux ex æquo, le plus grand pivot en valeur absolue est préféré.
+    """
+    row = tableau[ligne_pivot, :-1]
+    negative = row < -TOLERANCE
+    if not negative.any():
+        return None
+
+    ratios = np.full(row.shape, np.inf)
+    np.divide(np.maximum(tableau[-1, :-1], 0.0), -row, out=ratios, where=negative)
+    ties = ratios <= ratios.min() + TOLERANCE
+    return int(np.argmax(np.where(ties, -row, -np.inf)))
+
+
+def pivot(tableau: np.ndarray, ligne_pivot: int, colonne_pivot: int) -> None:
+    """
+    Effectue le pivot en place par une mise à jour de rang 1.
+
+    Args:
+        tableau: Tableau du simplexe, modifié en place.
+        ligne_pivot: Indice de la ligne pivot.
+        colonne_pivot: Indice de la colonne pivot.
+    """
+    pivot_row = tableau[ligne_pivot] / tableau[ligne_pivot, colonne_pivot]
+    facteurs = tableau[:, colonne_pivot].copy()
+    facteurs[ligne_pivot] = 0.0
+
+    tableau -= np.outer(facteurs, pivot_row)
+    tableau[ligne_pivot] = pivot_row
+
+
+class TableauSimplex:
+    """
+    Moteur du simplexe primal sur un tableau numpy, avec en-tête de base.
+    """
+    tableau: np.ndarray
+    basis: np.ndarray
+    variables_count: int
+    iterations: int
+    pricing: PricingStrategy
+    primal_tolerance: float
+    pivot_tolerance: float
+    lexicographic: bool
+    perturbation: bool
+    observer: Optional[SolveObserver]
+
+    def __init__(self, tableau: np.ndarray, variables_count: int, basis: Optional[np.ndarray] = None, pricing=None) -> None:
+        self.tableau = np.array(tableau, dtype=float)
+        self.basis = find_basis(self.tableau) if basis is None else np.array(basis, dtype=np.intp)
+        self.variables_count = variables_count
+        self.iterations = 0
+        self.pricing = make_pricing(pricing)
+        self.primal_tolerance = PRIMAL_TOLERANCE
+        self.pivot_tolerance = PIVOT_TOLERANCE
+        self.lexicographic = False
+        self.perturbation = True
+        self.observer = None
+
+    @classmethod
+    def from_problem(cls, A, b, c, pricing=None) -> 'TableauSimplex':
+        tableau = create_initial_tableau(A, b, c)
+        constraints_count = tableau.shape[0] - 1
+        variables_count = tableau.shape[1] - constraints_count - 1
+        basis = np.arange(variables_count, variables_count + constraints_count)
+        return cls(tableau, variables_count, basis, pricing)
+
+    @classmethod
+    def from_basis(cls, A, b, c, basis: Basis, pricing=None) -> 'TableauSimplex':
+        tableau = create_tableau_from_basis(A, b, c, basis)
+        return cls(tableau, len(c), basis.basic, pricing)
+
+    def is_primal_feasible(self) -> bool:
+        return bool(np.all(self.tableau[:-1, -1] >= -TOLERANCE))
+
+    def is_dual_feasible(self) -> bool:
+        return bool(np.all(self.tableau[-1, :-1] >= -TOLERANCE))
+
+    def _notify(self, phase: str, entering: int, leaving: int, started: float, priced: float, tested: float) -> None:
+        updated = time.perf_counter()
+        rhs = self.tableau[:-1, -1]
+        self.observer.iteration(IterationEvent(phase, self.iterations, entering, leaving, float(self.tableau[-1, -1]),
+                                               float(-rhs[rhs < 0].sum()),
+                                               priced - started, tested - priced, updated - tested))
+
+    def solve_dual(self, pricing: str = "dantzig") -> bool:
+        """
+        Itère le simplexe dual depuis une base duale réalisable jusqu'à la réalisabilité primale.
+
+        Args:
+            pricing: Règle de choix de la ligne sortante ("dantzig" ou "steepest_edge").
+
+        Returns:
+            bool: False si le problème est irréalisable, True sinon.
+        """
+        observer = self.observer
+        while True:
+            if observer is not None:
+                started = time.perf_counter()
+            ligne_pivot = get_dual_pivot_line(self.tableau, self.variables_count, pricing)
+            if ligne_pivot is None:
+                return True
+
+            if observer is not None:
+                priced = time.perf_counter()
+            colonne_pivot = get_dual_pivot_column(self.tableau, ligne_pivot)
+            if colonne_pivot is None:
+                return False
+
+            if observer is not None:
+                tested = time.perf_counter()
+            leaving = int(self.basis[ligne_pivot])
+            pivot(self.tableau, ligne_pivot, colonne_pivot)
+            self.basis[ligne_pivot] = colonne_pivot
+            self.iterations += 1
+            if observer is not None:
+                self._notify("dual", colonne_pivot, leaving, started, priced, tested)
+
+    def solve(self) -> bool:
+        """
+        Itère jusqu'à l'optimalité.
+
+        Lorsque la résolution stagne sur un sommet dégénéré, les valeurs des variables de base
+        sont perturbées (voir make_perturbation). Le second membre exact est mis à jour à chaque
+        pivot à côté du tableau ; il est rétabli à l'optimum, puis une phase de nettoyage
+        (simplexe dual, la base restant duale réalisable) rend la solution du problème d'origine.
+
+        Returns:
+            bool: False si le problème est non borné, True sinon.
+        """
+        self.pricing.reset(self.tableau, self.basis)
+        monitor = DegeneracyMonitor()
+        exact_rhs = None
+        observer = self.observer
+
+        while True:
+            if observer is not None:
+                started = time.perf_counter()
+            colonne_pivot = self.pricing.select(self.tableau)
+            if colonne_pivot is None:
+                break
+
+            if observer is not None:
+                priced = time.perf_counter()
+            ligne_pivot = get_pivot_line(self.tableau, colonne_pivot, self.primal_tolerance, self.pivot_tolerance,
+                                         self.variables_count if self.lexicographic else None)
+            if ligne_pivot is None:
+                if exact_rhs is not None:
+                    self.tableau[:, -1] = exact_rhs
+                return False
+
+            if exact_rhs is None and self.perturbation and not self.lexicographic \
+                    and monitor.record(self.tableau[ligne_pivot, -1] <= self.primal_tolerance):
+                exact_rhs = self.tableau[:, -1].copy()
+                self.tableau[:-1, -1] += make_perturbation(exact_rhs[:-1])
+                continue
+
+            if observer is not None:
+                tested = time.perf_counter()
+            if exact_rhs is not None:
+                column = self.tableau[:, colonne_pivot]
+                step = exact_rhs[ligne_pivot] / column[ligne_pivot]
+                exact_rhs -= step * column
+                exact_rhs[ligne_pivot] = step
+
+            leaving = int(self.basis[ligne_pivot])
+            self.pricing.update(self.tableau, ligne_pivot, colonne_pivot, leaving)
+            pivot(self.tableau, ligne_pivot, colonne_pivot)
+            self.basis[ligne_pivot] = colonne_pivot
+            self.iterations += 1
+            if observer is not None:
+                self._notify("primal", colonne_pivot, leaving, started, priced, tested)
+
+        if exact_rhs is None:
+            return True
+
+        # Nettoyage : la ligne objectif n'a pas été perturbée
+        self.tableau[:, -1] = exact_rhs
+        return self.solve_dual() and self.solve()
+
+    def solution(self) -> tuple[np.ndarray, float]:
+        x = np.zeros(self.variables_count)
+        structural = self.basis < self.variables_count
+        x[self.basis[structural]] = self.tableau[:-1, -1][structural]
+        return x, float(self.tableau[-1, -1])
+
+    def duals(self) -> np.ndarray:
+        # Coûts réduits des variables d'écart : y = c_B B^-1
+        return self.tableau[-1, self.variables_count:-1].copy()
+
+
+def warm_start(A, b, c, basis: Basis, pricing=None, observer: Optional[SolveObserver] = None) -> tuple[TableauSimplex, bool]:
+    """
+    Redémarre le moteur tableau depuis une base sauvegardée.
+
+    Une base primale réalisable est reprise telle quelle ; une base seulement duale
+    réalisable (après modification de b) passe d'abord par le simplexe dual ; sinon la
+    résolution repart de la base des variables d'écart.
+
+    Args:
+        A: Matrice des contraintes (m x n).
+        b: Second membre des contraintes (m).
+        c: Coefficients de la fonction objectif à maximiser (n).
+        basis: Base sauvegardée.
+        pricing: Règle de pricing du simplexe primal.
+        observer: Observateur transmis au moteur, y compris pour les pivots duaux.
+
+    Returns:
+        tuple: Le moteur prêt pour le simplexe primal, et False si le problème est irréalisable.
+    """
+    engine = TableauSimplex.from_basis(A, b, c, basis, pricing)
+    engine.observer = observer
+    if engine.is_primal_feasible():
+        return engine, True
+    if engine.is_dual_feasible():
+        return engine, engine.solve_dual()
+    engine = TableauSimplex.from_problem(A, b, c, pricing)
+    engine.observer = observer
+    return engine, True
+
+
+def solve_tableau(A, b, c,
+                  basis: Optional[Basis] = None,
+                  pricing=None,
+                  primal_tolerance: float = PRIMAL_TOLERANCE,
+                  pivot_tolerance: float = PIVOT_TOLERANCE,
+                  lexicographic: bool = False,
+                  perturbation: bool = True,
+                  observer=None) -> Solution:
+    start = time.perf_counter()
+    observer = make_observer(observer)
+    if observer is not None:
+        observer.start("tableau", (len(b), len(c)))
+
+    if basis is None:
+        engine, feasible = TableauSimplex.from_problem(A, b, c, pricing), True
+        engine.observer = observer
+        if np.any(np.asarray(b, dtype=float) < -primal_tolerance):
+            # Base des écarts non réalisable : seul le simplexe dual peut partir d'une base duale réalisable (c <= 0)
+            if not engine.is_dual_feasible():
+                raise ValueError("Le simplexe sur tableau nécessite une base initiale réalisable (b >= 0) "
+                                 "ou duale réalisable (c <= 0)")
+            feasible = engine.solve_dual()
+    else:
+        engine, feasible = warm_start(A, b, c, basis, pricing, observer)
+    engine.primal_tolerance = primal_tolerance
+    engine.pivot_tolerance = pivot_tolerance
+    engine.lexicographic = lexicographic
+    engine.perturbation = perturbation
+
+    if not feasible:
+        solution = Solution(INFEASIBLE, iterations=engine.iterations, basis=engine.basis,
+                            elapsed=time.perf_counter() - start)
+    elif not engine.solve():
+        solution = Solution(UNBOUNDED, iterations=engine.iterations, basis=engine.basis,
+                            elapsed=time.perf_counter() - start)
+    else:
+        x, z = engine.solution()
+        solution = Solution(OPTIMAL, x, z, engine.iterations, engine.basis, time.perf_counter() - start, engine.duals())
+
+    if observer is not None:
+        observer.finish(solution.status, solution.iterations)
+    return solution
+
+
+def compare_pricing(A, b, c, rules=tuple(PRICING_RULES)) -> dict[str, Solution]:
+    """
+    Résout le même problème avec chaque règle de pricing pour choisir la plus rapide.
+
+    Args:
+        A: Matrice des contraintes (m x n).
+        b: Second membre des contraintes (m).
+        c: Coefficients de la fonction objectif à maximiser (n).
+        rules: Noms des règles à comparer.
+
+    Returns:
+        dict: Solution de chaque règle, avec nombre de pivots et temps par pivot.
+    """
+    return {rule: solve_tableau(A, b, c, pricing=rule) for rule in rules}
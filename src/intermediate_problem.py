@@ -1,28 +1,122 @@
-def create_auxiliary_problem(constraints_matrix, constraints_rhs):
+import numpy as np
+
+def crash_basis(constraints_matrix, constraints_rhs):
+    """
+    Construit une base de départ triangulaire à partir des variables d'écart et des colonnes de décision.
+
+    Une contrainte A_i x <= b_i avec b_i >= 0 garde sa variable d'écart en base. Pour une contrainte
+    violée (b_i < 0), on cherche une variable de décision x_j qui la rend active sans toucher aux
+    contraintes déjà traitées (a_kj = 0 pour les lignes où une variable de décision est déjà en base),
+    sans rendre négative une variable d'écart de base et sans rendre réalisable une ligne
+    artificielle. À défaut, la contrainte recevra une variable artificielle.
+
+    Args:
+        constraints_matrix (list of lists): Matrice des coefficients des contraintes.
+        constraints_rhs (list): Valeurs du côté droit des contraintes.
+
+    Returns:
+        tuple: Colonne de décision en base pour chaque contrainte (None pour une variable d'écart ou
+               artificielle) et indices des contraintes nécessitant une variable artificielle.
+    """
+
+    matrix = np.asarray(constraints_matrix, dtype=float).reshape(len(constraints_rhs), -1)
+    slacks = np.asarray(constraints_rhs, dtype=float).copy()  # Valeurs b - A x pour la base courante
+    num_constraints, num_original_vars = matrix.shape
+
+    basic_columns = [None] * num_constraints
+    artificial_rows = []
+    used_columns = set()
+    crashed_rows = np.zeros(num_constraints, dtype=bool)
+    artificial = np.zeros(num_constraints, dtype=bool)
+    pending = slacks < 0
+
+    for i in np.flatnonzero(pending):
+        pending[i] = False
+        if slacks[i] >= 0:
+            continue  # Rendue réalisable par une colonne déjà choisie
+
+        best_column, best_pivot = None, 0.0
+        for j in np.flatnonzero(matrix[i] < 0):
+            if j in used_columns or np.any(matrix[crashed_rows, j] != 0):
+                continue
+            step = slacks[i] / matrix[i, j]
+            updated = slacks - step * matrix[:, j]
+            feasible_rows = ~(crashed_rows | artificial | pending)
+            feasible_rows[i] = False
+            if np.any(updated[feasible_rows] < 0) or np.any(updated[artificial] > 0):
+                continue
+            # Le plus grand pivot donne la base la mieux conditionnée
+            if abs(matrix[i, j]) > best_pivot:
+                best_column, best_pivot = int(j), abs(matrix[i, j])
+
+        if best_column is None:
+            artificial[i] = True
+            artificial_rows.append(int(i))
+            continue
+
+        slacks -= slacks[i] / matrix[i, best_column] * matrix[:, best_column]
+        slacks[i] = 0.0
+        basic_columns[i] = best_column
+        used_columns.add(best_column)
+        crashed_rows[i] = True
+
+    return basic_columns, artificial_rows
+
+def create_auxiliary_problem(constraints_matrix, constraints_rhs, basic_vars=None, nonbasic_vars=None):
     """
     Crée le problème auxiliaire à partir de la matrice des contraintes et des valeurs du côté droit des contraintes.
 
+    La base de départ est donnée par crash_basis : seules les contraintes qu'elle ne rend pas
+    réalisables reçoivent une variable artificielle, en écrivant -A_i x - s_i + a_i = -b_i.
+    Le problème est retourné sous forme de dictionnaire relatif à cette base : chaque variable
+    de base vaut rhs_i - sum_j M_ij * n_j.
+
     Args:
         constraints_matrix (list of lists): Matrice des coefficients des contraintes.
         constraints_rhs (list): Valeurs du côté droit des contraintes.
+        basic_vars (list): Noms des variables d'écart (s1, s2, ... par défaut).
+        nonbasic_vars (list): Noms des variables de décision (x1, x2, ... par défaut).
 
     Returns:
-        tuple: La matrice des contraintes et les valeurs du côté droit des contraintes pour le problème auxiliaire.
+        tuple: La matrice M et les valeurs rhs du dictionnaire auxiliaire, ses variables de base,
+               ses variables hors base et les variables artificielles.
     """
 
     num_constraints = len(constraints_rhs)
     num_original_vars = len(constraints_matrix[0]) if num_constraints > 0 else 0
+    matrix = np.asarray(constraints_matrix, dtype=float).reshape(num_constraints, num_original_vars)
+    rhs = np.asarray(constraints_rhs, dtype=float)
+
+    if basic_vars is None:
+        basic_vars = [f"s{i+1}" for i in range(num_constraints)]
+    if nonbasic_vars is None:
+        nonbasic_vars = [f"x{j+1}" for j in range(num_original_vars)]
+
+    basic_columns, artificial_rows = crash_basis(matrix, rhs)
+    artificial_vars = [f"a{i+1}" for i in artificial_rows]
+
+    # Changer le signe des lignes artificielles : -A_i x - s_i + a_i = -b_i
+    signs = np.ones(num_constraints)
+    signs[artificial_rows] = -1.0
+    columns = {var: signs * matrix[:, j] for j, var in enumerate(nonbasic_vars)}
+    for i, var in enumerate(basic_vars):
+        columns[var] = signs[i] * np.eye(num_constraints)[i]
+    for i, var in zip(artificial_rows, artificial_vars):
+        columns[var] = np.eye(num_constraints)[i]
 
-    # Créer la matrice des contraintes pour le problème auxiliaire
-    auxiliary_constraints_matrix = []
-    for i in range(num_constraints):
-        row = constraints_matrix[i] + [1]  # Ajouter une variable artificielle à chaque contrainte
-        auxiliary_constraints_matrix.append(row)
+    # Base de départ : variable de décision choisie par le crash, artificielle ou variable d'écart
+    artificial_names = dict(zip(artificial_rows, artificial_vars))
+    auxiliary_basic_vars = [nonbasic_vars[basic_columns[i]] if basic_columns[i] is not None
+                            else artificial_names.get(i, basic_vars[i]) for i in range(num_constraints)]
+    auxiliary_nonbasic_vars = [var for var in nonbasic_vars + basic_vars if var not in auxiliary_basic_vars]
 
-    # Créer les valeurs du côté droit des contraintes pour le problème auxiliaire
-    auxiliary_constraints_rhs = constraints_rhs[:]  # Copier les valeurs du côté droit
+    # La base est triangulaire à une permutation près
+    basis = np.column_stack([columns[var] for var in auxiliary_basic_vars]) if num_constraints > 0 else np.zeros((0, 0))
+    nonbasic = np.column_stack([columns[var] for var in auxiliary_nonbasic_vars]) if auxiliary_nonbasic_vars else np.zeros((num_constraints, 0))
+    auxiliary_constraints_matrix = np.linalg.solve(basis, nonbasic).tolist() if num_constraints > 0 else []
+    auxiliary_constraints_rhs = np.linalg.solve(basis, signs * rhs).tolist() if num_constraints > 0 else []
 
-    return auxiliary_constraints_matrix, auxiliary_constraints_rhs
+    return auxiliary_constraints_matrix, auxiliary_constraints_rhs, auxiliary_basic_vars, auxiliary_nonbasic_vars, artificial_vars
 
 def create_auxiliary_objective(num_artificial_vars):
     """
@@ -41,19 +135,22 @@ def create_auxiliary_objective(num_artificial_vars):
     return auxiliary_objective_coeffs
 
 if __name__ == '__main__':
-    # Exemple d'utilisation
-    constraints_matrix = [[2, 1], [1, 2]]
-    constraints_rhs = [4, 5]
+    # Exemple d'utilisation : seule la troisième contrainte est violée par la base des variables d'écart
+    constraints_matrix = [[2, 1], [1, 2], [-1, -1]]
+    constraints_rhs = [4, 5, -1]
 
     print("Problème initial :")
     print(f"Matrice des contraintes : {constraints_matrix}")
     print(f"Côté droit des contraintes : {constraints_rhs}")
 
-    auxiliary_constraints_matrix, auxiliary_constraints_rhs = create_auxiliary_problem(constraints_matrix, constraints_rhs)
-    num_artificial_vars = len(auxiliary_constraints_matrix)
+    auxiliary_constraints_matrix, auxiliary_constraints_rhs, basic_vars, nonbasic_vars, artificial_vars = create_auxiliary_problem(constraints_matrix, constraints_rhs)
+    num_artificial_vars = len(artificial_vars)
     auxiliary_objective_coeffs = create_auxiliary_objective(num_artificial_vars)
 
     print("\nProblème auxiliaire :")
+    print(f"Variables de base : {basic_vars}")
+    print(f"Variables hors base : {nonbasic_vars}")
+    print(f"Variables artificielles : {artificial_vars}")
     print(f"Matrice des contraintes : {auxiliary_constraints_matrix}")
     print(f"Côté droit des contraintes : {auxiliary_constraints_rhs}")
     print(f"Coefficients de l'objectif : {auxiliary_objective_coeffs}")
@@ -1,58 +1,88 @@
 import numpy as np
+from scipy import sparse
+
+TOLERANCE = 1e-9
 
 def lexicographic_method(objective_coeffs, constraints_matrix, constraints_rhs):
     """
     Applique la méthode lexicographique pour éviter les cycles dans l'algorithme du simplexe.
 
+    La matrice lexicographique [b | A | I] n'est jamais construite : ses lignes sont
+    calculées à la demande, uniquement pour les lignes ex æquo lors du test du ratio.
+
     Args:
         objective_coeffs (list): Coefficients de la fonction objective.
-        constraints_matrix (list of lists): Matrice des coefficients des contraintes.
+        constraints_matrix (list of lists ou matrice creuse): Matrice des coefficients des contraintes.
         constraints_rhs (list): Valeurs du côté droit des contraintes.
 
     Returns:
-        tuple: Coefficients de la fonction objective, matrice des contraintes et matrice lexicographique.
+        tuple: Coefficients de la fonction objective, matrice des contraintes et fonction
+               lexicographic_row(i) retournant la ligne i de [b | A | I].
     """
 
     num_constraints = len(constraints_rhs)
-    num_original_vars = len(objective_coeffs)
 
-    # Créer la matrice lexicographique
-    lexicographic_matrix = np.zeros((num_constraints, num_constraints + num_original_vars + 1))
+    if sparse.issparse(constraints_matrix):
+        # Seule la ligne demandée est extraite, sans densifier la matrice des contraintes
+        constraints_matrix = sparse.csr_matrix(constraints_matrix)
 
-    # Remplir la première colonne avec les valeurs du côté droit des contraintes
-    lexicographic_matrix[:, 0] = constraints_rhs
+    def lexicographic_row(i):
+        if sparse.issparse(constraints_matrix):
+            row = constraints_matrix.getrow(i).toarray().ravel()
+        else:
+            row = np.asarray(constraints_matrix[i], dtype=float)
+        identity_row = np.zeros(num_constraints)
+        identity_row[i] = 1.0
+        return np.concatenate(([constraints_rhs[i]], row, identity_row))
 
-    # Remplir les colonnes suivantes avec la matrice des contraintes
-    lexicographic_matrix[:, 1:num_original_vars + 1] = constraints_matrix
+    return objective_coeffs, constraints_matrix, lexicographic_row
 
-    # Remplir les colonnes restantes avec une matrice identité
-    lexicographic_matrix[:, num_original_vars + 1:] = np.eye(num_constraints)
+def is_lexicographically_smaller(u, v, tolerance=TOLERANCE):
+    """
+    Compare deux vecteurs dans l'ordre lexicographique.
 
-    return objective_coeffs, constraints_matrix, lexicographic_matrix
+    Returns:
+        bool: True si le premier coefficient significativement différent est plus petit dans u.
+    """
+    difference = np.asarray(u, dtype=float) - np.asarray(v, dtype=float)
+    significant = np.flatnonzero(np.abs(difference) > tolerance)
+    return bool(significant.size) and difference[significant[0]] < 0
 
-def find_leaving_variable_lexicographic(ratios, lexicographic_rows):
+def find_leaving_variable_lexicographic(ratios, lexicographic_row, pivot_column=None):
     """
     Trouve la variable sortante en utilisant la méthode lexicographique.
 
     Args:
-        ratios (list): Liste des ratios (b_i / a_ij) pour chaque variable de base.
-        lexicographic_rows (list of lists): Lignes de la matrice lexicographique correspondant aux variables de base.
+        ratios (list): Liste des ratios (b_i / a_ij) pour chaque variable de base, inf si a_ij <= 0.
+        lexicographic_row (callable): Fonction retournant la ligne i de la matrice lexicographique.
+        pivot_column (list): Coefficients a_ij de la colonne entrante ; les lignes ex æquo sont
+                             divisées par leur pivot avant la comparaison (1 par défaut).
 
     Returns:
-        int: L'indice de la variable sortante.
+        int: L'indice de la variable sortante, -1 si aucun ratio n'est fini.
     """
 
-    min_ratio = float('inf')
-    leaving_index = -1
+    ratios = np.asarray(ratios, dtype=float)
+    eligible = np.isfinite(ratios) & (ratios >= 0)
+    if not eligible.any():
+        return -1
+
+    min_ratio = ratios[eligible].min()
+    ties = np.flatnonzero(eligible & (ratios <= min_ratio + TOLERANCE))
+
+    def scaled_row(i):
+        row = lexicographic_row(i)
+        return row if pivot_column is None else row / pivot_column[i]
 
-    for i, ratio in enumerate(ratios):
-        if ratio > 0 and ratio < min_ratio:
-            min_ratio = ratio
-            leaving_index = i
-        elif ratio > 0 and ratio == min_ratio:
-            # En cas d'égalité des ratios, utiliser la méthode lexicographique
-            if np.lexicographical_compare(lexicographic_rows[i], lexicographic_rows[leaving_index]) < 0:
-                leaving_index = i
+    # Seules les lignes ex æquo sont calculées, deux à la fois
+    leaving_index = int(ties[0])
+    best_row = None
+    for i in ties[1:]:
+        if best_row is None:
+            best_row = scaled_row(leaving_index)
+        candidate = scaled_row(i)
+        if is_lexicographically_smaller(candidate, best_row):
+            leaving_index, best_row = int(i), candidate
 
     return leaving_index
 
@@ -67,17 +97,17 @@ if __name__ == '__main__':
     print(f"Matrice des contraintes : {constraints_matrix}")
     print(f"Côté droit des contraintes : {constraints_rhs}")
 
-    objective_coeffs_lex, constraints_matrix_lex, lexicographic_matrix = lexicographic_method(objective_coeffs, constraints_matrix, constraints_rhs)
+    objective_coeffs_lex, constraints_matrix_lex, lexicographic_row = lexicographic_method(objective_coeffs, constraints_matrix, constraints_rhs)
 
     print("\nProblème avec la méthode lexicographique :")
     print(f"Coefficients de l'objectif : {objective_coeffs_lex}")
     print(f"Matrice des contraintes : {constraints_matrix_lex}")
-    print(f"Matrice lexicographique :\n{lexicographic_matrix}")
+    print(f"Ligne lexicographique 0 : {lexicographic_row(0)}")
 
-    # Exemple d'utilisation de find_leaving_variable_lexicographic
-    ratios = [4, 3]  # Ratios hypothétiques
-    lexicographic_rows = lexicographic_matrix  # Utiliser la matrice lexicographique complète
+    # Exemple d'utilisation de find_leaving_variable_lexicographic : x1 entre, ratios ex æquo
+    pivot_column = [1, 2]
+    ratios = [3, 3]  # Ratios hypothétiques ex æquo
 
-    leaving_variable_index = find_leaving_variable_lexicographic(ratios, lexicographic_rows)
+    leaving_variable_index = find_leaving_variable_lexicographic(ratios, lexicographic_row, pivot_column)
 
     print(f"\nIndice de la variable sortante (méthode lexicographique) : {leaving_variable_index}")
@@ -1,26 +1,52 @@
 import numpy as np
 
-def perturbation_method(objective_coeffs, constraints_matrix, constraints_rhs):
+def perturbation_method(objective_coeffs, constraints_matrix, constraints_rhs, epsilon=1e-6, seed=0):
     """
     Applique la méthode de perturbation pour éviter les cycles dans l'algorithme du simplexe.
 
+    La perturbation est déterministe (générateur initialisé avec seed) et proportionnelle à chaque
+    ligne : epsilon_i = epsilon * (1 + |b_i|) * (1 + u_i). Elle est retournée pour pouvoir être
+    retirée après la résolution (voir remove_perturbation).
+
     Args:
         objective_coeffs (list): Coefficients de la fonction objective.
         constraints_matrix (list of lists): Matrice des coefficients des contraintes.
         constraints_rhs (list): Valeurs du côté droit des contraintes.
+        epsilon (float): Amplitude relative de la perturbation.
+        seed (int): Graine du générateur de perturbations.
 
     Returns:
-        tuple: Coefficients de la fonction objective, matrice des contraintes et valeurs du côté droit des contraintes perturbées.
+        tuple: Coefficients de la fonction objective, matrice des contraintes, valeurs du côté droit des contraintes perturbées
+               et perturbation appliquée.
     """
 
     num_constraints = len(constraints_rhs)
-    num_original_vars = len(objective_coeffs)
 
     # Perturber les valeurs du côté droit des contraintes
-    epsilon = np.random.rand(num_constraints)  # Générer des perturbations aléatoires
-    constraints_rhs_perturbed = [constraints_rhs[i] + epsilon[i] for i in range(num_constraints)]
+    rng = np.random.default_rng(seed)
+    epsilons = [epsilon * (1 + abs(constraints_rhs[i])) * (1 + float(u)) for i, u in enumerate(rng.random(num_constraints))]
+    constraints_rhs_perturbed = [constraints_rhs[i] + epsilons[i] for i in range(num_constraints)]
+
+    # Écart réellement appliqué après arrondi. Sa soustraction redonne exactement b lorsque b_i et
+    # b_i + epsilon_i sont du même ordre (|b_i| grand devant epsilon_i), à un arrondi près sinon
+    perturbation = [constraints_rhs_perturbed[i] - constraints_rhs[i] for i in range(num_constraints)]
+
+    return objective_coeffs, constraints_matrix, constraints_rhs_perturbed, perturbation
+
+def remove_perturbation(constraints_rhs_perturbed, perturbation):
+    """
+    Retire la perturbation du côté droit des contraintes.
+
+    Args:
+        constraints_rhs_perturbed (list): Valeurs du côté droit des contraintes perturbées.
+        perturbation (list): Perturbation retournée par perturbation_method.
+
+    Returns:
+        list: Valeurs du côté droit des contraintes d'origine, exactes lorsque |b_i| est grand devant
+              la perturbation, à un arrondi près sinon (conserver b si l'égalité exacte est nécessaire).
+    """
 
-    return objective_coeffs, constraints_matrix, constraints_rhs_perturbed
+    return [value - delta for value, delta in zip(constraints_rhs_perturbed, perturbation)]
 
 if __name__ == '__main__':
     # Exemple d'utilisation
@@ -33,9 +59,10 @@ if __name__ == '__main__':
     print(f"Matrice des contraintes : {constraints_matrix}")
     print(f"Côté droit des contraintes : {constraints_rhs}")
 
-    objective_coeffs_perturbed, constraints_matrix_perturbed, constraints_rhs_perturbed = perturbation_method(objective_coeffs, constraints_matrix, constraints_rhs)
+    objective_coeffs_perturbed, constraints_matrix_perturbed, constraints_rhs_perturbed, perturbation = perturbation_method(objective_coeffs, constraints_matrix, constraints_rhs)
 
     print("\nProblème perturbé :")
     print(f"Coefficients de l'objectif : {objective_coeffs_perturbed}")
     print(f"Matrice des contraintes : {constraints_matrix_perturbed}")
     print(f"Côté droit des contraintes perturbées : {constraints_rhs_perturbed}")
+    print(f"Côté droit des contraintes rétabli : {remove_perturbation(constraints_rhs_perturbed, perturbation)}")
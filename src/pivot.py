@@ -1,67 +1,110 @@
-def pivot(dictionary, entering_variable, leaving_variable):
+import numpy as np
+
+from simplex_dictionnary import SimplexDictionary
+
+
+def pivot(dictionary, entering_variable, leaving_variable, history=None):
     """
-    Effectue une opération de pivot sur le dictionnaire du simplexe.
+    Effectue une opération de pivot sur le dictionnaire du simplexe, en place.
+
+    Seules les lignes dont le coefficient de la variable entrante est non nul et
+    les colonnes non nulles de la ligne pivot sont modifiées : aucune copie du
+    dictionnaire n'est faite.
 
     Args:
-        dictionary: Le dictionnaire du simplexe (objet SimplexDictionary)
+        dictionary: Le dictionnaire du simplexe (objet SimplexDictionary), modifié en place
         entering_variable: La variable qui entre dans la base
         leaving_variable: La variable qui sort de la base
+        history: Liste optionnelle dans laquelle le pivot est enregistré pour undo_pivot
 
     Returns:
-        Un nouveau dictionnaire après le pivot
+        Le dictionnaire après le pivot (le même objet)
     """
-    # Créer une copie du dictionnaire
-    new_dict = SimplexDictionary(
-        objective_coeffs=dictionary.objective_coeffs.copy(),
-        constraints_matrix=dictionary.constraints_matrix.copy(),
-        constraints_rhs=dictionary.constraints_rhs.copy(),
-        basic_vars=dictionary.basic_vars.copy(),
-        nonbasic_vars=dictionary.nonbasic_vars.copy(),
-        artificial_vars=dictionary.artificial_vars.copy() if dictionary.artificial_vars else None
-    )
+    row = dictionary.basic_index[leaving_variable]
+    column = dictionary.nonbasic_index[entering_variable]
+    coefficients = dictionary.coefficients
+    constants = dictionary.constants
 
-    # Obtenir l'équation de la variable sortante
-    equation_leaving = dictionary.equations[leaving_variable]
+    pivot_value = coefficients[row, column]
+    if pivot_value == 0:
+        raise ValueError(f"{entering_variable} n'apparaît pas dans l'équation de {leaving_variable}")
 
     # Isoler la variable entrante dans l'équation de la variable sortante
-    # TODO: Implémenter l'isolation de la variable entrante
+    pivot_row = coefficients[row]
+    pivot_row /= -pivot_value
+    pivot_row[column] = 1.0 / pivot_value
+    constants[row] /= -pivot_value
 
-    # Substituer la variable entrante dans toutes les autres équations
-    for var in dictionary.basic_vars:
-        if var != leaving_variable:
-            # TODO: Implémenter la substitution
+    # Substituer la variable entrante dans les autres équations qui la contiennent
+    factors = coefficients[:, column].copy()
+    factors[row] = 0.0
+    rows = np.flatnonzero(factors)
+    columns = np.flatnonzero(pivot_row)
+    coefficients[rows, column] = 0.0
+    coefficients[np.ix_(rows, columns)] += np.outer(factors[rows], pivot_row[columns])
+    constants[rows] += factors[rows] * constants[row]
 
     # Substituer dans la fonction objective
-    # TODO: Implémenter la substitution dans la fonction objective
+    factor = dictionary.objective_row[column]
+    if factor != 0:
+        dictionary.objective_row[column] = 0.0
+        dictionary.objective_row[columns] += factor * pivot_row[columns]
+        dictionary.objective_constant += factor * constants[row]
 
     # Mettre à jour les variables de base et non basiques
-    new_dict.basic_vars[new_dict.basic_vars.index(leaving_variable)] = entering_variable
-    new_dict.nonbasic_vars[new_dict.nonbasic_vars.index(entering_variable)] = leaving_variable
+    dictionary.basic_vars[row] = entering_variable
+    dictionary.nonbasic_vars[column] = leaving_variable
+    del dictionary.basic_index[leaving_variable]
+    del dictionary.nonbasic_index[entering_variable]
+    dictionary.basic_index[entering_variable] = row
+    dictionary.nonbasic_index[leaving_variable] = column
+
+    if history is not None:
+        history.append((entering_variable, leaving_variable))
+
+    return dictionary
+
+
+def undo_pivot(dictionary, history):
+    """
+    Annule le dernier pivot enregistré dans l'historique, en pivotant en sens inverse.
+
+    Args:
+        dictionary: Le dictionnaire du simplexe, modifié en place
+        history: Historique rempli par pivot()
+
+    Returns:
+        Le dictionnaire avant le dernier pivot (le même objet)
+    """
+    entering_variable, leaving_variable = history.pop()
+    return pivot(dictionary, leaving_variable, entering_variable)
 
-    return new_dict
 
 if __name__ == '__main__':
     # Exemple d'utilisation
-    dictionary = {
-        'basic_vars': ['x1', 'x3', 'x5'],
-        'nonbasic_vars': ['x2', 'x4', 'x6'],
-        'equations': {
-            'x1': '2-2*x2-2*x4+x6',
-            'x3': '1+x2+3*x4-2*x6',
-            'x5': '1+5*x2+2*x4'
-        },
-        'objective': '13-3*x2-x4-x6'
-    }
+    dictionary = SimplexDictionary(
+        objective_coeffs=[-3, -1, -1],
+        constraints_matrix=[[2, 2, -1], [-1, -3, 2], [-5, -2, 0]],
+        constraints_rhs=[2, 1, 1],
+        basic_vars=['x1', 'x3', 'x5'],
+        nonbasic_vars=['x2', 'x4', 'x6']
+    )
+    dictionary.create_initial_dictionary()
+    dictionary.objective_constant = 13
 
     print("Dictionnaire initial :")
-    for key, value in dictionary.items():
-        print(f"{key}: {value}")
+    print(dictionary)
 
     entering_variable = 'x2'
     leaving_variable = 'x5'
+    history = []
+
+    pivot(dictionary, entering_variable, leaving_variable, history)
+
+    print("Dictionnaire après le pivot :")
+    print(dictionary)
 
-    new_dictionary = pivot(dictionary, entering_variable, leaving_variable)
+    undo_pivot(dictionary, history)
 
-    print("\nDictionnaire après le pivot :")
-    for key, value in new_dictionary.items():
-        print(f"{key}: {value}")
+    print("Dictionnaire après annulation du pivot :")
+    print(dictionary)
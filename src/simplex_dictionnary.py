@@ -1,4 +1,5 @@
 import numpy as np
+from scipy import sparse
 
 
 
@@ -8,22 +9,27 @@ class SimplexDictionary:
     def __init__(self, objective_coeffs, constraints_matrix, constraints_rhs, basic_vars=None, nonbasic_vars=None, artificial_vars=None):
         """
         Initialize a simplex dictionary
-        
+
+        The dictionary is stored as arrays: row i reads
+        basic_vars[i] = constants[i] + sum_j coefficients[i, j] * nonbasic_vars[j]
+        and the objective to minimize reads
+        z = objective_constant + sum_j objective_row[j] * nonbasic_vars[j].
+
         Args:
             objective_coeffs: coefficients of objective function
-            constraints_matrix: matrix of constraint coefficients
+            constraints_matrix: matrix of constraint coefficients (dense or scipy.sparse)
             constraints_rhs: right-hand side values of constraints
             basic_vars: initial basic variables
             nonbasic_vars: initial non-basic variables
             artificial_vars: initial artificial variables
         """
         self.objective_coeffs = objective_coeffs
-        self.constraints_matrix = constraints_matrix
+        self.constraints_matrix = sparse.csr_matrix(constraints_matrix) if sparse.issparse(constraints_matrix) else constraints_matrix
         self.constraints_rhs = constraints_rhs
         self.num_constraints = len(constraints_rhs)
         self.num_original_vars = len(objective_coeffs)
         self.artificial_vars = artificial_vars if artificial_vars is not None else []
-        
+
         if basic_vars is None:
             self.basic_vars = [f's{i+1}' for i in range(self.num_constraints)]  # Basic variables (slack variables)
         else:
@@ -32,60 +38,81 @@ class SimplexDictionary:
             self.nonbasic_vars = [f'x{i+1}' for i in range(self.num_original_vars)]  # Non-basic variables (original variables)
         else:
             self.nonbasic_vars = nonbasic_vars
-        self.equations = {}        # Dictionary equations
-        self.objective = {}        # Objective function
-        
+        self.coefficients = np.zeros((0, len(self.nonbasic_vars)))  # Dictionary coefficients
+        self.constants = np.zeros(0)                                 # Values of the basic variables
+        self.objective_row = np.zeros(len(self.nonbasic_vars))       # Objective coefficients
+        self.objective_constant = 0.0                                # Objective value
+        self.basic_index = {}                                        # Basic variable -> row
+        self.nonbasic_index = {}                                     # Non-basic variable -> column
+
     def is_feasible(self):
         """Check if dictionary is feasible"""
         # A dictionary is feasible if all basic variables are non-negative
-        return all(value >= 0 for value in self.get_basic_values())
-    
+        return bool(np.all(self.constants >= 0))
+
     def create_initial_dictionary(self):
         """Create initial dictionary with slack variables"""
-        # Initialize equations for basic variables
-        for i, var in enumerate(self.basic_vars):
-            if var in self.artificial_vars:
-                # Handle artificial variables
-                constraint_index = self.artificial_vars.index(var)
-                self.equations[var] = f"{self.constraints_rhs[constraint_index]} "
-                for j, coeff in enumerate(self.constraints_matrix[constraint_index]):
-                    self.equations[var] += f"- {coeff}*{self.nonbasic_vars[j]} "
-                self.equations[var] = self.equations[var].strip()
-            else:
-                # Handle slack variables
-                var_index = self.basic_vars.index(var)
-                self.equations[var] = f"{self.constraints_rhs[var_index]} "
-                for j, coeff in enumerate(self.constraints_matrix[var_index]):
-                    self.equations[var] += f"- {coeff}*{self.nonbasic_vars[j]} "
-                self.equations[var] = self.equations[var].strip()
+        if len(self.basic_vars) != self.num_constraints:
+            raise ValueError("There must be exactly one basic variable per constraint")
+
+        num_nonbasic = len(self.nonbasic_vars)
+        self.coefficients = np.zeros((self.num_constraints, num_nonbasic))
+        self.constants = np.asarray(self.constraints_rhs, dtype=float).copy()
+
+        # Basic variables are expressed as rhs - A x_N
+        if sparse.issparse(self.constraints_matrix):
+            matrix = self.constraints_matrix.tocoo()
+            inside = matrix.col < num_nonbasic
+            self.coefficients[matrix.row[inside], matrix.col[inside]] = -matrix.data[inside]
+        elif self.num_constraints > 0:
+            matrix = np.asarray(self.constraints_matrix, dtype=float)
+            width = min(matrix.shape[1], num_nonbasic)
+            self.coefficients[:, :width] = -matrix[:, :width]
 
         # Initialize objective function
-        self.objective['z'] = "0 "
-        for j, coeff in enumerate(self.objective_coeffs):
-            if j < len(self.nonbasic_vars):  # Vérifier que nous ne dépassons pas la taille de nonbasic_vars
-                self.objective['z'] += f"+ {coeff}*{self.nonbasic_vars[j]} "
-        self.objective['z'] = self.objective['z'].strip()
+        self.objective_row = np.zeros(num_nonbasic)
+        width = min(len(self.objective_coeffs), num_nonbasic)  # Vérifier que nous ne dépassons pas la taille de nonbasic_vars
+        self.objective_row[:width] = np.asarray(self.objective_coeffs, dtype=float)[:width]
+        self.objective_constant = 0.0
+
+        self.basic_index = {var: i for i, var in enumerate(self.basic_vars)}
+        self.nonbasic_index = {var: j for j, var in enumerate(self.nonbasic_vars)}
 
     def get_basic_values(self):
         """
         Calculate and return the current values of the basic variables.
         """
-        basic_values = []
-        for var in self.basic_vars:
-            expr = self.equations[var]
-            # Evaluate the expression by setting non-basic variables to 0
-            value = float(expr.split()[0])  # The constant term is the value
-            basic_values.append(value)
-        return basic_values
+        # Non-basic variables are zero, so the constant term is the value
+        return self.constants.tolist()
+
+    def entering_variable(self):
+        """
+        Return the non-basic variable with the most negative objective coefficient,
+        or None when the dictionary is optimal.
+        """
+        if self.objective_row.size == 0:
+            return None
+        column = int(np.argmin(self.objective_row))
+        if self.objective_row[column] >= 0:
+            return None
+        return self.nonbasic_vars[column]
+
+    def format_expression(self, constant, coefficients):
+        """Format one dictionary row as a string such as "4 - 1*x1 - 1*x2" """
+        expression = f"{constant:g}"
+        for var, coeff in zip(self.nonbasic_vars, coefficients):
+            if coeff != 0:
+                expression += f" {'-' if coeff < 0 else '+'} {abs(coeff):g}*{var}"
+        return expression
 
     def __str__(self):
         """String representation of the dictionary"""
         result = "Current dictionary:\n"
         # Show equations for basic variables
-        for var, expr in self.equations.items():
-            result += f"{var} = {expr}\n"
+        for row, var in enumerate(self.basic_vars):
+            result += f"{var} = {self.format_expression(self.constants[row], self.coefficients[row])}\n"
         # Show objective function
-        result += f"z = {self.objective['z']}\n"
+        result += f"z = {self.format_expression(self.objective_constant, self.objective_row)}\n"
         return result
 
 # Example usage:
@@ -102,14 +129,14 @@ def example_feasible_dictionary():
         constraints_matrix=constraints_matrix,
         constraints_rhs=constraints_rhs
     )
-    
+
     # Create initial dictionary (which is feasible)
     dictionary.create_initial_dictionary()
-    
+
     print("Initial feasible dictionary:")
     print(dictionary)
     print(f"Is feasible: {dictionary.is_feasible()}")
-    
+
     return dictionary
 
 # Run example
@@ -1,3 +1,14 @@
+import re
+from array import array
+
+import numpy as np
+from scipy import sparse
+
+_TOKEN = re.compile(r"((?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)|([A-Za-z_]\w*)|([-+*])")
+_INVALID = re.compile(r"[^\w\s.+\-*]")
+_SENSE = re.compile(r"<=|>=|=<|=>|=")
+_SENSES = {"<=": "<=", "=<": "<=", ">=": ">=", "=>": ">=", "=": "="}
+
 def introduce_slack_variables(constraints):
     """
     Introduit des slack variables pour convertir les inégalités en égalités.
@@ -29,15 +40,149 @@ def introduce_slack_variables(constraints):
             
     return equalities
 
-# Exemple d'utilisation
-constraints = [
-    "x1 + x2 <= 4",
-    "2*x1 + x2 <= 6",
-    "x1 >= 0",
-    "x2 >= 0"
-]
+def parse_expression(expression, variables, row, columns, values, sign=1.0):
+    """
+    Analyse une expression linéaire ("2*x1 - x2 + 3") et ajoute ses termes à la ligne row.
+
+    Args:
+        expression (str): Expression à analyser.
+        variables (dict): Indice de chaque variable déjà rencontrée, complété au fil de l'analyse.
+        row (int): Indice de la ligne courante.
+        columns (array): Indices de colonne des termes, complétés en place.
+        values (array): Coefficients des termes, complétés en place.
+        sign (float): Multiplie tous les termes (-1 pour le membre de droite).
+
+    Returns:
+        float: Somme des termes constants de l'expression.
+    """
+    if _INVALID.search(expression):
+        raise ValueError(f"Caractère inattendu dans la contrainte {row + 1} : {expression.strip()!r}")
+
+    def malformed():
+        return ValueError(f"Terme mal formé dans la contrainte {row + 1} : {expression.strip()!r}")
+
+    constant = 0.0
+    # Un terme est un produit de facteurs ("2*x1", "2 x1", "x1*2", "3") : un nombre ne suit une variable
+    # ou un autre nombre qu'après "*", et un terme contient au plus une variable
+    term_sign, coefficient, name, expect_factor = sign, None, None, True
+    # Signe "+" ou "-" lu sans facteur à sa suite : une expression ne peut pas s'arrêter là
+    pending_sign = False
+
+    def close_term():
+        nonlocal constant
+        if name is not None:
+            # Chaque nom de variable n'est stocké qu'une fois : les lignes ne gardent que son indice
+            columns.append(variables.setdefault(name, len(variables)))
+            values.append(term_sign if coefficient is None else term_sign * coefficient)
+        elif coefficient is not None:
+            constant += term_sign * coefficient
+
+    for number, variable, op in _TOKEN.findall(expression):
+        if number or variable:
+            if (number and not expect_factor) or (variable and name is not None):
+                raise malformed()
+            if variable:
+                name = variable
+            else:
+                coefficient = float(number) if coefficient is None else coefficient * float(number)
+            expect_factor, pending_sign = False, False
+        elif op == "*":
+            if expect_factor:
+                raise malformed()
+            expect_factor = True
+        else:
+            if expect_factor and (coefficient is not None or name is not None):
+                raise malformed()
+            close_term()
+            if coefficient is not None or name is not None:
+                term_sign, coefficient, name = sign, None, None
+            if op == "-":
+                term_sign = -term_sign
+            expect_factor, pending_sign = True, True
+
+    if pending_sign or (expect_factor and (coefficient is not None or name is not None)):
+        raise malformed()
+    close_term()
+    return constant
+
+def parse_constraints(constraints, variables=None):
+    """
+    Construit directement la matrice des contraintes à partir de chaînes de caractères, en une passe.
+
+    Les contraintes sont lues une à une (liste, générateur ou fichier ouvert) : seuls les indices
+    et coefficients des termes sont accumulés, dans des tableaux compacts, et les noms de variables
+    sont enregistrés une seule fois. Les deux membres peuvent contenir des variables et des
+    constantes ; les sens acceptés sont "<=", ">=" et "=". Les lignes vides sont ignorées.
+
+    Args:
+        constraints (iterable): Contraintes au format "2*x1 + x2 <= 6".
+        variables (dict): Indices de variables déjà connus (les nouveaux noms y sont ajoutés).
+
+    Returns:
+        tuple: Matrice des contraintes (CSR), second membre, sens de chaque contrainte, noms des
+               variables dans l'ordre des colonnes et matrice des variables d'écart (CSR, +1 pour
+               "<=", -1 pour ">=", aucune colonne pour "="), telles que [A | S] [x ; s] = b.
+    """
+    variables = {} if variables is None else variables
+    rows, columns, values = array("q"), array("q"), array("d")
+    rhs, senses = array("d"), []
+    slack_rows, slack_values = array("q"), array("d")
+
+    row = 0
+    for constraint in constraints:
+        if not constraint.strip():
+            continue
+
+        sense = _SENSE.search(constraint)
+        if sense is None:
+            raise ValueError(f"Contrainte {row + 1} sans sens (<=, >= ou =) : {constraint.strip()!r}")
+
+        start = len(columns)
+        constant = parse_expression(constraint[:sense.start()], variables, row, columns, values)
+        constant += parse_expression(constraint[sense.end():], variables, row, columns, values, sign=-1.0)
+        rows.extend([row] * (len(columns) - start))
+        rhs.append(-constant)
+
+        sense = _SENSES[sense.group()]
+        senses.append(sense)
+        if sense != "=":
+            slack_rows.append(row)
+            slack_values.append(1.0 if sense == "<=" else -1.0)
+        row += 1
+
+    shape = (row, len(variables))
+    matrix = sparse.csr_matrix((np.frombuffer(values), (np.frombuffer(rows, dtype=np.int64), np.frombuffer(columns, dtype=np.int64))),
+                               shape=shape)
+    matrix.sum_duplicates()
+    slack_matrix = sparse.csr_matrix((np.frombuffer(slack_values), (np.frombuffer(slack_rows, dtype=np.int64), np.arange(len(slack_rows)))),
+                                     shape=(row, len(slack_rows)))
+
+    names = sorted(variables, key=variables.get)
+    return matrix, np.frombuffer(rhs).copy(), np.array(senses), names, slack_matrix
+
+if __name__ == '__main__':
+    # Exemple d'utilisation
+    constraints = [
+        "x1 + x2 <= 4",
+        "2*x1 + x2 <= 6",
+        "x1 >= 0",
+        "x2 >= 0"
+    ]
+
+    equalities = introduce_slack_variables(constraints)
+
+    for equality in equalities:
+        print(equality)
 
-equalities = introduce_slack_variables(constraints)
+    # Construction directe de la matrice, avec des variables nommées et une égalité
+    matrix, rhs, senses, names, slack_matrix = parse_constraints([
+        "2 production + 3.5*stock <= 100",
+        "production - stock >= 10",
+        "production + stock + 5 = 2 * stock + 45",
+    ])
 
-for equality in equalities:
-    print(equality)
+    print("\nVariables :", names)
+    print("Matrice des contraintes :\n", matrix.toarray())
+    print("Second membre :", rhs)
+    print("Sens :", senses)
+    print("Variables d'écart :\n", slack_matrix.toarray())
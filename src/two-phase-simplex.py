@@ -1,187 +1,241 @@
-from intermediate_problem import create_auxiliary_problem, create_auxiliary_objective
+import time
+
+import numpy as np
+
+from intermediate_problem import create_auxiliary_problem
 from simplex_dictionnary import SimplexDictionary  # Note le underscore au lieu du trait d'union
 from pivot import pivot
-from initial_dictionnary import create_initial_dictionary  # Assurez-vous que le nom du fichier est correct
 from slack_variables import introduce_slack_variables
 
-def two_phase_simplex(objective_coeffs, constraints, constraints_matrix, constraints_rhs, basic_vars, nonbasic_vars):
+TOLERANCE = 1e-9
+
+
+class PivotProfile:
+    """
+    Fonction de suivi (voir run_simplex) qui cumule, pour chaque phase, le nombre de pivots et
+    la durée passée dans le choix de la variable entrante, le test du ratio et la mise à jour.
+    """
+
+    def __init__(self):
+        self.phases = {}
+
+    def __call__(self, event):
+        totals = self.phases.setdefault(event["phase"], {"pivots": 0, "pricing": 0.0, "ratio_test": 0.0, "update": 0.0})
+        totals["pivots"] += 1
+        for step in ("pricing", "ratio_test", "update"):
+            totals[step] += event[step]
+
+
+def choose_leaving_variable(dictionary, entering_variable, order, artificial_vars=()):
+    """
+    Test du ratio sur le dictionnaire : choisit la variable de base qui s'annule la première
+    lorsque la variable entrante augmente.
+
+    Args:
+        dictionary: Le dictionnaire du simplexe.
+        entering_variable: La variable entrante.
+        order: Rang de chaque variable, utilisé pour départager les égalités (règle de Bland).
+        artificial_vars: Variables artificielles, préférées en cas d'égalité pour les faire sortir de la base.
+
+    Returns:
+        La variable sortante, ou None si la variable entrante peut augmenter indéfiniment.
+    """
+    column = dictionary.coefficients[:, dictionary.nonbasic_index[entering_variable]]
+    rows = np.flatnonzero(column < -TOLERANCE)
+    if rows.size == 0:
+        return None
+
+    ratios = np.maximum(dictionary.constants[rows], 0.0) / -column[rows]
+    ties = rows[ratios <= ratios.min() + TOLERANCE]
+    return min((dictionary.basic_vars[i] for i in ties),
+               key=lambda var: (var not in artificial_vars, order[var]))
+
+def run_simplex(dictionary, order, artificial_vars=(), callback=None, phase="phase 2"):
+    """
+    Itère le simplexe sur le dictionnaire (minimisation) jusqu'à l'optimalité.
+
+    La variable entrante suit la règle de Dantzig ; après une suite de pivots dégénérés plus
+    longue que le nombre de contraintes, la règle de Bland prend le relais pour éviter les cycles.
+
+    Args:
+        dictionary: Le dictionnaire du simplexe, réalisable, modifié en place.
+        order: Rang de chaque variable pour la règle de Bland.
+        artificial_vars: Variables artificielles à préférer lors du test du ratio.
+        callback: Fonction optionnelle appelée après chaque pivot avec un dictionnaire décrivant le pivot
+                  (phase, iteration, entering, leaving, objective, primal_infeasibility, et les durées
+                  pricing, ratio_test et update en secondes). Sans elle, aucune durée n'est mesurée.
+        phase: Nom de la phase, transmis à callback.
+
+    Returns:
+        tuple: (optimal, pivots), optimal valant False si le problème est non borné.
+    """
+    pivots = 0
+    degenerate_pivots = 0
+    while True:
+        if callback is not None:
+            started = time.perf_counter()
+        if degenerate_pivots > dictionary.num_constraints:
+            candidates = [var for var, coeff in zip(dictionary.nonbasic_vars, dictionary.objective_row) if coeff < -TOLERANCE]
+            entering_variable = min(candidates, key=order.get) if candidates else None
+        else:
+            entering_variable = dictionary.entering_variable()
+            if entering_variable is not None and dictionary.objective_row[dictionary.nonbasic_index[entering_variable]] >= -TOLERANCE:
+                entering_variable = None
+
+        if entering_variable is None:
+            return True, pivots
+
+        if callback is not None:
+            priced = time.perf_counter()
+        leaving_variable = choose_leaving_variable(dictionary, entering_variable, order, artificial_vars)
+        if leaving_variable is None:
+            return False, pivots
+
+        if callback is not None:
+            tested = time.perf_counter()
+        degenerate = dictionary.constants[dictionary.basic_index[leaving_variable]] <= TOLERANCE
+        degenerate_pivots = degenerate_pivots + 1 if degenerate else 0
+
+        pivot(dictionary, entering_variable, leaving_variable)
+        pivots += 1
+
+        if callback is not None:
+            updated = time.perf_counter()
+            # Infaisabilité du problème d'origine : somme des variables artificielles encore en base
+            infeasibility = sum(dictionary.constants[dictionary.basic_index[var]]
+                                for var in artificial_vars if var in dictionary.basic_index)
+            callback({"phase": phase, "iteration": pivots, "entering": entering_variable, "leaving": leaving_variable,
+                      "objective": dictionary.objective_constant, "primal_infeasibility": float(infeasibility),
+                      "pricing": priced - started, "ratio_test": tested - priced, "update": updated - tested})
+
+def set_objective(dictionary, objective):
+    """
+    Exprime une fonction objective (à minimiser) en fonction des variables hors base du dictionnaire.
+
+    Args:
+        dictionary: Le dictionnaire du simplexe, modifié en place.
+        objective (dict): Coefficient de chaque variable ; les variables absentes ont un coefficient nul.
+    """
+    dictionary.objective_row = np.zeros(len(dictionary.nonbasic_vars))
+    dictionary.objective_constant = 0.0
+    for var, coeff in objective.items():
+        if var in dictionary.nonbasic_index:
+            dictionary.objective_row[dictionary.nonbasic_index[var]] += coeff
+        elif var in dictionary.basic_index:
+            row = dictionary.basic_index[var]
+            dictionary.objective_row += coeff * dictionary.coefficients[row]
+            dictionary.objective_constant += coeff * dictionary.constants[row]
+
+def remove_artificial_variables(dictionary, artificial_vars):
+    """
+    Retire les variables artificielles du dictionnaire à la fin de la phase 1.
+
+    Une variable artificielle restée dans la base (à zéro) en est d'abord sortie par un pivot
+    dégénéré sur une variable non artificielle de sa ligne ; les colonnes artificielles sont
+    ensuite supprimées sans reconstruire le dictionnaire.
+
+    Returns:
+        int: Le nombre de pivots effectués.
+    """
+    pivots = 0
+    for var in artificial_vars:
+        if var not in dictionary.basic_index:
+            continue
+        row = dictionary.coefficients[dictionary.basic_index[var]]
+        candidates = [entering for entering, coeff in zip(dictionary.nonbasic_vars, row)
+                      if entering not in artificial_vars and abs(coeff) > TOLERANCE]
+        if not candidates:
+            raise ValueError(f"Impossible de retirer la variable artificielle {var} de la base")
+        pivot(dictionary, candidates[0], var)
+        pivots += 1
+
+    keep = [j for j, var in enumerate(dictionary.nonbasic_vars) if var not in artificial_vars]
+    dictionary.coefficients = dictionary.coefficients[:, keep]
+    dictionary.objective_row = dictionary.objective_row[keep]
+    dictionary.nonbasic_vars[:] = [dictionary.nonbasic_vars[j] for j in keep]
+    dictionary.nonbasic_index = {var: j for j, var in enumerate(dictionary.nonbasic_vars)}
+    return pivots
+
+def two_phase_simplex(objective_coeffs, constraints, constraints_matrix, constraints_rhs, basic_vars, nonbasic_vars,
+                      callback=None):
     """
     Résout un problème de programmation linéaire en utilisant la méthode du simplexe en deux phases.
 
+    Le problème est min c x, A x <= b, x >= 0, avec b de signe quelconque. La phase 1 part de la
+    base construite par crash_basis et minimise la somme des variables artificielles, ajoutées
+    uniquement aux contraintes que cette base ne rend pas réalisables ; elle est sautée si aucune
+    n'est nécessaire. La phase 2 repart directement du dictionnaire final de la phase 1, privé de
+    ses colonnes artificielles.
+
     Args:
-        objective_coeffs (list): Coefficients de la fonction objective.
+        objective_coeffs (list): Coefficients de la fonction objective à minimiser.
         constraints (list): Liste des contraintes.
         constraints_matrix (list of lists): Matrice des coefficients des contraintes.
         constraints_rhs (list): Valeurs du côté droit des contraintes.
-        basic_vars (list): Liste des variables de base initiales.
-        nonbasic_vars (list): Liste des variables non basiques initiales.
+        basic_vars (list): Liste des variables de base initiales (variables d'écart).
+        nonbasic_vars (list): Liste des variables non basiques initiales (variables de décision).
+        callback: Fonction de suivi appelée après chaque pivot (voir run_simplex et PivotProfile).
 
     Returns:
-        tuple: Une solution optimale et un dictionnaire final.
+        tuple: Une solution optimale (valeur de chaque variable de décision, None si le problème est
+               irréalisable ou non borné), le dictionnaire final et, pour chaque phase, le nombre
+               de pivots et la durée en secondes (ainsi que le nombre de variables artificielles
+               pour la phase 1).
     """
 
+    report = {}
+
     # Phase 1 : Résoudre le problème auxiliaire pour trouver une solution de base réalisable initiale
-    print("\nPhase 1: Résolution du problème auxiliaire")
-    auxiliary_constraints_matrix, auxiliary_constraints_rhs = create_auxiliary_problem(constraints_matrix, constraints_rhs)
-    num_artificial_vars = len(auxiliary_constraints_matrix)
-    auxiliary_objective_coeffs = create_auxiliary_objective(num_artificial_vars)
-
-    # Ajuster les variables de base et non basiques pour inclure les variables artificielles
-    auxiliary_basic_vars = basic_vars + [f"a{i+1}" for i in range(num_artificial_vars)]
-    auxiliary_nonbasic_vars = nonbasic_vars + [f"a{i+1}" for i in range(num_artificial_vars)]  # Ajouter les variables artificielles aux variables non basiques
-    auxiliary_artificial_vars = [f"a{i+1}" for i in range(num_artificial_vars)]
-
-    # Créer le dictionnaire initial pour le problème auxiliaire
-    #initial_auxiliary_dict = create_initial_dictionary(auxiliary_objective_coeffs, auxiliary_constraints_matrix, auxiliary_constraints_rhs, auxiliary_basic_vars, auxiliary_nonbasic_vars)
-    initial_auxiliary_dict = SimplexDictionary(
-        objective_coeffs=auxiliary_objective_coeffs,
+    start = time.perf_counter()
+    (auxiliary_constraints_matrix, auxiliary_constraints_rhs,
+     auxiliary_basic_vars, auxiliary_nonbasic_vars, artificial_vars) = create_auxiliary_problem(constraints_matrix, constraints_rhs,
+                                                                                              basic_vars, nonbasic_vars)
+    order = {var: rank for rank, var in enumerate(nonbasic_vars + basic_vars + artificial_vars)}
+
+    current_dict = SimplexDictionary(
+        objective_coeffs=objective_coeffs,
         constraints_matrix=auxiliary_constraints_matrix,
         constraints_rhs=auxiliary_constraints_rhs,
         basic_vars=auxiliary_basic_vars,
         nonbasic_vars=auxiliary_nonbasic_vars,
-        artificial_vars=auxiliary_artificial_vars
+        artificial_vars=artificial_vars
     )
-    initial_auxiliary_dict.create_initial_dictionary()
-
-    # Résoudre le problème auxiliaire en utilisant l'algorithme du simplexe
-    # (Implémentation de l'algorithme du simplexe ici - itérer jusqu'à l'optimalité)
-    # Pour simplifier, supposons que nous avons une fonction simplex_algorithm
-    current_dict = initial_auxiliary_dict
-    
-    # Implémentation de base de l'algorithme du simplexe (à remplacer par une implémentation complète)
-    max_iterations = 100  # Limite pour éviter les boucles infinies
-    iteration = 0
-    while iteration < max_iterations:
-        # Trouver la variable entrante (celle avec le coefficient le plus négatif dans l'objectif)
-        entering_variable = None
-        min_coeff = 0
-        objective_terms = current_dict.objective['z'].split()
-        for i in range(1, len(objective_terms), 2):
-            term = objective_terms[i-1]
-            # Gérer le cas où le terme est collé à la variable (par exemple, "-1x1")
-            if '*' in term:
-                coeff = float(term.split('*')[0])
-            else:
-                # Tenter de séparer le coefficient et la variable
-                import re
-                match = re.match(r'([-+]?\d*\.?\d*)(\D+)', term)
-                if match:
-                    coeff = float(match.group(1))
-                else:
-                    coeff = 0.0  # Si on ne trouve pas, on met 0
-
-            variable = objective_terms[i]
-            if coeff < min_coeff:
-                min_coeff = coeff
-                entering_variable = variable
+    current_dict.create_initial_dictionary()
+    set_objective(current_dict, {var: 1.0 for var in artificial_vars})
 
-        if entering_variable is None:
-            print("Solution optimale trouvée pour la phase 1.")
-            break  # Optimalité atteinte
-
-        # Trouver la variable sortante (celle avec le ratio minimum)
-        leaving_variable = None
-        min_ratio = float('inf')
-        for var in current_dict.basic_vars:
-            if var.startswith('a'):
-                leaving_variable = var
-                break
-        
-        if leaving_variable is None:
-            print("Aucune variable artificielle à retirer.")
-            break
-
-        # Effectuer le pivot
-        print(f"Pivot: Entrante = {entering_variable}, Sortante = {leaving_variable}")
-        current_dict = pivot(current_dict, entering_variable, leaving_variable)
-        
-        iteration += 1
-
-    # Vérifier si la solution de base réalisable a été trouvée (toutes les variables artificielles sont nulles)
-    # (Implémentation de la vérification ici)
-    # Pour simplifier, supposons que nous avons une fonction is_feasible_solution
-    is_feasible = True
-    for var in current_dict.basic_vars:
-        if var.startswith('a'):
-            is_feasible = False
-            break
-
-    if not is_feasible:
-        print("Le problème original n'a pas de solution de base réalisable.")
-        return None, current_dict
-
-    # Phase 2 : Résoudre le problème original en utilisant la solution de base réalisable trouvée dans la phase 1
-    print("\nPhase 2: Résolution du problème original")
-
-    # Créer le dictionnaire initial pour le problème original en utilisant la solution de base réalisable de la phase 1
-    # (Implémentation de la création du dictionnaire initial ici)
-    # Pour simplifier, supposons que nous avons une fonction create_initial_dictionary_phase2
-    initial_dict_phase2 = create_initial_dictionary(objective_coeffs, constraints_matrix, constraints_rhs, basic_vars, nonbasic_vars)
-
-    # Résoudre le problème original en utilisant l'algorithme du simplexe
-    # (Implémentation de l'algorithme du simplexe ici - itérer jusqu'à l'optimalité)
-    # Pour simplifier, supposons que nous avons une fonction simplex_algorithm
-    current_dict = initial_dict_phase2
-    
-    # Implémentation de base de l'algorithme du simplexe (à remplacer par une implémentation complète)
-    max_iterations = 100  # Limite pour éviter les boucles infinies
-    iteration = 0
-    while iteration < max_iterations:
-        # Trouver la variable entrante (celle avec le coefficient le plus négatif dans l'objectif)
-        entering_variable = None
-        min_coeff = 0
-        objective_terms = current_dict.objective['z'].split()
-        for i in range(1, len(objective_terms), 2):
-            term = objective_terms[i-1]
-            # Gérer le cas où le terme est collé à la variable (par exemple, "-1x1")
-            if '*' in term:
-                coeff = float(term.split('*')[0])
-            else:
-                # Tenter de séparer le coefficient et la variable
-                import re
-                match = re.match(r'([-+]?\d*\.?\d*)(\D+)', term)
-                if match:
-                    coeff = float(match.group(1))
-                else:
-                    coeff = 0.0  # Si on ne trouve pas, on met 0
-            variable = objective_terms[i]
-            if coeff < min_coeff:
-                min_coeff = coeff
-                entering_variable = variable
+    _, pivots = run_simplex(current_dict, order, artificial_vars, callback, "phase 1")
 
-        if entering_variable is None:
-            print("Solution optimale trouvée pour la phase 2.")
-            break  # Optimalité atteinte
-
-        # Trouver la variable sortante (celle avec le ratio minimum)
-        leaving_variable = None
-        min_ratio = float('inf')
-        
-        # Trouver le ratio minimum
-        leaving_variable = current_dict.basic_vars[0]
-
-        # Effectuer le pivot
-        print(f"Pivot: Entrante = {entering_variable}, Sortante = {leaving_variable}")
-        current_dict = pivot(current_dict, entering_variable, leaving_variable)
-        
-        iteration += 1
+    # Le problème d'origine est réalisable si et seulement si les variables artificielles sont nulles
+    if current_dict.objective_constant > TOLERANCE:
+        report["phase 1"] = {"pivots": pivots, "time": time.perf_counter() - start, "artificial": len(artificial_vars)}
+        return None, current_dict, report
+
+    pivots += remove_artificial_variables(current_dict, artificial_vars)
+    current_dict.artificial_vars = []
+    report["phase 1"] = {"pivots": pivots, "time": time.perf_counter() - start, "artificial": len(artificial_vars)}
+
+    # Phase 2 : Résoudre le problème original à partir de la base réalisable de la phase 1
+    start = time.perf_counter()
+    set_objective(current_dict, dict(zip(nonbasic_vars, objective_coeffs)))
+    optimal, pivots = run_simplex(current_dict, order, callback=callback, phase="phase 2")
+    report["phase 2"] = {"pivots": pivots, "time": time.perf_counter() - start}
+
+    if not optimal:
+        return None, current_dict, report
 
     # Extraire la solution optimale du dictionnaire final
-    # (Implémentation de l'extraction de la solution ici)
-    # Pour simplifier, supposons que nous avons une fonction extract_solution
-    optimal_solution = {}
-    for var in current_dict['basic_vars']:
-        optimal_solution[var] = current_dict['equations'][var]
+    values = dict(zip(current_dict.basic_vars, current_dict.get_basic_values()))
+    optimal_solution = {var: values.get(var, 0.0) for var in nonbasic_vars}
 
-    return optimal_solution, current_dict
+    return optimal_solution, current_dict, report
 
 if __name__ == '__main__':
-    # Exemple d'utilisation
+    # Exemple d'utilisation : la contrainte x1 + x2 >= 1 rend la base des variables d'écart irréalisable
     objective_coeffs = [-3, -2]
-    constraints = ["x1 + x2 <= 4", "2*x1 + x2 <= 6", "x1 >= 0", "x2 >= 0"]
-    constraints_matrix = [[1, 1], [2, 1]]
-    constraints_rhs = [4, 6]
-    basic_vars = ['s1', 's2']
+    constraints = ["x1 + x2 <= 4", "2*x1 + x2 <= 6", "-x1 - x2 <= -1", "x1 >= 0", "x2 >= 0"]
+    constraints_matrix = [[1, 1], [2, 1], [-1, -1]]
+    constraints_rhs = [4, 6, -1]
+    basic_vars = ['s1', 's2', 's3']
     nonbasic_vars = ['x1', 'x2']
 
     # Introduire les variables d'écart
@@ -190,7 +244,20 @@ if __name__ == '__main__':
     for equality in equalities:
         print(equality)
 
-    optimal_solution, final_dict = two_phase_simplex(objective_coeffs, constraints, constraints_matrix, constraints_rhs, basic_vars, nonbasic_vars)
+    def show_pivot(event):
+        print(f"{event['phase']}, pivot {event['iteration']} : {event['entering']} entre, {event['leaving']} sort, "
+              f"objectif = {event['objective']:.6g}, infaisabilité = {event['primal_infeasibility']:.3g}")
+
+    optimal_solution, final_dict, report = two_phase_simplex(objective_coeffs, constraints, constraints_matrix, constraints_rhs, basic_vars, nonbasic_vars,
+                                                             callback=show_pivot)
 
     print("\nSolution optimale :", optimal_solution)
+    print("Valeur optimale de la fonction objective :", final_dict.objective_constant)
     print("\nDictionnaire final :", final_dict)
+    print("Pivots et durée par phase :", report)
+
+    # Profil des étapes du pivot pour chaque phase
+    profile = PivotProfile()
+    two_phase_simplex(objective_coeffs, constraints, constraints_matrix, constraints_rhs, basic_vars, nonbasic_vars,
+                      callback=profile)
+    print("Profil :", profile.phases)